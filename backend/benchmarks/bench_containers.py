@@ -0,0 +1,75 @@
+"""
+Benchmark de GET /api/containers contra um daemon Docker simulado.
+
+Compara o fluxo antigo (SDK docker: um inspect do container e um da imagem
+por container) com o atual (lista + lookup em lote das imagens em cache),
+medindo a latência e o número de chamadas ao daemon por quantidade de
+containers.
+
+    python backend/benchmarks/bench_containers.py --counts 10 100 300 1000 --latency-ms 1
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from api.docker_client import AsyncDockerClient  # noqa: E402
+from api.docker_service import DockerService  # noqa: E402
+from stub_daemon import StubDaemon  # noqa: E402
+
+
+async def legacy_get_containers(client: AsyncDockerClient):
+    """Fluxo do SDK docker: list + inspect do container + imagem, um container por vez."""
+    formatted = []
+    for summary in await client.list_containers(all=True):
+        attrs = await client.inspect_container(summary["Id"])
+        image = (await client._request("GET", f"/images/{attrs['Image']}/json", 5.0)).json()
+        tags = image.get("RepoTags") or []
+        formatted.append({"id": attrs["Id"][:12], "image": tags[0] if tags else image["Id"][:12]})
+    return formatted
+
+
+async def measure(fn, daemon: StubDaemon, repeat: int):
+    daemon.calls = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return (time.perf_counter() - start) / repeat * 1000, daemon.calls / repeat
+
+
+async def run(counts, latency: float, repeat: int):
+    print(f"{'containers':>10} | {'antes (ms)':>11} {'chamadas':>9} | {'depois (ms)':>11} {'chamadas':>9} | {'cache quente (ms)':>17} {'chamadas':>9}")
+    for count in counts:
+        daemon = StubDaemon(count, latency)
+        client = AsyncDockerClient(transport=httpx.MockTransport(daemon.handle))
+
+        legacy = await measure(lambda: legacy_get_containers(client), daemon, 1)
+        # Serviço novo a cada rodada: mede também o carregamento inicial das imagens
+        cold = await measure(lambda: DockerService(client).get_containers(), daemon, repeat)
+        service = DockerService(client)
+        await service.get_containers()
+        warm = await measure(service.get_containers, daemon, repeat)
+
+        print(
+            f"{count:>10} | {legacy[0]:>11.1f} {legacy[1]:>9.0f} | {cold[0]:>11.1f} {cold[1]:>9.0f} "
+            f"| {warm[0]:>17.1f} {warm[1]:>9.0f}"
+        )
+        await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 50, 100, 300, 1000])
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Latência simulada por chamada ao daemon")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.counts, args.latency_ms / 1000, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Daemon Docker simulado sobre httpx.MockTransport, usado pelos benchmarks e
+pelos testes do backend. Responde como o Docker Engine API (containers,
+imagens, eventos, stats e logs) com latência fixa por chamada.
+"""
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+
+
+def stats_sample(total_usage: int, system_usage: int, pre_total: int, pre_system: int,
+                 online_cpus: int = 2, mem_usage: int = 64 * 1024 * 1024, cache: int = 0) -> Dict[str, Any]:
+    """Uma amostra de /containers/{id}/stats; `pre_system=0` imita a primeira do stream."""
+    return {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": total_usage},
+            "system_cpu_usage": system_usage,
+            "online_cpus": online_cpus,
+        },
+        "precpu_stats": {
+            "cpu_usage": {"total_usage": pre_total},
+            "system_cpu_usage": pre_system,
+        } if pre_system else {},
+        "memory_stats": {"usage": mem_usage, "stats": {"cache": cache}},
+    }
+
+
+def container_id(i: int) -> str:
+    """ID de 64 caracteres com o ID curto (12 primeiros) único por container."""
+    return f"{i:012x}{i:052x}"
+
+
+def log_frame(stream: int, text: str) -> bytes:
+    """Frame do stream multiplexado: tipo (1 stdout, 2 stderr), 3 zeros e tamanho big-endian."""
+    payload = text.encode()
+    return bytes([stream, 0, 0, 0]) + len(payload).to_bytes(4, "big") + payload
+
+
+class StubDaemon:
+    """Responde como o Docker Engine API com `count` containers e latência fixa por chamada."""
+
+    def __init__(self, count: int, latency: float = 0.0, images: int = 20):
+        self.latency = latency
+        self.calls = 0
+        self.requests: List[httpx.Request] = []
+        self.images = [
+            {"Id": f"sha256:{i:064x}", "RepoTags": [f"app{i}:latest"]} for i in range(images)
+        ]
+        self.containers = []
+        for i in range(count):
+            self.add_container(i, running=bool(i % 3))
+        # Resposta crua de cada container para /logs (frames já multiplexados);
+        # uma lista de bytes é entregue em pedaços, como chega pela rede
+        self.logs: Dict[str, Any] = {}
+        # Containers criados com TTY: logs sem multiplexação
+        self.tty: Set[str] = set()
+        # Stats por container, um dict por amostra (veja stats_sample)
+        self.stats: Dict[str, List[Dict[str, Any]]] = {}
+        self.stats_interval = 0.0
+        self._events: Optional[asyncio.Queue] = None
+
+    def add_container(self, i: int, running: bool = True) -> Dict[str, Any]:
+        image = self.images[i % len(self.images)]
+        container = {
+            "Id": container_id(i),
+            "Names": [f"/container-{i}"],
+            "Image": image["RepoTags"][0],
+            "ImageID": image["Id"],
+            "State": "running" if running else "exited",
+            "Status": "Up 2 hours" if running else "Exited (0) 1 hour ago",
+            "Ports": [{"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8000 + i, "Type": "tcp"}],
+        }
+        self.containers.append(container)
+        return container
+
+    def find(self, container_id: str) -> Optional[Dict[str, Any]]:
+        return next((c for c in self.containers if c["Id"].startswith(container_id)), None)
+
+    def set_running(self, container_id: str, running: bool):
+        c = self.find(container_id)
+        c["State"] = "running" if running else "exited"
+        c["Status"] = "Up 1 second" if running else "Exited (0) 1 second ago"
+
+    def remove(self, container_id: str):
+        self.containers.remove(self.find(container_id))
+
+    @property
+    def events(self) -> asyncio.Queue:
+        # Criada sob demanda para ficar no loop de quem consome
+        if self._events is None:
+            self._events = asyncio.Queue()
+        return self._events
+
+    def emit(self, action: str, container_id: str, time: int = 0):
+        self.events.put_nowait({"Type": "container", "Action": action, "Actor": {"ID": container_id}, "time": time})
+
+    def disconnect_events(self):
+        """Encerra o stream de /events atual, como um restart do daemon."""
+        self.events.put_nowait(None)
+
+    def _list(self, request: httpx.Request) -> List[Dict[str, Any]]:
+        filters = json.loads(request.url.params.get("filters", "{}"))
+        containers = self.containers
+        if "id" in filters:
+            containers = [c for c in containers if any(c["Id"].startswith(i) for i in filters["id"])]
+        if request.url.params.get("all") in (None, "0"):
+            containers = [c for c in containers if c["State"] == "running"]
+        return [dict(c) for c in containers]
+
+    async def _event_stream(self):
+        while True:
+            event = await self.events.get()
+            if event is None:
+                return
+            yield (json.dumps(event) + "\n").encode()
+
+    async def _chunks(self, chunks):
+        for chunk in chunks:
+            yield chunk
+
+    async def _stats_stream(self, samples):
+        for sample in samples:
+            yield (json.dumps(sample) + "\n").encode()
+            await asyncio.sleep(self.stats_interval)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.requests.append(request)
+        await asyncio.sleep(self.latency)
+        method = request.method
+        parts = request.url.path.strip("/").split("/")
+        if parts == ["_ping"]:
+            return httpx.Response(200, text="OK")
+        if parts == ["containers", "json"]:
+            return httpx.Response(200, json=self._list(request))
+        if parts == ["images", "json"]:
+            return httpx.Response(200, json=self.images)
+        if parts == ["events"]:
+            return httpx.Response(200, content=self._event_stream())
+        if parts[0] == "images" and parts[-1] == "json":
+            image = next((i for i in self.images if i["Id"] == parts[1]), None)
+            if image is not None:
+                return httpx.Response(200, json=image)
+        if parts[0] == "containers" and len(parts) == 3:
+            c = self.find(parts[1])
+            if c is None:
+                return httpx.Response(404, json={"message": f"No such container: {parts[1]}"})
+            action = parts[2]
+            if action == "json":
+                return httpx.Response(200, json={
+                    "Id": c["Id"],
+                    "Name": c["Names"][0],
+                    "Image": c["ImageID"],
+                    "Config": {"Tty": c["Id"] in self.tty},
+                    "State": {"Status": c["State"], "StartedAt": "2024-01-01T00:00:00.000000000Z"},
+                    "NetworkSettings": {"Ports": {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": str(c["Ports"][0]["PublicPort"])}]}},
+                })
+            if method == "POST" and action in ("start", "stop", "restart"):
+                running = c["State"] == "running"
+                if (action == "start" and running) or (action == "stop" and not running):
+                    return httpx.Response(304)
+                self.set_running(c["Id"], action != "stop")
+                return httpx.Response(204)
+            if action == "stats":
+                samples = self.stats.get(c["Id"], [])
+                if request.url.params.get("stream") == "0":
+                    return httpx.Response(200, json=samples[-1])
+                return httpx.Response(200, content=self._stats_stream(samples))
+            if action == "logs":
+                logs = self.logs.get(c["Id"], b"")
+                return httpx.Response(200, content=self._chunks(logs) if isinstance(logs, list) else logs)
+        return httpx.Response(404, json={"message": "not found"})
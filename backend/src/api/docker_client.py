@@ -0,0 +1,197 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOCKER_HOST = "unix:///var/run/docker.sock"
+
+# Upper bound (seconds) for each daemon operation, including queueing for a slot
+TIMEOUTS = {
+    "ping": 2.0,
+    "list": 10.0,
+    "inspect": 5.0,
+    "images": 10.0,
+    "start": 15.0,
+    "stop": 15.0,  # On top of the stop grace period
+    "stats": 10.0,
+}
+# Seconds the daemon waits for a graceful stop before SIGKILL (same as `docker stop`)
+STOP_GRACE_PERIOD = 10
+CONNECT_TIMEOUT = 2.0
+
+# Maximum number of in-flight daemon requests; long-lived streams (logs, events,
+# stats) don't count
+MAX_CONCURRENCY = 16
+
+
+class DockerAPIError(Exception):
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"Docker API error {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+def _raise_for_status(response: httpx.Response):
+    # 304 = container already started/stopped, which is not a failure
+    if response.status_code < 400:
+        return
+    try:
+        message = response.json().get("message", response.text)
+    except ValueError:
+        message = response.text
+    raise DockerAPIError(response.status_code, message)
+
+
+class AsyncDockerClient:
+    """
+    Minimal asyncio client for the Docker Engine API, talking HTTP over the
+    daemon's Unix socket (or tcp:// from DOCKER_HOST).
+    """
+
+    def __init__(
+        self,
+        docker_host: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        docker_host = docker_host or os.environ.get("DOCKER_HOST", DEFAULT_DOCKER_HOST)
+        base_url = "http://docker"
+        if transport is None:
+            if docker_host.startswith("unix://"):
+                transport = httpx.AsyncHTTPTransport(uds=docker_host[len("unix://"):])
+            else:
+                base_url = docker_host.replace("tcp://", "http://", 1)
+        # Streams hold a connection each for their whole life, so the pool is
+        # unbounded; the semaphore caps the regular requests
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=max_concurrency)
+        self._http = httpx.AsyncClient(base_url=base_url, transport=transport, timeout=None, limits=limits)
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop (Python 3.9)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    async def _request(self, method: str, path: str, timeout: float, **kwargs) -> httpx.Response:
+        async def send():
+            async with self.semaphore:
+                response = await self._http.request(method, path, **kwargs)
+            _raise_for_status(response)
+            return response
+
+        return await asyncio.wait_for(send(), timeout)
+
+    async def ping(self) -> bool:
+        try:
+            await self._request("GET", "/_ping", TIMEOUTS["ping"])
+            return True
+        except Exception:
+            return False
+
+    async def list_containers(self, all: bool = True, filters: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
+        params = {"all": int(all)}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        response = await self._request("GET", "/containers/json", TIMEOUTS["list"], params=params)
+        return response.json()
+
+    async def inspect_container(self, container_id: str) -> Dict[str, Any]:
+        response = await self._request("GET", f"/containers/{container_id}/json", TIMEOUTS["inspect"])
+        return response.json()
+
+    async def list_images(self) -> List[Dict[str, Any]]:
+        response = await self._request("GET", "/images/json", TIMEOUTS["images"])
+        return response.json()
+
+    async def start_container(self, container_id: str):
+        await self._request("POST", f"/containers/{container_id}/start", TIMEOUTS["start"])
+
+    async def stop_container(self, container_id: str, grace_period: int = STOP_GRACE_PERIOD):
+        await self._request(
+            "POST", f"/containers/{container_id}/stop", grace_period + TIMEOUTS["stop"], params={"t": grace_period}
+        )
+
+    async def restart_container(self, container_id: str, grace_period: int = STOP_GRACE_PERIOD):
+        await self._request(
+            "POST", f"/containers/{container_id}/restart", grace_period + TIMEOUTS["stop"], params={"t": grace_period}
+        )
+
+    async def container_stats(self, container_id: str) -> Dict[str, Any]:
+        response = await self._request(
+            "GET", f"/containers/{container_id}/stats", TIMEOUTS["stats"], params={"stream": 0}
+        )
+        return response.json()
+
+    async def stream_container_stats(self, container_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Follows the daemon's stats stream (one sample per second, with precpu_stats filled in)."""
+        timeout = httpx.Timeout(None, connect=CONNECT_TIMEOUT)
+        async with self._http.stream(
+            "GET", f"/containers/{container_id}/stats", params={"stream": 1}, timeout=timeout
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                _raise_for_status(response)
+            async for line in response.aiter_lines():
+                if line.strip():
+                    yield json.loads(line)
+
+    async def container_logs(self, container_id: str, tail: int = 100, follow: bool = True) -> AsyncIterator[str]:
+        """Yields decoded log lines; holds no concurrency slot while following."""
+        info = await self.inspect_container(container_id)
+        tty = info.get("Config", {}).get("Tty", False)
+        params = {"stdout": 1, "stderr": 1, "follow": int(follow), "tail": tail}
+        timeout = httpx.Timeout(None, connect=CONNECT_TIMEOUT)
+
+        async with self._http.stream("GET", f"/containers/{container_id}/logs", params=params, timeout=timeout) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                _raise_for_status(response)
+
+            raw, text = b"", b""
+            async for chunk in response.aiter_bytes():
+                if tty:
+                    text += chunk
+                else:
+                    # Multiplexed stream: 8-byte header (stream type, 3 zero bytes, big-endian size)
+                    raw += chunk
+                    while len(raw) >= 8:
+                        size = int.from_bytes(raw[4:8], "big")
+                        if len(raw) < 8 + size:
+                            break
+                        text += raw[8:8 + size]
+                        raw = raw[8 + size:]
+                *lines, text = text.split(b"\n")
+                for line in lines:
+                    yield line.decode("utf-8", errors="replace").rstrip("\r")
+            if text:
+                yield text.decode("utf-8", errors="replace")
+
+    async def events(
+        self, since: Optional[int] = None, filters: Optional[Dict[str, List[str]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Follows /events; `since` replays what happened while disconnected."""
+        params = {}
+        if since is not None:
+            params["since"] = since
+        if filters:
+            params["filters"] = json.dumps(filters)
+        timeout = httpx.Timeout(None, connect=CONNECT_TIMEOUT)
+
+        async with self._http.stream("GET", "/events", params=params, timeout=timeout) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                _raise_for_status(response)
+            async for line in response.aiter_lines():
+                if line.strip():
+                    yield json.loads(line)
+
+    async def aclose(self):
+        await self._http.aclose()
@@ -1,124 +1,159 @@
-import docker
+import asyncio
 import logging
-from typing import List, Dict, Any
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from .docker_client import AsyncDockerClient
 
 logger = logging.getLogger(__name__)
 
+# Image names are refreshed in bulk (one /images/json call) when a container
+# references an unknown image ID or the cache is older than this (retags)
+IMAGE_CACHE_TTL = 60.0
+
 class DockerService:
-    def __init__(self):
-        try:
-            self.client = docker.from_env()
-        except Exception as e:
-            logger.error(f"Failed to connect to Docker Daemon: {e}")
-            self.client = None
-
-    def _format_uptime(self, attrs: dict) -> str:
-        status = attrs.get('State', {}).get('Status', '')
-        return "Running" if status == "running" else "Stopped"
-
-    def _extract_ports(self, attrs: dict) -> str:
-        ports = attrs.get('NetworkSettings', {}).get('Ports', {})
-        if not ports:
-            return "-"
-        
-        for k, v in ports.items():
-            if v is not None and len(v) > 0:
-                h = v[0].get('HostPort')
-                if h:
-                    return h
-        
+    def __init__(self, client: Optional[AsyncDockerClient] = None):
+        self.client = client or AsyncDockerClient()
+        self._image_names: Dict[str, str] = {}
+        self._images_loaded_at = 0.0
+        self._images_lock: Optional[asyncio.Lock] = None
+
+    async def is_connected(self) -> bool:
+        return await self.client.ping()
+
+    def _format_status(self, summary: dict) -> str:
+        return "Running" if summary.get('State') == "running" else "Stopped"
+
+    def _extract_ports(self, summary: dict) -> str:
+        for port in summary.get('Ports') or []:
+            if port.get('PublicPort'):
+                return str(port['PublicPort'])
         return "-"
 
-    def get_containers(self) -> List[Dict[str, Any]]:
-        """Fetch and format containers for the dashboard logic"""
-        if not self.client:
-             return []
-             
-        containers = self.client.containers.list(all=True)
-        formatted_containers = []
-        
+    def _image_name(self, image: dict) -> str:
+        tags = [tag for tag in image.get('RepoTags') or [] if tag != '<none>:<none>']
+        return tags[0] if tags else image['Id'].split(':')[-1][:12]
+
+    async def _resolve_images(self, image_ids: Iterable[str]) -> Dict[str, str]:
+        if self._images_lock is None:
+            self._images_lock = asyncio.Lock()
+        async with self._images_lock:
+            expired = time.monotonic() - self._images_loaded_at > IMAGE_CACHE_TTL
+            if expired or any(image_id not in self._image_names for image_id in image_ids):
+                images = await self.client.list_images()
+                self._image_names = {image['Id']: self._image_name(image) for image in images}
+                # Images removed from under a container stay unresolved until the TTL
+                self._image_names.update({image_id: "" for image_id in image_ids if image_id not in self._image_names})
+                self._images_loaded_at = time.monotonic()
+        return self._image_names
+
+    def _format_container(self, summary: dict, image_names: Dict[str, str]) -> Dict[str, Any]:
+        image_id = summary.get('ImageID', '')
+        names = summary.get('Names') or ['']
+        return {
+            "id": summary['Id'][:12],
+            "image": image_names.get(image_id) or summary.get('Image') or image_id.split(':')[-1][:12],
+            "status": self._format_status(summary),
+            "uptime": summary.get('Status', ''),
+            "port": self._extract_ports(summary),
+            "name": names[0].lstrip('/'),
+        }
+
+    async def list_containers(self, container_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Formatted containers keyed by full ID (optionally only `container_ids`)"""
+        # The list endpoint already carries image, state and ports: two daemon
+        # calls in total (containers + cached images) regardless of container count
+        filters = None
+        if container_ids is not None:
+            # An empty id filter would match every container
+            filters = {"id": list(container_ids)}
+            if not filters["id"]:
+                return {}
+        containers = await self.client.list_containers(all=True, filters=filters)
+        image_names = await self._resolve_images({c.get('ImageID', '') for c in containers})
+
+        formatted_containers = {}
         for c in containers:
             try:
-                short_id = c.short_id
-                
-                image_tags = c.image.tags
-                image_name = image_tags[0] if image_tags else c.image.id[:12]
-                
-                status_formatted = self._format_uptime(c.attrs)
-                port_formatted = self._extract_ports(c.attrs)
-                uptime_string = c.attrs.get('State', {}).get('StartedAt', c.status)
-                
-                formatted_containers.append({
-                    "id": short_id,
-                    "image": image_name,
-                    "status": status_formatted,
-                    "uptime": uptime_string,
-                    "port": port_formatted,
-                    "name": c.name
-                })
+                formatted_containers[c['Id']] = self._format_container(c, image_names)
             except Exception as e:
-                logger.error(f"Error parsing container {c.id}: {e}")
-                
+                logger.error(f"Error parsing container {c.get('Id')}: {e}")
         return formatted_containers
 
-    def start_container(self, container_id: str) -> bool:
+    async def get_containers(self) -> List[Dict[str, Any]]:
+        """Fetch and format containers for the dashboard logic"""
+        try:
+            return list((await self.list_containers()).values())
+        except Exception as e:
+            logger.error(f"Failed to list containers from the Docker Daemon: {e}")
+            return []
+
+    async def start_container(self, container_id: str) -> bool:
         try:
-            container = self.client.containers.get(container_id)
-            container.start()
+            await self.client.start_container(container_id)
             return True
         except Exception as e:
             logger.error(f"Error starting container {container_id}: {e}")
             return False
 
-    def stop_container(self, container_id: str) -> bool:
+    async def stop_container(self, container_id: str) -> bool:
         try:
-            container = self.client.containers.get(container_id)
-            container.stop()
+            await self.client.stop_container(container_id)
             return True
         except Exception as e:
             logger.error(f"Error stopping container {container_id}: {e}")
             return False
 
-    def restart_container(self, container_id: str) -> bool:
+    async def restart_container(self, container_id: str) -> bool:
         try:
-            container = self.client.containers.get(container_id)
-            container.restart()
+            await self.client.restart_container(container_id)
             return True
         except Exception as e:
             logger.error(f"Error restarting container {container_id}: {e}")
             return False
 
-    def get_container_stats(self, container_id: str) -> dict:
+    def stream_logs(self, container_id: str, tail: int = 100) -> AsyncIterator[str]:
+        return self.client.container_logs(container_id, tail=tail, follow=True)
+
+    def compute_stats(self, stats: dict) -> Dict[str, float]:
+        """Numeric CPU (%) and memory (MB) from one raw stats sample"""
+        cpu_stats = stats.get('cpu_stats', {})
+        precpu_stats = stats.get('precpu_stats', {})
+
+        # CPU Calc (precpu is empty on the first sample of a stream)
+        cpu_delta = cpu_stats['cpu_usage']['total_usage'] - precpu_stats.get('cpu_usage', {}).get('total_usage', 0)
+        system_cpu_delta = cpu_stats.get('system_cpu_usage', 0) - precpu_stats.get('system_cpu_usage', 0)
+
+        # Number of CPUs
+        number_cpus = cpu_stats.get('online_cpus', 1)
+
+        cpu_percent = 0.0
+        if precpu_stats.get('system_cpu_usage') and system_cpu_delta > 0.0 and cpu_delta > 0.0:
+            cpu_percent = (cpu_delta / system_cpu_delta) * number_cpus * 100.0
+
+        # Mem Calc
+        memory_stats = stats.get('memory_stats', {})
+        mem_usage = memory_stats.get('usage', 0)
+        # Remove cache from memory usage if available
+        if 'stats' in memory_stats and 'cache' in memory_stats['stats']:
+            mem_usage -= memory_stats['stats']['cache']
+
+        return {"cpu_percent": cpu_percent, "mem_mb": mem_usage / (1024 * 1024)}
+
+    def format_stats(self, values: Dict[str, float]) -> Dict[str, str]:
+        return {
+            "cpu": f"{values['cpu_percent']:.2f}%",
+            "mem": f"{values['mem_mb']:.1f}MB"
+        }
+
+    async def get_container_stats(self, container_id: str) -> dict:
         try:
-            container = self.client.containers.get(container_id)
-            if container.status != 'running':
+            container = await self.client.inspect_container(container_id)
+            if container.get('State', {}).get('Status') != 'running':
                 return {"cpu": "-", "mem": "-"}
             
-            stats = container.stats(stream=False)
-            
-            # CPU Calc
-            cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - stats['precpu_stats']['cpu_usage']['total_usage']
-            system_cpu_delta = stats['cpu_stats']['system_cpu_usage'] - stats.get('precpu_stats', {}).get('system_cpu_usage', 0)
-            
-            # Number of CPUs
-            number_cpus = stats['cpu_stats'].get('online_cpus', 1)
-            
-            cpu_percent = 0.0
-            if system_cpu_delta > 0.0 and cpu_delta > 0.0:
-                cpu_percent = (cpu_delta / system_cpu_delta) * number_cpus * 100.0
-
-            # Mem Calc
-            mem_usage = stats['memory_stats'].get('usage', 0)
-            # Remove cache from memory usage if available
-            if 'stats' in stats['memory_stats'] and 'cache' in stats['memory_stats']['stats']:
-                mem_usage -= stats['memory_stats']['stats']['cache']
-                
-            mem_mb = mem_usage / (1024 * 1024)
-            
-            return {
-                "cpu": f"{cpu_percent:.2f}%",
-                "mem": f"{mem_mb:.1f}MB"
-            }
+            stats = await self.client.container_stats(container_id)
+            return self.format_stats(self.compute_stats(stats))
         except Exception as e:
             logger.error(f"Error getting stats for container {container_id}: {e}")
             return {"cpu": "-", "mem": "-"}
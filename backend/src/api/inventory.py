@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from .docker_service import DockerService
+
+logger = logging.getLogger(__name__)
+
+# Full re-list that repairs anything the event stream missed (and refreshes
+# the relative "Up 2 hours" status text)
+RESYNC_INTERVAL = 60.0
+# Events arriving within this window are applied with a single list call
+EVENT_DEBOUNCE = 0.05
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+# Events that change what the dashboard shows for a container
+CONTAINER_EVENTS = ["create", "start", "stop", "die", "kill", "destroy", "rename", "pause", "unpause", "update"]
+
+
+class ContainerInventory:
+    """
+    In-memory view of the daemon's containers, kept current by the Docker
+    events stream plus a periodic full resync. Reads never touch the daemon.
+    """
+
+    def __init__(self, service: DockerService, resync_interval: float = RESYNC_INTERVAL):
+        self.service = service
+        self.resync_interval = resync_interval
+        self.ready = False
+        self._containers: Dict[str, Dict[str, Any]] = {}
+        self._snapshot: Optional[List[Dict[str, Any]]] = None
+        self._since: Optional[int] = None
+        self._dirty: Set[str] = set()
+        self._changed: Optional[asyncio.Event] = None
+        self._synced: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        # IDs refreshed from events while a full listing is in flight
+        self._refreshed_during_resync: Optional[Set[str]] = None
+
+    def get_containers(self) -> List[Dict[str, Any]]:
+        # Rebuilt only after a change; between changes every reader shares it
+        if self._snapshot is None:
+            self._snapshot = list(self._containers.values())
+        return self._snapshot
+
+    def running_container_ids(self) -> List[str]:
+        return [container_id for container_id, c in self._containers.items() if c["status"] == "Running"]
+
+    async def start(self):
+        self._changed = asyncio.Event()
+        self._synced = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._watch_events()),
+            asyncio.create_task(self._apply_changes()),
+            asyncio.create_task(self._resync_loop()),
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def resync(self):
+        # Events from here on are replayed on top of the listing
+        since = int(time.time())
+        self._refreshed_during_resync = set()
+        try:
+            containers = await self.service.list_containers()
+        finally:
+            refreshed, self._refreshed_during_resync = self._refreshed_during_resync, None
+        self._containers = containers
+        self._snapshot = None
+        if refreshed:
+            # Those updates went into the dict just replaced and may be newer
+            # than the listing; fetch them again on top of it
+            await self.refresh(refreshed)
+        if self._since is None:
+            self._since = since
+        self.ready = True
+        if self._synced is not None:
+            self._synced.set()
+
+    async def refresh(self, container_ids: Set[str]):
+        found = await self.service.list_containers(container_ids)
+        if self._refreshed_during_resync is not None:
+            self._refreshed_during_resync.update(container_ids)
+        for container_id in container_ids:
+            if container_id in found:
+                self._containers[container_id] = found[container_id]
+            else:
+                self._containers.pop(container_id, None)
+        self._snapshot = None
+
+    async def _resync_loop(self):
+        while True:
+            try:
+                await self.resync()
+            except Exception as e:
+                logger.error(f"Container inventory resync failed: {e}")
+            await asyncio.sleep(self.resync_interval)
+
+    async def _watch_events(self):
+        delay = RECONNECT_DELAY
+        filters = {"type": ["container"], "event": CONTAINER_EVENTS}
+        # Wait for the first resync so no event predates the listing
+        await self._synced.wait()
+        while True:
+            try:
+                async for event in self.service.client.events(since=self._since, filters=filters):
+                    self._since = event.get("time", self._since)
+                    container_id = event.get("Actor", {}).get("ID") or event.get("id")
+                    if container_id:
+                        self._dirty.add(container_id)
+                        self._changed.set()
+                    delay = RECONNECT_DELAY
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Docker events stream interrupted, reconnecting in {delay:.0f}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _apply_changes(self):
+        while True:
+            await self._changed.wait()
+            await asyncio.sleep(EVENT_DEBOUNCE)
+            self._changed.clear()
+            container_ids, self._dirty = self._dirty, set()
+            try:
+                await self.refresh(container_ids)
+            except Exception as e:
+                # The next resync picks these containers up
+                logger.error(f"Failed to refresh containers from events: {e}")
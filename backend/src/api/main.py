@@ -1,9 +1,41 @@
-from fastapi import FastAPI
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from .docker_service import DockerService
 from .aws_service import AWSService
+from .inventory import ContainerInventory
+from .stats import StatsCollector
+from .timeseries import METRICS, MetricsStore
+
+# Intervalo padrão (segundos) do feed SSE de métricas dos containers
+STATS_PUSH_INTERVAL = 2.0
+# Janela padrão (segundos) do histórico de métricas
+METRICS_DEFAULT_RANGE = 600
 
-app = FastAPI(title="EzOps Backend API")
+docker_client = DockerService()
+aws_client = AWSService()
+container_inventory = ContainerInventory(docker_client)
+metrics_store = MetricsStore()
+stats_collector = StatsCollector(docker_client, container_inventory, metrics_store)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Inventário em memória alimentado pelos eventos do Docker
+    await container_inventory.start()
+    # Um stream de stats por container em execução, calculado em segundo plano
+    await stats_collector.start()
+    yield
+    await stats_collector.stop()
+    await container_inventory.stop()
+    await docker_client.client.aclose()
+
+app = FastAPI(title="EzOps Backend API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -13,18 +45,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-docker_client = DockerService()
-aws_client = AWSService()
-
 @app.get("/api/health")
-def health_check():
-    return {"status": "ok", "docker_connected": docker_client.client is not None}
+async def health_check():
+    return {"status": "ok", "docker_connected": await docker_client.is_connected()}
 
 @app.get("/api/containers")
-def list_containers():
+async def list_containers():
     """Retorna os containeres no formato da Dashboard e combina instâncias da AWS"""
-    local_containers = docker_client.get_containers()
-    cloud_instances = aws_client.get_ec2_instances()
+    # Containers locais vêm do inventário em memória (ou do daemon até o
+    # primeiro sync); o boto3 (bloqueante) roda no threadpool
+    if container_inventory.ready:
+        local_containers = container_inventory.get_containers()
+        cloud_instances = await run_in_threadpool(aws_client.get_ec2_instances)
+    else:
+        local_containers, cloud_instances = await asyncio.gather(
+            docker_client.get_containers(),
+            run_in_threadpool(aws_client.get_ec2_instances),
+        )
     
     all_instances = local_containers + cloud_instances
     
@@ -40,57 +77,95 @@ def list_containers():
     }
 
 @app.get("/api/secrets/{secret_name}")
-def fetch_secret(secret_name: str):
+async def fetch_secret(secret_name: str):
     """Resgata um secret diretamente da AWS em tempo real (Runtime Injector)"""
-    secret_value = aws_client.get_secret(secret_name)
+    secret_value = await run_in_threadpool(aws_client.get_secret, secret_name)
     if secret_value is None:
         return {"error": "Secret não encontrado ou AWS não configurada."}
     return {"secret_name": secret_name, "value": secret_value}
 
 @app.post("/api/containers/{container_id}/start")
-def start_container(container_id: str):
-    success = docker_client.start_container(container_id)
+async def start_container(container_id: str):
+    success = await docker_client.start_container(container_id)
     if success:
         return {"status": "success", "message": f"Container {container_id} started"}
     return {"status": "error", "message": "Failed to start container"}
 
 @app.post("/api/containers/{container_id}/stop")
-def stop_container(container_id: str):
-    success = docker_client.stop_container(container_id)
+async def stop_container(container_id: str):
+    success = await docker_client.stop_container(container_id)
     if success:
         return {"status": "success", "message": f"Container {container_id} stopped"}
     return {"status": "error", "message": "Failed to stop container"}
 
 @app.post("/api/containers/{container_id}/restart")
-def restart_container(container_id: str):
-    success = docker_client.restart_container(container_id)
+async def restart_container(container_id: str):
+    success = await docker_client.restart_container(container_id)
     if success:
         return {"status": "success", "message": f"Container {container_id} restarted"}
     return {"status": "error", "message": "Failed to restart container"}
 
 @app.get("/api/containers/{container_id}/stats")
-def get_container_stats(container_id: str):
-    stats = docker_client.get_container_stats(container_id)
-    return stats
+async def get_container_stats(container_id: str):
+    # Última amostra do coletor; consulta o daemon só se ainda não houver
+    stats = stats_collector.get(container_id)
+    if stats is not None:
+        return stats
+    return await docker_client.get_container_stats(container_id)
 
 from fastapi.responses import StreamingResponse
 
 @app.get("/api/containers/{container_id}/logs")
-def stream_container_logs(container_id: str):
+async def stream_container_logs(container_id: str):
     """Retorna os logs ao vivo do container usando Server-Sent Events (SSE)"""
-    def log_generator():
+    async def log_generator():
         try:
-            container = docker_client.client.containers.get(container_id)
             # Fetch last 100 lines and stream new ones
-            for line in container.logs(stream=True, tail=100, follow=True):
+            async for line in docker_client.stream_logs(container_id, tail=100):
                 # SSE Format required: data: <message>\n\n
-                decoded_line = line.decode('utf-8', errors='replace').strip()
-                yield f"data: {decoded_line}\n\n"
+                yield f"data: {line.strip()}\n\n"
         except Exception as e:
             yield f"data: [EzOps Logger] Erro ao conectar nos logs do container {container_id}: {e}\n\n"
 
     return StreamingResponse(log_generator(), media_type="text/event-stream")
 
+@app.get("/api/containers/stats")
+async def list_container_stats():
+    """Métricas de todos os containers em execução numa única chamada (id curto -> stats)"""
+    return {"stats": stats_collector.get_stats()}
+
+@app.get("/api/containers/stats/stream")
+async def stream_container_stats(interval: float = Query(STATS_PUSH_INTERVAL, ge=0.5, le=60)):
+    """Envia as métricas de todos os containers a cada `interval` segundos via SSE"""
+    async def stats_generator():
+        while True:
+            yield f"data: {json.dumps(stats_collector.get_stats())}\n\n"
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(stats_generator(), media_type="text/event-stream")
+
+@app.get("/api/containers/{container_id}/metrics")
+async def get_container_metrics(
+    container_id: str,
+    metric: str = "cpu_percent",
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    step: Optional[int] = None,
+):
+    """Série histórica numérica de uma métrica (timestamps Unix); `step` 1, 60 ou 3600 s, ou automático pelo intervalo"""
+    if metric not in METRICS:
+        raise HTTPException(status_code=400, detail=f"Métrica desconhecida. Use uma de: {', '.join(METRICS)}")
+    end = time.time() if end is None else end
+    start = end - METRICS_DEFAULT_RANGE if start is None else start
+    try:
+        # Intervalo inválido (inf/nan, start > end) ou step fora das resoluções
+        series = metrics_store.query(container_id[:12], metric, start, end, step)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if series is None:
+        raise HTTPException(status_code=404, detail="Sem métricas para este container.")
+    return {"container_id": container_id[:12], "metric": metric, **series}
+
 from pydantic import BaseModel
 from pathlib import Path
 
@@ -108,7 +183,6 @@ class AzureCreds(BaseModel):
     subscription_id: str
 
 import boto3
-import json
 from google.oauth2 import service_account
 from google.auth.exceptions import DefaultCredentialsError
 from azure.identity import ClientSecretCredential
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from .docker_service import DockerService
+from .inventory import ContainerInventory
+from .timeseries import MetricsStore
+
+logger = logging.getLogger(__name__)
+
+# How often the set of stats streams is matched against the running containers
+RECONCILE_INTERVAL = 1.0
+# A stream that ended or failed is reopened after this long (if still running)
+RETRY_DELAY = 5.0
+
+
+class StatsCollector:
+    """
+    Keeps one streaming stats subscription per running container and the
+    latest CPU/memory sample of each in memory, so readers never wait on the
+    daemon's ~1-2s CPU delta sampling.
+    """
+
+    def __init__(self, service: DockerService, inventory: ContainerInventory, store: Optional[MetricsStore] = None):
+        self.service = service
+        self.inventory = inventory
+        # Every sample is also recorded here for the history endpoint
+        self.store = store
+        # Latest sample per short container ID (the ID the dashboard uses)
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._streams: Dict[str, asyncio.Task] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return self._stats
+
+    def get(self, container_id: str) -> Optional[Dict[str, Any]]:
+        return self._stats.get(container_id[:12])
+
+    async def start(self):
+        self._task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self):
+        tasks = [task for task in (self._task, *self._streams.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._streams.clear()
+        self._task = None
+
+    def reconcile(self):
+        running = set(self.inventory.running_container_ids())
+        now = time.monotonic()
+
+        for container_id in list(self._streams):
+            if container_id not in running:
+                self._streams.pop(container_id).cancel()
+                self._stats.pop(container_id[:12], None)
+
+        for container_id in running:
+            if container_id not in self._streams and self._retry_at.get(container_id, 0.0) <= now:
+                self._streams[container_id] = asyncio.create_task(self._follow(container_id))
+
+        # Forget backoffs of containers that are gone
+        for container_id in list(self._retry_at):
+            if container_id not in running:
+                del self._retry_at[container_id]
+
+    async def _reconcile_loop(self):
+        while True:
+            try:
+                self.reconcile()
+            except Exception as e:
+                logger.error(f"Stats collector reconcile failed: {e}")
+            await asyncio.sleep(RECONCILE_INTERVAL)
+
+    async def _follow(self, container_id: str):
+        short_id = container_id[:12]
+        try:
+            async for sample in self.service.client.stream_container_stats(container_id):
+                # Stopped containers keep the stream open with empty samples
+                if not sample.get('cpu_stats', {}).get('cpu_usage'):
+                    continue
+                values = self.service.compute_stats(sample)
+                timestamp = time.time()
+                self._stats[short_id] = {
+                    **self.service.format_stats(values),
+                    **values,
+                    "timestamp": timestamp,
+                }
+                if self.store is not None:
+                    self.store.add(short_id, values, timestamp)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Stats stream for container {short_id} failed: {e}")
+        # Ended on its own (container stopped or stream error): reconcile decides
+        # whether to reopen it
+        self._streams.pop(container_id, None)
+        self._stats.pop(short_id, None)
+        self._retry_at[container_id] = time.monotonic() + RETRY_DELAY
@@ -0,0 +1,107 @@
+import math
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (bucket width in seconds, buckets kept): 10 minutes at 1s, 24 hours at 1m,
+# 30 days at 1h. Every sample goes straight into all three, so downsampling is
+# just a running mean per bucket.
+RESOLUTIONS: Tuple[Tuple[int, int], ...] = ((1, 600), (60, 1440), (3600, 720))
+METRICS = ("cpu_percent", "mem_mb")
+# Oldest-updated containers are dropped beyond this (~130KB of samples each,
+# so at most ~26MB)
+MAX_CONTAINERS = 200
+
+
+class RingSeries:
+    """Fixed-size ring of `capacity` buckets of `step` seconds, stored in float arrays."""
+
+    def __init__(self, step: int, capacity: int):
+        self.step = step
+        self.capacity = capacity
+        # Start time of the bucket each slot currently holds (NaN = empty)
+        self._starts = array('d', [math.nan]) * capacity
+        self._sums = array('d', [0.0]) * capacity
+        self._counts = array('d', [0.0]) * capacity
+
+    def add(self, timestamp: float, value: float):
+        bucket = int(timestamp // self.step)
+        slot = bucket % self.capacity
+        start = float(bucket * self.step)
+        if self._starts[slot] != start:
+            # Slot still holds a bucket from a previous lap: overwrite it
+            self._starts[slot] = start
+            self._sums[slot] = 0.0
+            self._counts[slot] = 0.0
+        self._sums[slot] += value
+        self._counts[slot] += 1.0
+
+    def query(self, start: float, end: float) -> Tuple[List[float], List[float]]:
+        first = int(start // self.step)
+        last = int(end // self.step)
+        # Older buckets have been overwritten already
+        first = max(first, last - self.capacity + 1)
+        timestamps, values = [], []
+        for bucket in range(first, last + 1):
+            slot = bucket % self.capacity
+            if self._starts[slot] == bucket * self.step:
+                timestamps.append(self._starts[slot])
+                values.append(self._sums[slot] / self._counts[slot])
+        return timestamps, values
+
+
+class MetricsStore:
+    """
+    In-process time series of container metrics, with bounded memory: one
+    RingSeries per container, metric and resolution.
+    """
+
+    def __init__(self, resolutions: Iterable[Tuple[int, int]] = RESOLUTIONS, max_containers: int = MAX_CONTAINERS):
+        self.resolutions = tuple(resolutions)
+        self.max_containers = max_containers
+        self._series: Dict[str, Dict[str, List[RingSeries]]] = {}
+        self._updated_at: Dict[str, float] = {}
+
+    def add(self, container_id: str, values: Dict[str, float], timestamp: Optional[float] = None):
+        timestamp = time.time() if timestamp is None else timestamp
+        series = self._series.get(container_id)
+        if series is None:
+            if len(self._series) >= self.max_containers:
+                self._evict()
+            series = self._series[container_id] = {
+                metric: [RingSeries(step, capacity) for step, capacity in self.resolutions] for metric in METRICS
+            }
+        for metric, rings in series.items():
+            if metric in values:
+                for ring in rings:
+                    ring.add(timestamp, values[metric])
+        self._updated_at[container_id] = timestamp
+
+    def _evict(self):
+        oldest = min(self._updated_at, key=self._updated_at.get)
+        del self._series[oldest]
+        del self._updated_at[oldest]
+
+    def pick_step(self, start: float, now: Optional[float] = None) -> int:
+        """Finest resolution that still holds `start`."""
+        now = time.time() if now is None else now
+        for step, capacity in self.resolutions:
+            if start >= now - step * capacity:
+                return step
+        return self.resolutions[-1][0]
+
+    def query(
+        self, container_id: str, metric: str, start: float, end: float, step: Optional[int] = None
+    ) -> Optional[Dict[str, object]]:
+        if not (math.isfinite(start) and math.isfinite(end)) or start > end:
+            raise ValueError("start and end must be finite with start <= end")
+        series = self._series.get(container_id)
+        if series is None or metric not in series:
+            return None
+        if step is None:
+            step = self.pick_step(start)
+        steps = [s for s, _ in self.resolutions]
+        if step not in steps:
+            raise ValueError(f"step must be one of {steps}")
+        timestamps, values = series[metric][steps.index(step)].query(start, end)
+        return {"step": step, "timestamps": timestamps, "values": values}
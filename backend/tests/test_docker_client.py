@@ -0,0 +1,164 @@
+import asyncio
+
+import httpx
+import pytest
+
+import api.docker_client as docker_client
+from api.docker_client import AsyncDockerClient, DockerAPIError
+from stub_daemon import StubDaemon, container_id, log_frame, stats_sample
+
+CONTAINER = container_id(1)  # Em execução no StubDaemon
+
+
+class ConcurrencyDaemon(StubDaemon):
+    """Registra o pico de requisições simultâneas que chegam ao daemon."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await super().handle(request)
+        finally:
+            self.in_flight -= 1
+
+
+def make_client(daemon: StubDaemon, **kwargs) -> AsyncDockerClient:
+    return AsyncDockerClient(transport=httpx.MockTransport(daemon.handle), **kwargs)
+
+
+def test_list_inspect_and_lifecycle():
+    async def scenario():
+        daemon = StubDaemon(3)
+        client = make_client(daemon)
+        assert await client.ping()
+        assert len(await client.list_containers(all=True)) == 3
+        assert len(await client.list_containers(all=False)) == 2
+        only = await client.list_containers(filters={"id": [CONTAINER]})
+        assert [c["Id"] for c in only] == [CONTAINER]
+        assert (await client.inspect_container(CONTAINER))["State"]["Status"] == "running"
+
+        await client.stop_container(CONTAINER)
+        assert daemon.find(CONTAINER)["State"] == "exited"
+        # 304 (já parado) não é erro
+        await client.stop_container(CONTAINER)
+        stop = [r for r in daemon.requests if r.url.path.endswith("/stop")][0]
+        assert stop.url.params["t"] == str(docker_client.STOP_GRACE_PERIOD)
+        await client.start_container(CONTAINER)
+        assert daemon.find(CONTAINER)["State"] == "running"
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_daemon_errors_raise_docker_api_error():
+    async def scenario():
+        client = make_client(StubDaemon(1))
+        with pytest.raises(DockerAPIError) as error:
+            await client.inspect_container("missing")
+        assert error.value.status_code == 404
+        assert "No such container" in error.value.message
+
+    asyncio.run(scenario())
+
+
+def test_ping_is_false_when_the_daemon_is_unreachable():
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def scenario():
+        client = AsyncDockerClient(transport=httpx.MockTransport(refuse))
+        assert not await client.ping()
+
+    asyncio.run(scenario())
+
+
+def test_each_operation_has_its_own_timeout(monkeypatch):
+    monkeypatch.setitem(docker_client.TIMEOUTS, "inspect", 0.05)
+
+    async def scenario():
+        client = make_client(StubDaemon(2, latency=0.5))
+        with pytest.raises(asyncio.TimeoutError):
+            await client.inspect_container(CONTAINER)
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_requests_are_capped_by_the_semaphore():
+    async def scenario():
+        daemon = ConcurrencyDaemon(5, latency=0.02)
+        client = make_client(daemon, max_concurrency=2)
+        results = await asyncio.gather(*(client.list_containers() for _ in range(10)))
+        assert len(results) == 10
+        assert daemon.peak == 2
+
+    asyncio.run(scenario())
+
+
+def test_streams_do_not_hold_a_concurrency_slot():
+    async def scenario():
+        daemon = StubDaemon(2)
+        client = make_client(daemon, max_concurrency=1)
+
+        async def follow_events():
+            return [event async for event in client.events(since=10, filters={"type": ["container"]})]
+
+        events = asyncio.create_task(follow_events())
+        await asyncio.sleep(0.05)
+        # Com o único slot livre, chamadas normais seguem com o stream aberto
+        assert len(await asyncio.wait_for(client.list_containers(), 1)) == 2
+
+        daemon.emit("start", CONTAINER, time=11)
+        daemon.disconnect_events()
+        assert [e["Action"] for e in await events] == ["start"]
+        request = [r for r in daemon.requests if r.url.path == "/events"][0]
+        assert request.url.params["since"] == "10"
+
+    asyncio.run(scenario())
+
+
+def test_logs_are_demultiplexed_across_chunks():
+    async def scenario():
+        daemon = StubDaemon(2)
+        raw = log_frame(1, "hello\nwor") + log_frame(2, "ld\r\n") + log_frame(1, "last line")
+        # Cortes no meio do cabeçalho e do payload dos frames
+        daemon.logs[CONTAINER] = [raw[:5], raw[5:12], raw[12:30], raw[30:]]
+        client = make_client(daemon)
+
+        lines = [line async for line in client.container_logs(CONTAINER, tail=50)]
+        assert lines == ["hello", "world", "last line"]
+        request = [r for r in daemon.requests if r.url.path.endswith("/logs")][0]
+        assert request.url.params["tail"] == "50" and request.url.params["follow"] == "1"
+
+    asyncio.run(scenario())
+
+
+def test_tty_logs_are_read_as_plain_text():
+    async def scenario():
+        daemon = StubDaemon(2)
+        daemon.tty.add(CONTAINER)
+        daemon.logs[CONTAINER] = [b"one\ntw", b"o\n"]
+        client = make_client(daemon)
+        assert [line async for line in client.container_logs(CONTAINER)] == ["one", "two"]
+
+    asyncio.run(scenario())
+
+
+def test_stats_one_shot_and_stream():
+    async def scenario():
+        daemon = StubDaemon(2)
+        daemon.stats[CONTAINER] = [
+            stats_sample(100, 1000, 0, 0),
+            stats_sample(300, 2000, 100, 1000),
+        ]
+        client = make_client(daemon)
+
+        assert (await client.container_stats(CONTAINER))["cpu_stats"]["cpu_usage"]["total_usage"] == 300
+        samples = [s async for s in client.stream_container_stats(CONTAINER)]
+        assert [s["cpu_stats"]["cpu_usage"]["total_usage"] for s in samples] == [100, 300]
+
+    asyncio.run(scenario())
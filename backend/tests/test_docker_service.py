@@ -0,0 +1,123 @@
+import asyncio
+
+import httpx
+import pytest
+
+import api.docker_service as docker_service
+from api.docker_client import AsyncDockerClient
+from api.docker_service import DockerService
+from stub_daemon import StubDaemon, container_id, stats_sample
+
+MB = 1024 * 1024
+
+
+def make_service(daemon: StubDaemon) -> DockerService:
+    return DockerService(AsyncDockerClient(transport=httpx.MockTransport(daemon.handle)))
+
+
+def test_containers_are_formatted_from_the_list_call():
+    async def scenario():
+        daemon = StubDaemon(100)
+        service = make_service(daemon)
+
+        containers = await service.get_containers()
+        # Lista + um lookup em lote das imagens, independente da quantidade
+        assert daemon.calls == 2
+        assert len(containers) == 100
+        assert containers[1] == {
+            "id": container_id(1)[:12],
+            "image": "app1:latest",
+            "status": "Running",
+            "uptime": "Up 2 hours",
+            "port": "8001",
+            "name": "container-1",
+        }
+        assert containers[0]["status"] == "Stopped"
+
+    asyncio.run(scenario())
+
+
+def test_image_names_are_cached_until_an_unknown_image_shows_up():
+    async def scenario():
+        daemon = StubDaemon(3)
+        service = make_service(daemon)
+        await service.get_containers()
+
+        daemon.calls = 0
+        await service.get_containers()
+        assert daemon.calls == 1  # Só a lista; imagens vêm do cache
+
+        daemon.images.append({"Id": "sha256:" + "f" * 64, "RepoTags": ["<none>:<none>"]})
+        new = daemon.add_container(3)
+        new["ImageID"] = "sha256:" + "f" * 64
+        daemon.calls = 0
+        containers = await service.get_containers()
+        assert daemon.calls == 2
+        # Imagem sem tag: mostra o ID curto
+        assert containers[-1]["image"] == "f" * 12
+
+    asyncio.run(scenario())
+
+
+def test_image_cache_expires(monkeypatch):
+    monkeypatch.setattr(docker_service, "IMAGE_CACHE_TTL", 0.0)
+
+    async def scenario():
+        daemon = StubDaemon(2)
+        service = make_service(daemon)
+        await service.get_containers()
+        daemon.images[1]["RepoTags"] = ["retagged:v2"]
+        containers = await service.get_containers()
+        assert containers[1]["image"] == "retagged:v2"
+
+    asyncio.run(scenario())
+
+
+def test_list_containers_by_id():
+    async def scenario():
+        daemon = StubDaemon(5)
+        service = make_service(daemon)
+        ids = {container_id(1), container_id(4)}
+        assert set(await service.list_containers(ids)) == ids
+
+        daemon.calls = 0
+        # Filtro vazio casaria todos os containers: nem chega ao daemon
+        assert await service.list_containers([]) == {}
+        assert daemon.calls == 0
+
+    asyncio.run(scenario())
+
+
+def test_get_containers_is_empty_when_the_daemon_fails():
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def scenario():
+        service = DockerService(AsyncDockerClient(transport=httpx.MockTransport(refuse)))
+        assert await service.get_containers() == []
+
+    asyncio.run(scenario())
+
+
+def test_compute_stats_cpu_and_memory():
+    service = DockerService(AsyncDockerClient(transport=httpx.MockTransport(lambda r: httpx.Response(404))))
+    # 200 de 1000 ticks do sistema em 2 CPUs = 40%
+    values = service.compute_stats(stats_sample(300, 2000, 100, 1000, online_cpus=2, mem_usage=80 * MB, cache=16 * MB))
+    assert values["cpu_percent"] == pytest.approx(40.0)
+    assert values["mem_mb"] == pytest.approx(64.0)
+    assert service.format_stats(values) == {"cpu": "40.00%", "mem": "64.0MB"}
+
+    # Primeira amostra de um stream: sem precpu, sem delta
+    assert service.compute_stats(stats_sample(300, 2000, 0, 0))["cpu_percent"] == 0.0
+
+
+def test_get_container_stats():
+    async def scenario():
+        daemon = StubDaemon(2)
+        daemon.stats[container_id(1)] = [stats_sample(300, 2000, 100, 1000)]
+        service = make_service(daemon)
+        assert await service.get_container_stats(container_id(1)) == {"cpu": "40.00%", "mem": "64.0MB"}
+        # Parado: nem consulta as stats
+        assert await service.get_container_stats(container_id(0)) == {"cpu": "-", "mem": "-"}
+
+    asyncio.run(scenario())
@@ -0,0 +1,131 @@
+import asyncio
+
+import httpx
+
+import api.inventory as inventory_module
+from api.docker_client import AsyncDockerClient
+from api.docker_service import DockerService
+from api.inventory import ContainerInventory
+from stub_daemon import StubDaemon, container_id
+
+
+class GatedListDaemon(StubDaemon):
+    """Listagem completa montada na chegada da requisição e entregue só quando `gate` abrir."""
+
+    gate = None
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.gate is not None and request.url.path == "/containers/json" and "filters" not in request.url.params:
+            self.calls += 1
+            response = httpx.Response(200, json=self._list(request))
+            await self.gate.wait()
+            return response
+        return await super().handle(request)
+
+
+def make_inventory(daemon: StubDaemon) -> ContainerInventory:
+    client = AsyncDockerClient(transport=httpx.MockTransport(daemon.handle))
+    return ContainerInventory(DockerService(client))
+
+
+async def until(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condição não atingida"
+        await asyncio.sleep(0.01)
+
+
+def names(inventory: ContainerInventory):
+    return sorted(c["name"] for c in inventory.get_containers())
+
+
+def test_resync_lists_every_container():
+    async def scenario():
+        daemon = StubDaemon(3)
+        inventory = make_inventory(daemon)
+        assert not inventory.ready
+
+        await inventory.resync()
+        assert inventory.ready
+        assert names(inventory) == ["container-0", "container-1", "container-2"]
+        assert sorted(inventory.running_container_ids()) == [container_id(1), container_id(2)]
+        # Leituras não vão ao daemon
+        calls = daemon.calls
+        inventory.get_containers()
+        assert daemon.calls == calls
+
+    asyncio.run(scenario())
+
+
+def test_events_update_only_the_touched_containers():
+    async def scenario():
+        daemon = StubDaemon(2)
+        inventory = make_inventory(daemon)
+        await inventory.start()
+        try:
+            await until(lambda: inventory.ready)
+
+            new = daemon.add_container(7)
+            daemon.emit("start", new["Id"], time=1)
+            await until(lambda: "container-7" in names(inventory))
+
+            daemon.remove(container_id(0))
+            daemon.emit("destroy", container_id(0), time=2)
+            await until(lambda: "container-0" not in names(inventory))
+            assert names(inventory) == ["container-1", "container-7"]
+
+            # Cada lote de eventos vira uma listagem filtrada pelos IDs
+            filtered = [r for r in daemon.requests if "filters" in r.url.params and r.url.path == "/containers/json"]
+            assert filtered and all("id" in r.url.params["filters"] for r in filtered)
+        finally:
+            await inventory.stop()
+
+    asyncio.run(scenario())
+
+
+def test_events_stream_reconnects_from_the_last_event(monkeypatch):
+    monkeypatch.setattr(inventory_module, "RECONNECT_DELAY", 0.01)
+
+    async def scenario():
+        daemon = StubDaemon(1)
+        inventory = make_inventory(daemon)
+        await inventory.start()
+        try:
+            await until(lambda: inventory.ready)
+            daemon.emit("stop", container_id(0), time=1234)
+            await until(lambda: inventory._since == 1234)
+
+            daemon.disconnect_events()
+            await until(lambda: len([r for r in daemon.requests if r.url.path == "/events"]) == 2)
+            reconnect = [r for r in daemon.requests if r.url.path == "/events"][-1]
+            assert reconnect.url.params["since"] == "1234"
+        finally:
+            await inventory.stop()
+
+    asyncio.run(scenario())
+
+
+def test_event_applied_during_resync_survives_the_listing():
+    async def scenario():
+        daemon = GatedListDaemon(1)
+        inventory = make_inventory(daemon)
+        target = container_id(0)
+        await inventory.resync()
+        assert inventory.get_containers()[0]["status"] == "Stopped"
+
+        # A listagem completa é tirada antes do container subir...
+        daemon.gate = asyncio.Event()
+        calls = daemon.calls
+        resync = asyncio.create_task(inventory.resync())
+        await until(lambda: daemon.calls > calls)
+
+        # ...e o evento de start é aplicado enquanto ela ainda está em voo
+        daemon.set_running(target, True)
+        await inventory.refresh({target})
+        assert inventory.get_containers()[0]["status"] == "Running"
+
+        daemon.gate.set()
+        await resync
+        assert inventory.get_containers()[0]["status"] == "Running"
+
+    asyncio.run(scenario())
@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+
+import api.stats as stats_module
+from api.docker_client import AsyncDockerClient
+from api.docker_service import DockerService
+from api.inventory import ContainerInventory
+from api.stats import StatsCollector
+from api.timeseries import MetricsStore
+from stub_daemon import StubDaemon, container_id, stats_sample
+
+RUNNING = [container_id(1), container_id(2)]  # container-0 está parado
+
+
+def busy_samples(count: int):
+    # 25% de CPU em 2 núcleos a cada amostra
+    return [stats_sample(125 * (i + 1), 1000 * (i + 1), 125 * i, 1000 * i) for i in range(count)]
+
+
+async def until(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condição não atingida"
+        await asyncio.sleep(0.01)
+
+
+async def make_collector(daemon: StubDaemon, store=None) -> StatsCollector:
+    service = DockerService(AsyncDockerClient(transport=httpx.MockTransport(daemon.handle)))
+    inventory = ContainerInventory(service)
+    await inventory.resync()
+    collector = StatsCollector(service, inventory, store)
+    await collector.start()
+    return collector
+
+
+def stats_requests(daemon: StubDaemon, target: str):
+    return [r for r in daemon.requests if r.url.path == f"/containers/{target}/stats"]
+
+
+def test_one_stream_per_running_container(monkeypatch):
+    monkeypatch.setattr(stats_module, "RECONCILE_INTERVAL", 0.01)
+
+    async def scenario():
+        daemon = StubDaemon(3)
+        daemon.stats_interval = 0.01
+        for target in RUNNING:
+            daemon.stats[target] = busy_samples(500)
+        store = MetricsStore()
+        collector = await make_collector(daemon, store)
+        try:
+            await until(lambda: set(collector.get_stats()) == {c[:12] for c in RUNNING})
+            # A primeira amostra do stream não tem delta (0%); a seguinte tem
+            await until(lambda: collector.get(RUNNING[0])["cpu_percent"] > 0)
+            sample = collector.get(RUNNING[0])
+            assert sample["cpu"] == "25.00%" and sample["cpu_percent"] == 25.0
+            assert sample["mem"] == "64.0MB"
+            for target in RUNNING:
+                assert len(stats_requests(daemon, target)) == 1
+                assert stats_requests(daemon, target)[0].url.params["stream"] == "1"
+            # Parados não abrem stream
+            assert stats_requests(daemon, container_id(0)) == []
+            # Cada amostra também vai para o histórico
+            series = store.query(RUNNING[0][:12], "cpu_percent", sample["timestamp"] - 5, sample["timestamp"])
+            # Média do bucket de 1s: pode incluir a primeira amostra (0%)
+            assert series["values"] and 0 < series["values"][-1] <= 25.0
+
+            # Container parou: stream fechado e stats removidas
+            daemon.set_running(RUNNING[0], False)
+            await collector.inventory.refresh({RUNNING[0]})
+            await until(lambda: RUNNING[0] not in collector._streams)
+            assert collector.get(RUNNING[0]) is None
+            assert collector.get(RUNNING[1]) is not None
+        finally:
+            await collector.stop()
+        assert collector._streams == {}
+
+    asyncio.run(scenario())
+
+
+def test_ended_stream_is_reopened_after_the_retry_delay(monkeypatch):
+    monkeypatch.setattr(stats_module, "RECONCILE_INTERVAL", 0.01)
+    monkeypatch.setattr(stats_module, "RETRY_DELAY", 0.1)
+
+    async def scenario():
+        daemon = StubDaemon(2)
+        target = RUNNING[0]
+        # Amostra vazia (como a de um container parando) é ignorada
+        daemon.stats[target] = [{"cpu_stats": {}, "memory_stats": {}}] + busy_samples(2)
+        collector = await make_collector(daemon)
+        try:
+            await until(lambda: len(stats_requests(daemon, target)) == 1)
+            await until(lambda: target not in collector._streams)
+            # Fim do stream: sem amostra velha servida como atual
+            assert collector.get(target) is None
+            await asyncio.sleep(0.05)
+            assert len(stats_requests(daemon, target)) == 1
+            await until(lambda: len(stats_requests(daemon, target)) == 2)
+        finally:
+            await collector.stop()
+
+    asyncio.run(scenario())
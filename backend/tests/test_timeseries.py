@@ -0,0 +1,93 @@
+import math
+
+import pytest
+
+from api.timeseries import MetricsStore, RingSeries
+
+T0 = 1_699_999_200.0  # Múltiplo de 3600: buckets alinhados nas três resoluções
+
+
+def test_ring_series_means_samples_per_bucket():
+    ring = RingSeries(step=60, capacity=10)
+    for i, value in enumerate([10.0, 20.0, 30.0]):
+        ring.add(T0 + i, value)
+    ring.add(T0 + 60, 5.0)
+
+    assert ring.query(T0, T0 + 119) == ([T0, T0 + 60], [20.0, 5.0])
+
+
+def test_ring_series_overwrites_a_slot_on_the_next_lap():
+    ring = RingSeries(step=1, capacity=5)
+    for i in range(8):
+        ring.add(T0 + i, float(i))
+
+    timestamps, values = ring.query(T0, T0 + 7)
+    # Só as 5 últimas sobrevivem; o slot reaproveitado não soma a volta anterior
+    assert timestamps == [T0 + i for i in range(3, 8)]
+    assert values == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+
+def test_ring_series_skips_empty_buckets():
+    ring = RingSeries(step=1, capacity=10)
+    ring.add(T0, 1.0)
+    ring.add(T0 + 3, 2.0)
+    assert ring.query(T0, T0 + 5) == ([T0, T0 + 3], [1.0, 2.0])
+
+
+def test_store_downsamples_every_sample_into_each_resolution():
+    store = MetricsStore()
+    for i in range(120):  # 2 minutos a 1 amostra/s
+        store.add("abc", {"cpu_percent": float(i % 60), "mem_mb": 100.0}, T0 + i)
+    end = T0 + 119
+
+    fine = store.query("abc", "cpu_percent", end - 4, end, step=1)
+    assert fine["values"] == [55.0, 56.0, 57.0, 58.0, 59.0]
+    minute = store.query("abc", "cpu_percent", T0, end, step=60)
+    assert minute == {"step": 60, "timestamps": [T0, T0 + 60], "values": [29.5, 29.5]}
+    hour = store.query("abc", "mem_mb", T0, end, step=3600)
+    assert hour["values"] == [100.0]
+
+
+def test_store_picks_the_finest_resolution_that_covers_start():
+    store = MetricsStore()
+    now = T0 + 10 * 86400
+    assert store.pick_step(now - 300, now) == 1
+    assert store.pick_step(now - 3600, now) == 60
+    assert store.pick_step(now - 2 * 86400, now) == 3600
+    # Além da retenção mais longa, fica na mais grossa
+    assert store.pick_step(now - 365 * 86400, now) == 3600
+
+
+def test_store_evicts_the_least_recently_updated_container():
+    store = MetricsStore(max_containers=2)
+    store.add("a", {"cpu_percent": 1.0}, T0)
+    store.add("b", {"cpu_percent": 1.0}, T0 + 1)
+    store.add("a", {"cpu_percent": 1.0}, T0 + 2)
+    store.add("c", {"cpu_percent": 1.0}, T0 + 3)
+
+    assert store.query("b", "cpu_percent", T0, T0 + 3) is None
+    assert store.query("a", "cpu_percent", T0, T0 + 3) is not None
+    assert store.query("c", "cpu_percent", T0, T0 + 3) is not None
+
+
+def test_store_query_unknown_series_and_step():
+    store = MetricsStore()
+    store.add("a", {"cpu_percent": 1.0}, T0)
+    assert store.query("missing", "cpu_percent", T0, T0 + 1) is None
+    assert store.query("a", "disk", T0, T0 + 1) is None
+    with pytest.raises(ValueError):
+        store.query("a", "cpu_percent", T0, T0 + 1, step=5)
+
+
+@pytest.mark.parametrize("start,end", [
+    (math.inf, T0),
+    (T0, math.inf),
+    (-math.inf, T0),
+    (math.nan, T0),
+    (T0 + 10, T0),
+])
+def test_store_rejects_invalid_ranges(start, end):
+    store = MetricsStore()
+    store.add("a", {"cpu_percent": 1.0}, T0)
+    with pytest.raises(ValueError):
+        store.query("a", "cpu_percent", start, end)
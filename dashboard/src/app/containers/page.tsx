@@ -3,38 +3,15 @@
 import { useState, useEffect } from "react";
 import { Play, Square, RotateCcw, Box, TerminalSquare, RefreshCw } from "lucide-react";
 
+const EMPTY_STATS = { cpu: "-", mem: "-" };
+
 /**
  * Individual Container Row Component
- * Manages its own stats fetching if running
+ * Stats come from the page-wide stats feed
  */
-function ContainerRow({ container, onAction }: { container: any, onAction: () => void }) {
-    const [stats, setStats] = useState({ cpu: "-", mem: "-" });
+function ContainerRow({ container, stats = EMPTY_STATS, onAction }: { container: any, stats?: { cpu: string, mem: string }, onAction: () => void }) {
     const isRunning = container.status.toLowerCase() === 'running';
 
-    useEffect(() => {
-        let interval: NodeJS.Timeout;
-
-        async function fetchStats() {
-            if (!isRunning) return;
-            try {
-                const res = await fetch(`http://localhost:8080/api/containers/${container.id}/stats`);
-                if (res.ok) {
-                    const data = await res.json();
-                    setStats(data);
-                }
-            } catch (e) {
-                console.error("Failed to fetch stats for", container.id);
-            }
-        }
-
-        if (isRunning) {
-            fetchStats();
-            interval = setInterval(fetchStats, 5000); // Poll every 5 seconds
-        }
-
-        return () => clearInterval(interval);
-    }, [container.id, isRunning]);
-
     const performAction = async (action: string) => {
         try {
             await fetch(`http://localhost:8080/api/containers/${container.id}/${action}`, {
@@ -108,6 +85,7 @@ function ContainerRow({ container, onAction }: { container: any, onAction: () =>
 export default function ContainersPage() {
     const [containers, setContainers] = useState<any[]>([]);
     const [loading, setLoading] = useState(true);
+    const [stats, setStats] = useState<Record<string, { cpu: string, mem: string }>>({});
 
     const fetchContainers = async () => {
         setLoading(true);
@@ -128,6 +106,19 @@ export default function ContainersPage() {
         fetchContainers();
     }, []);
 
+    // A single SSE feed pushes the stats of every running container
+    useEffect(() => {
+        const eventSource = new EventSource("http://localhost:8080/api/containers/stats/stream?interval=2");
+        eventSource.onmessage = (event) => {
+            try {
+                setStats(JSON.parse(event.data));
+            } catch (e) {
+                console.error("Failed to parse container stats", e);
+            }
+        };
+        return () => eventSource.close();
+    }, []);
+
     return (
         <div className="flex flex-col gap-8">
             <div className="flex justify-between items-center">
@@ -149,7 +140,7 @@ export default function ContainersPage() {
             ) : (
                 <div className="grid grid-cols-1 gap-4">
                     {containers.map((c, i) => (
-                        <ContainerRow key={c.id || i} container={c} onAction={fetchContainers} />
+                        <ContainerRow key={c.id || i} container={c} stats={stats[c.id]} onAction={fetchContainers} />
                     ))}
                     {containers.length === 0 && (
                         <div className="text-gray-500 italic p-6 border border-dashed border-gray-700 rounded-xl text-center">
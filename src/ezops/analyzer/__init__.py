@@ -1,4 +1,5 @@
-from .engine import analyze_directory
+from .engine import analyze_components, analyze_directory
 from .models import StackInfo
+from .monorepo import analyze_monorepo, discover_services
 
-__all__ = ["analyze_directory", "StackInfo"]
+__all__ = ["analyze_components", "analyze_directory", "analyze_monorepo", "discover_services", "StackInfo"]
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from .models import StackInfo
+from .registry import registry
+from .scanner import VERSION_FILES, DirectoryIndex
+
+# Incrementar sempre que as heurísticas mudarem o resultado da análise
+CACHE_VERSION = 5
+DEFAULT_MAX_ENTRIES = 512
+CACHE_FILE = "analysis.json"
+
+
+
+def default_cache_dir(root) -> Path:
+    """Diretório do cache: $EZOPS_CACHE_DIR ou <root>/.ezops/cache."""
+    env_dir = os.environ.get("EZOPS_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    return Path(root) / ".ezops" / "cache"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint(index: DirectoryIndex) -> Dict[str, list]:
+    """Assinatura (size, mtime_ns, sha256) dos arquivos consultados pelo analisador."""
+    # Entrypoints contam na pontuação e alguns são lidos (ex.: manage.py do Django)
+    relevant = registry.manifests() | registry.entrypoints() | VERSION_FILES
+    inputs = {}
+    for name, entry in index.files.items():
+        if name not in relevant:
+            continue
+        st = entry.stat()
+        inputs[name] = [st.st_size, st.st_mtime_ns, None]
+    return inputs
+
+
+def _extension_counts(index: DirectoryIndex) -> Dict[str, int]:
+    """Contagem das extensões que influenciam a detecção quando não há manifesto."""
+    extensions = sorted(set().union(*(d.extensions for d in registry.detectors())))
+    return {ext: index.count(ext) for ext in extensions}
+
+
+def _detectors_signature() -> list:
+    return [[d.name, d.target, d.priority] for d in registry.detectors()]
+
+
+class AnalysisCache:
+    """
+    Cache em disco dos resultados do analisador, com política LRU.
+    Cada entrada é invalidada quando qualquer manifesto do diretório muda
+    (tamanho ou conteúdo) ou quando arquivos relevantes aparecem/somem.
+    """
+
+    def __init__(self, cache_dir, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[OrderedDict] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def file_path(self) -> Path:
+        return self.cache_dir / CACHE_FILE
+
+    def _load(self) -> OrderedDict:
+        if self._entries is None:
+            self._entries = OrderedDict()
+            try:
+                data = json.loads(self.file_path.read_text())
+                if (data.get("version") == CACHE_VERSION
+                        and data.get("detectors") == _detectors_signature()):
+                    self._entries.update(data.get("entries", []))
+            except (OSError, ValueError, TypeError):
+                pass
+        return self._entries
+
+    def _is_valid(self, entry: dict, index: DirectoryIndex) -> bool:
+        if entry["extensions"] != _extension_counts(index):
+            return False
+
+        current = _fingerprint(index)
+        if set(current) != set(entry["inputs"]):
+            return False
+
+        for name, (size, mtime_ns, digest) in entry["inputs"].items():
+            cur_size, cur_mtime_ns, _ = current[name]
+            if cur_size != size:
+                return False
+            if cur_mtime_ns == mtime_ns:
+                continue
+            # mtime mudou (ex.: checkout novo no CI): confirma pelo conteúdo
+            if _sha256(index.file_path(name)) != digest:
+                return False
+            entry["inputs"][name][1] = cur_mtime_ns
+            self._dirty = True
+        return True
+
+    def get(self, index: DirectoryIndex) -> Optional[StackInfo]:
+        key = str(index.path.resolve())
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is not None and self._is_valid(entry, index):
+                entries.move_to_end(key)
+                self._dirty = True
+                self.hits += 1
+                return StackInfo.from_dict(entry["stack"])
+            self.misses += 1
+            return None
+
+    def put(self, index: DirectoryIndex, stack: StackInfo):
+        key = str(index.path.resolve())
+        inputs = _fingerprint(index)
+        for name, signature in inputs.items():
+            signature[2] = _sha256(index.file_path(name))
+
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                "inputs": inputs,
+                "extensions": _extension_counts(index),
+                "stack": stack.to_dict() if stack else None,
+            }
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self):
+        """Persiste o cache em disco (escrita atômica)."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.file_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({
+                "version": CACHE_VERSION,
+                "detectors": _detectors_signature(),
+                "entries": list(self._entries.items()),
+            }))
+            os.replace(tmp_path, self.file_path)
+            self._dirty = False
@@ -0,0 +1,351 @@
+"""
+Contexto de build do Docker: padrões do `.dockerignore` por stack e
+estimativa do tamanho do contexto enviado ao daemon.
+"""
+import heapq
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import StackInfo
+from .scanner import DirectoryIndex
+
+# Sempre ignorados: VCS, metadados do EzOps, segredos locais e arquivos de IDE
+COMMON_IGNORES = (
+    ".git",
+    ".ezops",
+    ".dockerignore",
+    "Dockerfile*",
+    "docker-compose*.yml",
+    ".env",
+    ".env.*",
+    ".terraform",
+    "*.tfstate",
+    "*.tfstate.*",
+    "packer/*.tar.gz",
+    ".idea",
+    ".vscode",
+    "**/.DS_Store",
+    "**/*.swp",
+    "**/*.log",
+)
+
+# Artefatos de cada stack. Caminhos literais só entram no .dockerignore se
+# existirem no diretório escaneado; globs entram sempre.
+STACK_IGNORES = {
+    "python": (
+        "venv", ".venv", ".tox", ".nox", ".pytest_cache", ".mypy_cache",
+        ".ruff_cache", "htmlcov", ".coverage", "build", "dist", "*.egg-info",
+        "**/__pycache__", "**/*.py[cod]",
+    ),
+    "node": (
+        "node_modules", ".next", ".nuxt", ".turbo", ".cache", "dist", "build",
+        "coverage", ".npm", "**/npm-debug.log*", "**/yarn-error.log*",
+    ),
+    "go": ("bin", "coverage.out", "**/*.test"),
+    "java": ("target", "build", "out", ".gradle", "**/*.class"),
+    "ruby": (
+        ".bundle", "vendor/bundle", "log/*", "tmp/*", "coverage", "node_modules",
+        "public/assets", "public/packs",
+    ),
+}
+
+_GLOB_CHARS = frozenset("*?[")
+
+STACK_TITLES = {
+    "python": "Python",
+    "node": "Node.js",
+    "go": "Go",
+    "java": "Java",
+    "ruby": "Ruby",
+}
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(char in _GLOB_CHARS for char in pattern)
+
+
+def dockerignore_sections(stack: StackInfo, index: Optional[DirectoryIndex] = None) -> List[Tuple[str, List[str]]]:
+    """
+    Seções (título, padrões) do .dockerignore da stack e de seus componentes.
+    Com o `index` do scan, artefatos que não existem no projeto são omitidos.
+    """
+    sections = [("Geral", list(COMMON_IGNORES))]
+    seen = set(COMMON_IGNORES)
+    for name in [stack.name] + [component.name for component in stack.components]:
+        patterns = []
+        for pattern in STACK_IGNORES.get(name, ()):
+            if pattern in seen:
+                continue
+            if index is not None and not _is_glob(pattern):
+                top = pattern.split("/", 1)[0]
+                if top not in index.dirs and top not in index.files:
+                    continue
+            seen.add(pattern)
+            patterns.append(pattern)
+        if patterns:
+            sections.append((STACK_TITLES.get(name, name), patterns))
+    return sections
+
+
+@dataclass
+class IgnoreRule:
+    pattern: str
+    regex: re.Pattern
+    negate: bool = False
+
+
+def _translate(pattern: str) -> re.Pattern:
+    """Converte um padrão do .dockerignore (sintaxe do filepath.Match + `**`) em regex."""
+    regex, i = "", 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+            continue
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                regex += f"[{body}]"
+                i = end
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(char)
+        i += 1
+    return re.compile(regex)
+
+
+def parse_dockerignore(lines: Iterable[str]) -> List[IgnoreRule]:
+    rules = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:].strip()
+        pattern = os.path.normpath(line).replace(os.sep, "/").lstrip("/")
+        if pattern in ("", "."):
+            continue
+        rules.append(IgnoreRule(pattern, _translate(pattern), negate))
+    return rules
+
+
+def load_dockerignore(root) -> List[IgnoreRule]:
+    """Regras do .dockerignore do diretório (lista vazia se não existir)."""
+    try:
+        return parse_dockerignore(Path(root, ".dockerignore").read_text(errors="ignore").splitlines())
+    except OSError:
+        return []
+
+
+def is_ignored(rel_path: str, rules: Sequence[IgnoreRule]) -> bool:
+    """
+    Aplica as regras como o Docker: a última regra que casa com o caminho
+    (ou com um diretório pai dele) vence.
+    """
+    parts = rel_path.split("/")
+    candidates = ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+    ignored = False
+    for rule in rules:
+        if any(rule.regex.fullmatch(candidate) for candidate in candidates):
+            ignored = not rule.negate
+    return ignored
+
+
+@dataclass
+class ContextEstimate:
+    total_bytes: int = 0
+    total_files: int = 0
+    sent_bytes: int = 0
+    sent_files: int = 0
+
+    @property
+    def saved_ratio(self) -> float:
+        return 1 - self.sent_bytes / self.total_bytes if self.total_bytes else 0.0
+
+    def merge(self, other: "ContextEstimate"):
+        self.total_bytes += other.total_bytes
+        self.total_files += other.total_files
+        self.sent_bytes += other.sent_bytes
+        self.sent_files += other.sent_files
+
+
+@dataclass
+class ContextReport:
+    """Resultado do walk do contexto: totais e os maiores itens enviados ao daemon."""
+    estimate: ContextEstimate = field(default_factory=ContextEstimate)
+    dir_bytes: Counter = field(default_factory=Counter)  # Bytes enviados por diretório (até DIR_DEPTH)
+    largest_files: List[Tuple[int, str]] = field(default_factory=list)
+
+    def merge(self, other: "ContextReport", top: int):
+        self.estimate.merge(other.estimate)
+        self.dir_bytes.update(other.dir_bytes)
+        self.largest_files = heapq.nlargest(top, self.largest_files + other.largest_files)
+
+    def largest_dirs(self, top: int) -> List[Tuple[str, int]]:
+        return self.dir_bytes.most_common(top)
+
+    def to_dict(self, top: int = 10) -> Dict[str, Any]:
+        estimate = self.estimate
+        return {
+            "total_bytes": estimate.total_bytes,
+            "total_files": estimate.total_files,
+            "sent_bytes": estimate.sent_bytes,
+            "sent_files": estimate.sent_files,
+            "saved_ratio": round(estimate.saved_ratio, 4),
+            "largest_dirs": [{"path": path, "bytes": size} for path, size in self.largest_dirs(top)],
+            "largest_files": [{"path": path, "bytes": size} for size, path in self.largest_files[:top]],
+        }
+
+
+# Profundidade máxima dos diretórios contabilizados em `dir_bytes`
+DIR_DEPTH = 2
+
+
+def _walk_tree(root: Path, rel_dir: str, dir_ignored: bool, rules, prune: bool, top: int) -> ContextReport:
+    """Walk iterativo (os.scandir, apenas metadados) de uma subárvore do contexto."""
+    report = ContextReport()
+    estimate = report.estimate
+    heap: List[Tuple[int, str]] = []
+    pending = [(rel_dir, dir_ignored)]
+    while pending:
+        current, current_ignored = pending.pop()
+        try:
+            with os.scandir(root / current if current else root) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel_path = f"{current}/{entry.name}" if current else entry.name
+            ignored = current_ignored if (current_ignored and prune) else is_ignored(rel_path, rules)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((rel_path, ignored))
+                    continue
+                size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            estimate.total_bytes += size
+            estimate.total_files += 1
+            if ignored:
+                continue
+            estimate.sent_bytes += size
+            estimate.sent_files += 1
+            parts = rel_path.split("/")[:-1]
+            for depth in range(1, min(len(parts), DIR_DEPTH) + 1):
+                report.dir_bytes["/".join(parts[:depth])] += size
+            if len(heap) < top:
+                heapq.heappush(heap, (size, rel_path))
+            elif size > heap[0][0]:
+                heapq.heapreplace(heap, (size, rel_path))
+    report.largest_files = sorted(heap, reverse=True)
+    return report
+
+
+def _walk_files(root: Path, entries, rules, top: int) -> ContextReport:
+    report = ContextReport()
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+        report.estimate.total_bytes += size
+        report.estimate.total_files += 1
+        if not is_ignored(entry.name, rules):
+            report.estimate.sent_bytes += size
+            report.estimate.sent_files += 1
+            report.largest_files.append((size, entry.name))
+    report.largest_files = heapq.nlargest(top, report.largest_files)
+    return report
+
+
+def walk_context(
+    root,
+    rules: Optional[Sequence[IgnoreRule]] = None,
+    top: int = 10,
+    max_workers: Optional[int] = None,
+) -> ContextReport:
+    """
+    Percorre o contexto de build honrando o `.dockerignore` (ou as `rules`
+    informadas). Cada subdiretório do topo é percorrido em paralelo por uma
+    thread; só metadados são lidos (os.scandir + stat), nunca o conteúdo.
+    """
+    root = Path(root)
+    rules = load_dockerignore(root) if rules is None else list(rules)
+    # Sem negações, tudo abaixo de um diretório ignorado também é ignorado
+    prune = not any(rule.negate for rule in rules)
+
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return ContextReport()
+
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.name, is_ignored(entry.name, rules)))
+        except OSError:
+            continue
+
+    # Os arquivos do topo são contabilizados sem descer em subdiretórios
+    report = _walk_files(root, entries, rules, top)
+    if not subdirs:
+        return report
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as executor:
+        futures = [
+            executor.submit(_walk_tree, root, name, ignored, rules, prune, top)
+            for name, ignored in subdirs
+        ]
+        for future in futures:
+            report.merge(future.result(), top)
+    return report
+
+
+def subtree_sent_bytes(root, rel_path: str, rules: Sequence[IgnoreRule]) -> int:
+    """Bytes de uma subárvore do contexto que seriam enviados ao daemon."""
+    prune = not any(rule.negate for rule in rules)
+    return _walk_tree(Path(root), rel_path, is_ignored(rel_path, rules), rules, prune, 1).estimate.sent_bytes
+
+
+def estimate_context(root, rules: Optional[Sequence[IgnoreRule]] = None) -> ContextEstimate:
+    """
+    Soma o tamanho total do contexto e o que seria enviado ao daemon com as
+    `rules` (padrão: o .dockerignore atual).
+    """
+    return walk_context(root, rules).estimate
+
+
+def format_size(size: float) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
@@ -0,0 +1,76 @@
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+# Dependências que indicam um banco de dados (nome -> engine) por ecossistema.
+# ORMs genéricos usam "sql" e assumem Postgres se nenhum driver for declarado.
+DATABASE_PACKAGES: Dict[str, Dict[str, str]] = {
+    "python": {
+        "psycopg2": "postgres", "psycopg2-binary": "postgres", "psycopg": "postgres",
+        "asyncpg": "postgres", "pymysql": "mysql", "mysqlclient": "mysql",
+        "mysql-connector-python": "mysql", "aiomysql": "mysql",
+        "pymongo": "mongodb", "motor": "mongodb", "mongoengine": "mongodb",
+        "sqlalchemy": "sql", "sqlmodel": "sql", "peewee": "sql",
+        "tortoise-orm": "sql",
+    },
+    "node": {
+        "pg": "postgres", "postgres": "postgres", "mysql": "mysql", "mysql2": "mysql",
+        "mongoose": "mongodb", "mongodb": "mongodb", "prisma": "sql",
+        "@prisma/client": "sql", "typeorm": "sql", "sequelize": "sql",
+        "knex": "sql", "drizzle-orm": "sql",
+    },
+    "go": {
+        "github.com/lib/pq": "postgres", "github.com/jackc/pgx": "postgres",
+        "gorm.io/driver/postgres": "postgres", "gorm.io/gorm": "sql",
+        "github.com/go-sql-driver/mysql": "mysql", "gorm.io/driver/mysql": "mysql",
+        "go.mongodb.org/mongo-driver": "mongodb",
+    },
+    "java": {
+        "postgresql": "postgres", "r2dbc-postgresql": "postgres",
+        "mysql-connector-java": "mysql", "mysql-connector-j": "mysql",
+        "spring-boot-starter-data-jpa": "sql", "spring-boot-starter-jdbc": "sql",
+        "hibernate-core": "sql", "spring-boot-starter-data-mongodb": "mongodb",
+        "mongodb-driver-sync": "mongodb",
+    },
+    "ruby": {
+        "pg": "postgres", "mysql2": "mysql", "activerecord": "sql",
+        "sequel": "sql", "mongoid": "mongodb",
+    },
+}
+
+# Dependências que indicam uso de Redis
+REDIS_PACKAGES: Dict[str, frozenset] = {
+    "python": frozenset({"redis", "aioredis", "hiredis", "django-redis", "rq", "flask-caching"}),
+    "node": frozenset({"redis", "ioredis", "bull", "bullmq", "connect-redis"}),
+    "go": frozenset({"github.com/redis/go-redis", "github.com/go-redis/redis", "github.com/gomodule/redigo"}),
+    "java": frozenset({"spring-boot-starter-data-redis", "jedis", "lettuce-core", "redisson"}),
+    "ruby": frozenset({"redis", "sidekiq", "resque", "redis-rails"}),
+}
+
+_GO_MAJOR_SUFFIX = re.compile(r"/v\d+$")
+
+
+def _candidates(ecosystem: str, name: str) -> Iterable[str]:
+    yield name
+    if ecosystem == "go":
+        # Módulos Go: github.com/jackc/pgx/v5 -> github.com/jackc/pgx
+        yield _GO_MAJOR_SUFFIX.sub("", name)
+
+
+def detect_backing_services(ecosystem: str, names: Iterable[str]) -> Tuple[Optional[str], bool]:
+    """
+    Retorna (engine do banco ou None, usa Redis) a partir das dependências
+    declaradas. Drivers explícitos têm precedência sobre ORMs genéricos.
+    """
+    databases = DATABASE_PACKAGES.get(ecosystem, {})
+    redis = REDIS_PACKAGES.get(ecosystem, frozenset())
+    engines = []
+    has_redis = False
+    for name in names:
+        for candidate in _candidates(ecosystem, name):
+            if candidate in databases:
+                engines.append(databases[candidate])
+            if candidate in redis:
+                has_redis = True
+
+    engine = next((e for e in engines if e != "sql"), "postgres" if engines else None)
+    return engine, has_redis
@@ -0,0 +1,5 @@
+"""
+Detectores de stack embutidos. Cada módulo expõe `detect(index)`, que recebe
+o DirectoryIndex do diretório e retorna um StackInfo (ou None).
+Os módulos só são importados quando o registro aciona o detector.
+"""
@@ -0,0 +1,18 @@
+from ..dependencies import detect_backing_services
+from ..manifests import go_mod_names
+from ..models import StackInfo
+from ..scanner import DirectoryIndex
+from ..versions import resolve_version
+
+def detect(index: DirectoryIndex) -> StackInfo:
+    """Heurística para projetos Go"""
+    modules = set(go_mod_names(index.file_path("go.mod"))) if index.has("go.mod") else set()
+    db_engine, has_redis = detect_backing_services("go", modules)
+    
+    return StackInfo(
+        name="go",
+        version=resolve_version("go", index),
+        has_db=db_engine is not None,
+        has_redis=has_redis,
+        details={"db_engine": db_engine} if db_engine else {}
+    )
@@ -0,0 +1,50 @@
+from itertools import chain
+
+from ..dependencies import detect_backing_services
+from ..manifests import gradle_names, maven_names
+from ..models import StackInfo
+from ..scanner import DirectoryIndex
+from ..versions import resolve_version
+
+def _is_spring_boot(name: str) -> bool:
+    return name == "org.springframework.boot" or name.startswith("spring-boot-")
+
+def detect(index: DirectoryIndex) -> StackInfo:
+    """Heurística para projetos Java (Maven/Gradle)"""
+    framework = None
+    
+    has_pom = index.has("pom.xml")
+    has_gradle = index.has("build.gradle")
+    
+    names = iter(())
+    if has_pom:
+        names = chain(names, maven_names(index.file_path("pom.xml")))
+    for gradle_file in ("build.gradle", "build.gradle.kts"):
+        if index.has(gradle_file):
+            names = chain(names, gradle_names(index.file_path(gradle_file)))
+            
+    dependencies = set(names)
+    if any(_is_spring_boot(name) for name in dependencies):
+        framework = "spring"
+    db_engine, has_redis = detect_backing_services("java", dependencies)
+
+    # Detectar Build Tool
+    build_tool = "maven"
+    if has_gradle or index.has("build.gradle.kts"):
+        build_tool = "gradle"
+        
+    details = {"build_tool": build_tool}
+    # Version catalog (gradle/libs.versions.toml) e wrapper ficam em gradle/
+    if build_tool == "gradle" and "gradle" in index.dirs:
+        details["gradle_dir"] = True
+    if db_engine:
+        details["db_engine"] = db_engine
+        
+    return StackInfo(
+        name="java",
+        version=resolve_version("java", index),
+        framework=framework,
+        has_db=db_engine is not None,
+        has_redis=has_redis,
+        details=details
+    )
@@ -0,0 +1,39 @@
+import json
+
+from ..dependencies import detect_backing_services
+from ..manifests import iter_lines
+from ..models import StackInfo
+from ..scanner import DirectoryIndex
+from ..versions import resolve_version
+
+def detect(index: DirectoryIndex) -> StackInfo:
+    """Heurística para projetos Node.js"""
+    framework = None
+    all_deps = {}
+    
+    if index.has("package.json"):
+        try:
+            data = json.loads("".join(iter_lines(index.file_path("package.json"))))
+            deps = data.get("dependencies", {})
+            dev_deps = data.get("devDependencies", {})
+            all_deps = {**deps, **dev_deps}
+            
+            if "next" in all_deps:
+                framework = "nextjs"
+            elif "express" in all_deps:
+                framework = "express"
+            elif "nestjs" in all_deps:
+                framework = "nestjs"
+        except json.JSONDecodeError:
+            pass
+            
+    db_engine, has_redis = detect_backing_services("node", all_deps)
+            
+    return StackInfo(
+        name="node",
+        version=resolve_version("node", index),
+        framework=framework,
+        has_db=db_engine is not None,
+        has_redis=has_redis,
+        details={"db_engine": db_engine} if db_engine else {}
+    )
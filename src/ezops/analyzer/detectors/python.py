@@ -0,0 +1,59 @@
+import re
+from itertools import chain
+from typing import Optional
+
+from ..dependencies import detect_backing_services
+from ..manifests import first_present, iter_lines, pyproject_names, requirements_txt_names
+from ..models import StackInfo
+from ..scanner import DirectoryIndex
+from ..versions import resolve_version
+
+_DJANGO_SETTINGS = re.compile(r"""DJANGO_SETTINGS_MODULE["']\s*,\s*["']([\w.]+)\.settings["']""")
+
+def _django_wsgi_module(index: DirectoryIndex) -> Optional[str]:
+    """Módulo WSGI do projeto Django (ex.: `mysite.wsgi`), lido do manage.py."""
+    if not index.has("manage.py"):
+        return None
+    for line in iter_lines(index.file_path("manage.py")):
+        match = _DJANGO_SETTINGS.search(line)
+        if match:
+            return f"{match.group(1)}.wsgi"
+    return None
+
+def _flask_app_module(index: DirectoryIndex) -> Optional[str]:
+    """Módulo que expõe o `app` do Flask, a partir do entrypoint presente (app.py ou main.py)."""
+    for module in ("app", "main"):
+        if index.has(f"{module}.py"):
+            return module
+    return None
+
+def detect(index: DirectoryIndex) -> StackInfo:
+    """Heurística para projetos Python"""
+    names = iter(())
+    if index.has("requirements.txt"):
+        names = chain(names, requirements_txt_names(index.file_path("requirements.txt")))
+    if index.has("pyproject.toml"):
+        names = chain(names, pyproject_names(index.file_path("pyproject.toml")))
+    dependencies = set(names)
+        
+    framework = first_present(dependencies, ("fastapi", "django", "flask"))
+    db_engine, has_redis = detect_backing_services("python", dependencies)
+    
+    details = {"db_engine": db_engine} if db_engine else {}
+    if framework == "django":
+        wsgi_module = _django_wsgi_module(index)
+        if wsgi_module:
+            details["wsgi_module"] = wsgi_module
+    elif framework == "flask":
+        app_module = _flask_app_module(index)
+        if app_module:
+            details["app_module"] = app_module
+    
+    return StackInfo(
+        name="python",
+        version=resolve_version("python", index),
+        framework=framework,
+        has_db=db_engine is not None,
+        has_redis=has_redis,
+        details=details
+    )
@@ -0,0 +1,21 @@
+from ..dependencies import detect_backing_services
+from ..manifests import first_present, gemfile_names
+from ..models import StackInfo
+from ..scanner import DirectoryIndex
+from ..versions import resolve_version
+
+def detect(index: DirectoryIndex) -> StackInfo:
+    """Heurística para projetos Ruby"""
+    gems = set(gemfile_names(index.file_path("Gemfile"))) if index.has("Gemfile") else set()
+    
+    framework = first_present(gems, ("rails", "sinatra"))
+    db_engine, has_redis = detect_backing_services("ruby", gems)
+            
+    return StackInfo(
+        name="ruby",
+        version=resolve_version("ruby", index),
+        framework=framework,
+        has_db=db_engine is not None,
+        has_redis=has_redis,
+        details={"db_engine": db_engine} if db_engine else {}
+    )
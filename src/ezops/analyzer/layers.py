@@ -0,0 +1,169 @@
+"""
+Estimativa de custo das camadas de um Dockerfile: quais camadas cada tipo
+de mudança típica invalida e quantos bytes do contexto cada COPY/ADD envia.
+"""
+import fnmatch
+import json
+import shlex
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from .context import ContextReport, IgnoreRule, is_ignored, subtree_sent_bytes
+
+# Mudanças típicas consideradas na estimativa
+BASE_IMAGE = "base_image"  # Nova versão/digest da imagem base
+DEPENDENCIES = "dependencies"  # Manifestos e lockfiles de dependências
+SOURCE = "source"  # Código-fonte da aplicação
+CHANGE_KINDS = (BASE_IMAGE, DEPENDENCIES, SOURCE)
+
+# Arquivos cuja mudança representa uma mudança de dependências
+DEPENDENCY_FILES = (
+    "requirements*.txt", "pyproject.toml", "poetry.lock", "Pipfile", "Pipfile.lock", "setup.py", "setup.cfg",
+    "package.json", "package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml",
+    "go.mod", "go.sum",
+    "pom.xml", "build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts", "gradle.properties",
+    "Gemfile", "Gemfile.lock",
+)
+
+
+@dataclass
+class Instruction:
+    line: int
+    command: str
+    arguments: str
+    flags: Dict[str, str] = field(default_factory=dict)
+    text: str = ""  # Instrução completa, como escrita no Dockerfile
+
+
+def parse_dockerfile(text: str) -> List[Instruction]:
+    """Instruções do Dockerfile, com continuações de linha (`\\`) unidas e comentários removidos."""
+    instructions = []
+    buffer, start = "", 0
+    for number, raw in enumerate(text.splitlines(), start=1):
+        line = raw.strip()
+        if not buffer and (not line or line.startswith("#")):
+            continue
+        if buffer and line.startswith("#"):
+            continue
+        if not buffer:
+            start = number
+        if line.endswith("\\"):
+            buffer += line[:-1] + " "
+            continue
+        buffer += line
+        command, _, arguments = buffer.partition(" ")
+        instructions.append(_with_flags(Instruction(start, command.upper(), arguments.strip(), text=buffer)))
+        buffer = ""
+    return instructions
+
+
+def _with_flags(instruction: Instruction) -> Instruction:
+    # Flags como --from=builder e --chown=app vêm antes dos argumentos
+    arguments = instruction.arguments
+    while arguments.startswith("--"):
+        flag, _, arguments = arguments.partition(" ")
+        name, _, value = flag[2:].partition("=")
+        instruction.flags[name] = value
+        arguments = arguments.lstrip()
+    instruction.arguments = arguments
+    return instruction
+
+
+def _copy_sources(instruction: Instruction) -> List[str]:
+    arguments = instruction.arguments
+    if arguments.startswith("["):
+        try:
+            parts = json.loads(arguments)
+        except ValueError:
+            parts = []
+    else:
+        try:
+            parts = shlex.split(arguments)
+        except ValueError:
+            parts = arguments.split()
+    return parts[:-1]
+
+
+def _source_kinds(source: str) -> Set[str]:
+    """Tipos de mudança que alteram o conteúdo copiado por uma fonte do COPY."""
+    name = source.rstrip("/").rsplit("/", 1)[-1]
+    if name in (".", "", "*"):
+        return {DEPENDENCIES, SOURCE}
+    if any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(pattern, name) for pattern in DEPENDENCY_FILES):
+        return {DEPENDENCIES}
+    return {SOURCE}
+
+
+def _copy_bytes(root: Path, sources: Sequence[str], report: ContextReport, rules: Sequence[IgnoreRule]) -> int:
+    total = 0
+    for source in sources:
+        source = source.strip("/") or "."
+        if source == ".":
+            return report.estimate.sent_bytes
+        for match in root.glob(source):
+            rel_path = match.relative_to(root).as_posix()
+            if is_ignored(rel_path, rules):
+                continue
+            if match.is_dir():
+                if rel_path in report.dir_bytes:
+                    total += report.dir_bytes[rel_path]
+                else:
+                    total += subtree_sent_bytes(root, rel_path, rules)
+            elif match.is_file():
+                total += match.stat().st_size
+    return total
+
+
+def estimate_layers(
+    dockerfile: str,
+    root,
+    report: Optional[ContextReport] = None,
+    rules: Sequence[IgnoreRule] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Para cada instrução, lista as mudanças típicas que invalidam a camada
+    (a invalidação se propaga para todas as instruções seguintes do stage)
+    e, para COPY/ADD do contexto, quantos bytes são copiados.
+    """
+    root = Path(root)
+    stages: Dict[str, Set[str]] = {}
+    layers = []
+    stage_name, stage_index, invalidated = None, -1, set()
+
+    for instruction in parse_dockerfile(dockerfile):
+        size = None
+        if instruction.command == "FROM":
+            parts = instruction.arguments.split()
+            stage_index += 1
+            stage_name = parts[2] if len(parts) >= 3 and parts[1].upper() == "AS" else str(stage_index)
+            # FROM de um stage anterior herda as invalidações dele
+            base = parts[0] if parts else ""
+            invalidated = set(stages[base]) if base in stages else {BASE_IMAGE}
+        elif instruction.command in ("COPY", "ADD"):
+            source_stage = instruction.flags.get("from")
+            if source_stage is not None:
+                invalidated = invalidated | stages.get(source_stage, {BASE_IMAGE})
+            else:
+                sources = _copy_sources(instruction)
+                for source in sources:
+                    invalidated = invalidated | _source_kinds(source)
+                if report is not None:
+                    size = _copy_bytes(root, sources, report, rules)
+
+        layers.append({
+            "line": instruction.line,
+            "stage": stage_name,
+            "instruction": instruction.text if len(instruction.text) <= 120 else instruction.text[:117] + "...",
+            "bytes": size,
+            "invalidated_by": [kind for kind in CHANGE_KINDS if kind in invalidated],
+        })
+        if stage_name is not None:
+            # Stages podem ser referenciados pelo nome ou pelo índice (--from=0)
+            stages[stage_name] = stages[str(stage_index)] = invalidated
+    return layers
+
+
+def rebuild_summary(layers: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Quantas instruções são reexecutadas para cada tipo de mudança."""
+    return {kind: sum(1 for layer in layers if kind in layer["invalidated_by"]) for kind in CHANGE_KINDS}
@@ -0,0 +1,167 @@
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+# Limite padrão de bytes lidos por manifesto (configurável via $EZOPS_MAX_MANIFEST_BYTES)
+MAX_MANIFEST_BYTES = 8 * 1024 * 1024
+
+# Tamanho máximo de cada leitura, para que linhas gigantes não estourem a memória
+_MAX_LINE_BYTES = 64 * 1024
+
+_REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_EGG_NAME = re.compile(r"#egg=([A-Za-z0-9][A-Za-z0-9._-]*)")
+_QUOTED = re.compile(r"""["']([^"']+)["']""")
+_TOML_KEY = re.compile(r"""^\s*["']?([A-Za-z0-9][A-Za-z0-9._-]*)["']?\s*=""")
+_GEM = re.compile(r"""^\s*gem\s*\(?\s*["']([^"']+)["']""")
+_ARTIFACT_ID = re.compile(r"<artifactId>\s*([^<\s]+)\s*</artifactId>")
+_GROUP_ID = re.compile(r"<groupId>\s*([^<\s]+)\s*</groupId>")
+_GRADLE_COORDINATE = re.compile(r"""["']([\w.\-]+):([\w.\-]+)(?::[^"']*)?["']""")
+_GRADLE_PLUGIN = re.compile(r"""\bid\s*\(?\s*["']([\w.\-]+)["']""")
+
+
+def normalize_name(name: str) -> str:
+    """Normaliza nomes de pacotes (PEP 503): `Flask_SQLAlchemy` -> `flask-sqlalchemy`."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def max_manifest_bytes() -> int:
+    """
+    Limite lido de $EZOPS_MAX_MANIFEST_BYTES na hora do uso; um valor
+    inválido cai no padrão em vez de quebrar todos os comandos.
+    """
+    try:
+        limit = int(os.environ.get("EZOPS_MAX_MANIFEST_BYTES", MAX_MANIFEST_BYTES))
+    except ValueError:
+        return MAX_MANIFEST_BYTES
+    return limit if limit > 0 else MAX_MANIFEST_BYTES
+
+
+def iter_lines(path: Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """
+    Lê o arquivo de forma incremental, sem carregá-lo inteiro na memória.
+    Para de ler ao atingir `max_bytes` (padrão: max_manifest_bytes()).
+    """
+    limit = max_manifest_bytes() if max_bytes is None else max_bytes
+    consumed = 0
+    with open(path, "rb") as f:
+        while consumed < limit:
+            raw = f.readline(min(_MAX_LINE_BYTES, limit - consumed))
+            if not raw:
+                return
+            consumed += len(raw)
+            yield raw.decode("utf-8", errors="ignore")
+
+
+def _requirement_name(spec: str) -> Optional[str]:
+    egg = _EGG_NAME.search(spec)
+    if egg:
+        return normalize_name(egg.group(1))
+    match = _REQUIREMENT_NAME.match(spec)
+    return normalize_name(match.group(1)) if match else None
+
+
+def requirements_txt_names(path: Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """Nomes das dependências de um requirements.txt."""
+    for line in iter_lines(path, max_bytes):
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("-") and "#egg=" not in line:
+            continue
+        name = _requirement_name(line)
+        if name:
+            yield name
+
+
+def pyproject_names(path: Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """
+    Nomes das dependências de um pyproject.toml (PEP 621 e Poetry),
+    extraídos linha a linha sem um parser TOML completo.
+    """
+    table = ""
+    in_array = False
+    for line in iter_lines(path, max_bytes):
+        stripped = line.split("#", 1)[0].strip()
+        if not stripped:
+            continue
+
+        if not in_array and stripped.startswith("["):
+            table = stripped.strip("[] ")
+            continue
+
+        if table.startswith("tool.poetry") and table.endswith("dependencies"):
+            match = _TOML_KEY.match(stripped)
+            if match and match.group(1).lower() != "python":
+                yield normalize_name(match.group(1))
+            continue
+
+        if not in_array:
+            # Só a linha `chave = [` separa no "="; as de continuação trazem
+            # especificadores de versão ("redis==5.0")
+            pep621 = table == "project" and re.match(r"^dependencies\s*=", stripped)
+            optional = table == "project.optional-dependencies" and "=" in stripped
+            if pep621 or optional:
+                stripped = stripped.split("=", 1)[1]
+                in_array = True
+
+        if in_array:
+            for spec in _QUOTED.findall(stripped):
+                name = _requirement_name(spec)
+                if name:
+                    yield name
+            # Só um "]" fora de aspas fecha o array ("uvicorn[standard]" não)
+            if "]" in _QUOTED.sub("", stripped):
+                in_array = False
+
+
+def gemfile_names(path: Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """Nomes das gems declaradas em um Gemfile."""
+    for line in iter_lines(path, max_bytes):
+        match = _GEM.match(line)
+        if match:
+            yield match.group(1).lower()
+
+
+def maven_names(path: Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """groupIds e artifactIds declarados em um pom.xml."""
+    for line in iter_lines(path, max_bytes):
+        for match in _GROUP_ID.finditer(line):
+            yield match.group(1)
+        for match in _ARTIFACT_ID.finditer(line):
+            yield match.group(1)
+
+
+def gradle_names(path: Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """Coordenadas (group e artifact) e ids de plugins de um build.gradle(.kts)."""
+    for line in iter_lines(path, max_bytes):
+        for group, artifact in _GRADLE_COORDINATE.findall(line):
+            yield group
+            yield artifact
+        for plugin_id in _GRADLE_PLUGIN.findall(line):
+            yield plugin_id
+
+
+def go_mod_names(path: Path, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """Caminhos dos módulos requeridos em um go.mod."""
+    in_block = False
+    for line in iter_lines(path, max_bytes):
+        fields = line.split("//", 1)[0].split()
+        if not fields:
+            continue
+        if in_block:
+            if fields[0] == ")":
+                in_block = False
+            else:
+                yield fields[0]
+        elif fields[0] == "require":
+            if fields[1:2] == ["("]:
+                in_block = True
+            elif len(fields) > 1:
+                yield fields[1]
+
+
+def first_present(names: Iterable[str], candidates: Sequence[str]) -> Optional[str]:
+    """Retorna o primeiro candidato (em ordem de prioridade) contido em `names`."""
+    names = set(names)
+    return next((candidate for candidate in candidates if candidate in names), None)
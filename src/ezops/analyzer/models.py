@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Any, List, Optional
 
 @dataclass
 class StackInfo:
@@ -9,7 +9,19 @@ class StackInfo:
     has_db: bool = False
     has_redis: bool = False
     details: Dict[str, Any] = None
+    confidence: float = 1.0  # Fração da evidência total que aponta para esta stack
+    components: List["StackInfo"] = field(default_factory=list)  # Stacks secundárias (polyglot)
     
     def __post_init__(self):
         if self.details is None:
             self.details = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa a stack em um dicionário compatível com JSON."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StackInfo":
+        data = dict(data)
+        components = [cls.from_dict(c) for c in data.pop("components", [])]
+        return cls(components=components, **data)
@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .cache import AnalysisCache
+from .engine import analyze_index
+from .models import StackInfo
+from .registry import registry
+from .scanner import DirectoryIndex, scan_directory
+
+# Diretórios que nunca contêm serviços (dependências, builds, VCS)
+IGNORED_DIRS = frozenset({
+    "node_modules",
+    ".git",
+    "venv",
+    ".venv",
+    "target",
+    "dist",
+    "__pycache__",
+    ".ezops",
+})
+
+
+def _discover_indexes(root, ignore: Iterable[str]) -> List[DirectoryIndex]:
+    ignore = frozenset(ignore)
+    manifests = registry.manifests()
+    found = []
+    pending = [Path(root)]
+
+    while pending:
+        index = scan_directory(pending.pop())
+        if index is None:
+            continue
+
+        # Um diretório com manifesto é a raiz de um serviço
+        if index.has(*manifests):
+            found.append(index)
+
+        # Links para diretórios não são seguidos: um `..` (ou dois links que
+        # apontam um para o outro) faria a busca rodar em círculos
+        for name in index.dirs - index.dir_links:
+            if name not in ignore:
+                pending.append(index.path / name)
+
+    return sorted(found, key=lambda i: str(i.path))
+
+
+def discover_services(root, ignore: Iterable[str] = IGNORED_DIRS) -> List[Path]:
+    """
+    Procura recursivamente as raízes de serviços (diretórios com manifesto)
+    a partir de `root`, ignorando diretórios de dependências e build.
+    """
+    return [index.path for index in _discover_indexes(root, ignore)]
+
+
+def analyze_monorepo(
+    root,
+    max_workers: Optional[int] = None,
+    ignore: Iterable[str] = IGNORED_DIRS,
+    cache: Optional[AnalysisCache] = None,
+) -> Dict[str, StackInfo]:
+    """
+    Descobre todos os serviços do monorepo e analisa cada um em paralelo.
+    Retorna um dicionário {caminho do serviço: StackInfo} apenas com as
+    stacks detectadas.
+    """
+    indexes = _discover_indexes(root, ignore)
+    if not indexes:
+        return {}
+
+    workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(workers, len(indexes))) as pool:
+        stacks = pool.map(partial(analyze_index, cache=cache), indexes)
+
+    return {
+        str(index.path): stack
+        for index, stack in zip(indexes, stacks)
+        if stack is not None
+    }
@@ -0,0 +1,196 @@
+import importlib
+import logging
+import math
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional
+
+from .models import StackInfo
+from .scanner import DirectoryIndex
+
+logger = logging.getLogger(__name__)
+
+# Grupo de entry points para detectores distribuídos em pacotes separados
+ENTRY_POINT_GROUP = "ezops.detectors"
+
+DetectFunction = Callable[[DirectoryIndex], Optional[StackInfo]]
+
+# Pesos da evidência usada para ranquear stacks em projetos polyglot
+MANIFEST_WEIGHT = 3.0
+ENTRYPOINT_WEIGHT = 2.0
+FRAMEWORK_WEIGHT = 2.0
+
+# Componentes secundários abaixo desta confiança são descartados como ruído
+MIN_COMPONENT_CONFIDENCE = 0.15
+
+
+@dataclass(frozen=True)
+class Detector:
+    """
+    Declaração de um detector de stack. `target` aponta para a função
+    `detect(index)` no formato "modulo:funcao" e só é importado quando um
+    diretório contém os manifestos/extensões declarados.
+    """
+    name: str
+    target: str
+    manifests: FrozenSet[str] = frozenset()
+    extensions: FrozenSet[str] = frozenset()
+    entrypoints: FrozenSet[str] = frozenset()  # Arquivos típicos de entrada da aplicação
+    priority: int = 100  # Menor valor = maior prioridade (desempate)
+
+    def matches(self, index: DirectoryIndex) -> bool:
+        return index.has(*self.manifests) or any(index.count(ext) for ext in self.extensions)
+
+    def load(self) -> DetectFunction:
+        module_name, _, attr = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), attr or "detect")
+
+    def score(self, index: DirectoryIndex, stack: StackInfo) -> float:
+        """Pontua a evidência da stack no diretório (manifestos, entrypoints, arquivos, framework)."""
+        score = MANIFEST_WEIGHT * sum(1 for name in self.manifests if index.has(name))
+        score += ENTRYPOINT_WEIGHT * sum(1 for name in self.entrypoints if index.has(name))
+        score += sum(math.log2(1 + index.count(ext)) for ext in self.extensions)
+        if stack.framework:
+            score += FRAMEWORK_WEIGHT
+        return score
+
+
+BUILTIN_DETECTORS = (
+    Detector(
+        name="node",
+        target="ezops.analyzer.detectors.node:detect",
+        manifests=frozenset({"package.json"}),
+        entrypoints=frozenset({
+            "server.js", "index.js", "app.js", "main.js", "server.ts", "main.ts",
+            "next.config.js", "next.config.mjs", "next.config.ts", "nest-cli.json",
+        }),
+        priority=10,
+    ),
+    Detector(
+        name="python",
+        target="ezops.analyzer.detectors.python:detect",
+        manifests=frozenset({"requirements.txt", "pyproject.toml"}),
+        extensions=frozenset({".py"}),
+        entrypoints=frozenset({"main.py", "app.py", "manage.py", "wsgi.py", "asgi.py"}),
+        priority=20,
+    ),
+    Detector(
+        name="go",
+        target="ezops.analyzer.detectors.go:detect",
+        manifests=frozenset({"go.mod"}),
+        extensions=frozenset({".go"}),
+        entrypoints=frozenset({"main.go"}),
+        priority=30,
+    ),
+    Detector(
+        name="java",
+        target="ezops.analyzer.detectors.java:detect",
+        manifests=frozenset({"pom.xml", "build.gradle", "build.gradle.kts"}),
+        entrypoints=frozenset({"mvnw", "gradlew", "settings.gradle", "settings.gradle.kts"}),
+        priority=40,
+    ),
+    Detector(
+        name="ruby",
+        target="ezops.analyzer.detectors.ruby:detect",
+        manifests=frozenset({"Gemfile"}),
+        extensions=frozenset({".rb"}),
+        entrypoints=frozenset({"config.ru", "app.rb", "Rakefile", "Gemfile.lock"}),
+        priority=50,
+    ),
+)
+
+
+def _iter_entry_points():
+    from importlib.metadata import entry_points
+
+    if sys.version_info >= (3, 10):
+        return entry_points(group=ENTRY_POINT_GROUP)
+    return entry_points().get(ENTRY_POINT_GROUP, [])
+
+
+class DetectorRegistry:
+    """Registro de detectores, ordenados por prioridade."""
+
+    def __init__(self, detectors=(), load_entry_points: bool = True):
+        self._detectors: Dict[str, Detector] = {}
+        self._functions: Dict[str, DetectFunction] = {}
+        self._entry_points_pending = load_entry_points
+        for detector in detectors:
+            self.register(detector)
+
+    def register(self, detector: Detector):
+        """Registra (ou substitui, pelo nome) um detector."""
+        self._detectors[detector.name] = detector
+        self._functions.pop(detector.name, None)
+
+    def _load_entry_points(self):
+        # Os entry points só são lidos no primeiro uso, nunca na carga da CLI
+        if not self._entry_points_pending:
+            return
+        self._entry_points_pending = False
+        for entry_point in _iter_entry_points():
+            try:
+                detector = entry_point.load()
+            except Exception as e:
+                logger.warning(f"Falha ao carregar o detector {entry_point.name}: {e}")
+                continue
+            if isinstance(detector, Detector):
+                self.register(detector)
+            else:
+                logger.warning(f"Entry point {entry_point.name} não é um Detector")
+
+    def detectors(self) -> List[Detector]:
+        self._load_entry_points()
+        return sorted(self._detectors.values(), key=lambda d: d.priority)
+
+    def manifests(self) -> FrozenSet[str]:
+        """Todos os manifestos declarados pelos detectores registrados."""
+        return frozenset().union(*(d.manifests for d in self.detectors()))
+
+    def entrypoints(self) -> FrozenSet[str]:
+        """Todos os entrypoints declarados pelos detectores registrados."""
+        return frozenset().union(*(d.entrypoints for d in self.detectors()))
+
+    def candidates(self, index: DirectoryIndex) -> List[Detector]:
+        """Detectores relevantes para o diretório, em ordem de prioridade."""
+        return [d for d in self.detectors() if d.matches(index)]
+
+    def _load_function(self, detector: Detector) -> DetectFunction:
+        function = self._functions.get(detector.name)
+        if function is None:
+            function = self._functions[detector.name] = detector.load()
+        return function
+
+    def analyze(self, index: DirectoryIndex) -> List[StackInfo]:
+        """
+        Aciona apenas os detectores relevantes e retorna todas as stacks
+        encontradas, ranqueadas pela evidência, com `confidence` preenchido.
+        """
+        scored = []
+        for detector in self.candidates(index):
+            stack = self._load_function(detector)(index)
+            if stack is not None:
+                scored.append((detector.score(index, stack), detector.priority, stack))
+        if not scored:
+            return []
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        total = sum(score for score, _, _ in scored)
+        ranked = []
+        for score, _, stack in scored:
+            stack.confidence = round(score / total, 2) if total else round(1 / len(scored), 2)
+            if not ranked or stack.confidence >= MIN_COMPONENT_CONFIDENCE:
+                ranked.append(stack)
+        return ranked
+
+    def detect(self, index: DirectoryIndex) -> Optional[StackInfo]:
+        """Retorna a stack principal, com as secundárias em `components`."""
+        ranked = self.analyze(index)
+        if not ranked:
+            return None
+        primary = ranked[0]
+        primary.components = ranked[1:]
+        return primary
+
+
+registry = DetectorRegistry(BUILTIN_DETECTORS)
@@ -0,0 +1,70 @@
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+# Arquivos que declaram apenas a versão da runtime
+VERSION_FILES = frozenset({
+    ".python-version",
+    "runtime.txt",
+    ".nvmrc",
+    ".node-version",
+    ".java-version",
+    ".ruby-version",
+    ".tool-versions",
+})
+
+
+@dataclass
+class DirectoryIndex:
+    """Índice em memória de um diretório, construído em uma única passada de scandir."""
+    path: Path
+    files: Dict[str, os.DirEntry] = field(default_factory=dict)
+    dirs: Set[str] = field(default_factory=set)
+    # Subdiretórios que são links simbólicos (também presentes em `dirs`)
+    dir_links: Set[str] = field(default_factory=set)
+    extensions: Counter = field(default_factory=Counter)
+
+    def has(self, *names: str) -> bool:
+        """Retorna True se qualquer um dos arquivos informados existir."""
+        return any(name in self.files for name in names)
+
+    def count(self, extension: str) -> int:
+        return self.extensions[extension]
+
+    def file_path(self, name: str) -> Path:
+        return self.path / name
+
+
+def scan_directory(directory_path) -> Optional[DirectoryIndex]:
+    """
+    Percorre o diretório (sem recursão) uma única vez com os.scandir e indexa
+    arquivos, subdiretórios e contagem de extensões.
+    Retorna None se o caminho não for um diretório.
+    """
+    path = Path(directory_path)
+    index = DirectoryIndex(path=path)
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        index.dirs.add(entry.name)
+                        if entry.is_symlink():
+                            index.dir_links.add(entry.name)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                index.files[entry.name] = entry
+                ext = os.path.splitext(entry.name)[1]
+                if ext:
+                    index.extensions[ext] += 1
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    return index
@@ -0,0 +1,230 @@
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .manifests import iter_lines
+from .scanner import DirectoryIndex
+
+# Versões usadas quando o projeto não declara nenhuma
+DEFAULT_VERSIONS = {
+    "python": "3.9",
+    "node": "18",
+    "go": "1.20",
+    "java": "17",
+    "ruby": "3.2",
+}
+
+# Arquivos consultados para resolver a versão de cada stack
+VERSION_SOURCES = {
+    "python": (".python-version", ".tool-versions", "pyproject.toml", "runtime.txt"),
+    "node": (".nvmrc", ".node-version", ".tool-versions", "package.json"),
+    "go": ("go.mod", ".tool-versions"),
+    "java": (".java-version", ".tool-versions", "pom.xml", "build.gradle", "build.gradle.kts"),
+    "ruby": (".ruby-version", ".tool-versions", "Gemfile"),
+}
+
+# Nome do plugin do asdf (.tool-versions) para cada stack
+_ASDF_PLUGINS = {
+    "python": "python",
+    "node": "nodejs",
+    "go": "golang",
+    "java": "java",
+    "ruby": "ruby",
+}
+
+# Codinomes das versões LTS do Node (.nvmrc com "lts/<nome>")
+_NODE_LTS = {
+    "argon": "4", "boron": "6", "carbon": "8", "dubnium": "10", "erbium": "12",
+    "fermium": "14", "gallium": "16", "hydrogen": "18", "iron": "20", "jod": "22",
+}
+
+_VERSION = re.compile(r"(\d+)(?:\.(\d+))?")
+_LOWER_BOUND_OPS = ("==", "~=", ">=", "^", "~>", "~", "=", ">")
+_REQUIRES_PYTHON = re.compile(r"""^\s*requires-python\s*=\s*["']([^"']+)["']""")
+_POETRY_PYTHON = re.compile(r"""^\s*python\s*=\s*["']([^"']+)["']""")
+_GO_DIRECTIVE = re.compile(r"^\s*go\s+(\d+\.\d+)")
+_GO_TOOLCHAIN = re.compile(r"^\s*toolchain\s+go(\d+\.\d+)")
+_MAVEN_JAVA = re.compile(
+    r"<(?:java\.version|maven\.compiler\.release|maven\.compiler\.source|release)>\s*([\d.]+)\s*<"
+)
+_GRADLE_JAVA = (
+    re.compile(r"JavaLanguageVersion\.of\(\s*(\d+)\s*\)"),
+    re.compile(r"jvmToolchain\(\s*(\d+)\s*\)"),
+    re.compile(r"JavaVersion\.VERSION_(\d+(?:_\d+)?)"),
+    re.compile(r"""sourceCompatibility\s*=\s*["']?([\d.]+)"""),
+)
+_GEMFILE_RUBY = re.compile(r"""^\s*ruby\s+["']([^"']+)["']""")
+
+
+def _format(version: str, parts: int) -> Optional[str]:
+    """Reduz `3.11.4` para `3.11` (parts=2) ou `18.17.0` para `18` (parts=1)."""
+    match = _VERSION.search(version)
+    if not match:
+        return None
+    major, minor = match.group(1), match.group(2)
+    if parts == 1 or minor is None:
+        return major
+    return f"{major}.{minor}"
+
+
+def _lower_bound(spec: str, parts: int) -> Optional[str]:
+    """Extrai a versão mínima de uma restrição (`>=3.10,<4`, `^20.1`, `~> 3.1`, `18.x`)."""
+    for clause in re.split(r"[,|]+|\s+(?=[<>=~^])", spec):
+        clause = clause.strip()
+        if not clause or clause.startswith(("<", "!")):
+            continue
+        for op in _LOWER_BOUND_OPS:
+            if clause.startswith(op):
+                clause = clause[len(op):]
+                break
+        version = _format(clause.strip(), parts)
+        if version:
+            return version
+    return None
+
+
+def _first_line(path: Path) -> str:
+    for line in iter_lines(path):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            return line
+    return ""
+
+
+def _first_match(path: Path, patterns: Iterable[re.Pattern]) -> Optional[str]:
+    for line in iter_lines(path):
+        for pattern in patterns:
+            match = pattern.search(line)
+            if match:
+                return match.group(1)
+    return None
+
+
+def _tool_versions(path: Path, stack: str, parts: int) -> Optional[str]:
+    plugin = _ASDF_PLUGINS[stack]
+    for line in iter_lines(path):
+        fields = line.split()
+        if len(fields) >= 2 and fields[0] == plugin:
+            return _format(fields[1], parts)
+    return None
+
+
+def _python_version(path: Path, name: str) -> Optional[str]:
+    if name == ".python-version":
+        return _format(_first_line(path), 2)
+    if name == ".tool-versions":
+        return _tool_versions(path, "python", 2)
+    if name == "pyproject.toml":
+        spec = _first_match(path, (_REQUIRES_PYTHON,)) or _first_match(path, (_POETRY_PYTHON,))
+        return _lower_bound(spec, 2) if spec else None
+    if name == "runtime.txt":
+        return _format(_first_line(path), 2)
+    return None
+
+
+def _node_version(path: Path, name: str) -> Optional[str]:
+    if name in (".nvmrc", ".node-version"):
+        value = _first_line(path).lower()
+        if value.startswith("lts/"):
+            return _NODE_LTS.get(value[4:])
+        return _format(value, 1)
+    if name == ".tool-versions":
+        return _tool_versions(path, "node", 1)
+    if name == "package.json":
+        try:
+            data = json.loads("".join(iter_lines(path)))
+        except json.JSONDecodeError:
+            return None
+        engines = data.get("engines") if isinstance(data, dict) else None
+        spec = engines.get("node") if isinstance(engines, dict) else None
+        return _lower_bound(spec, 1) if isinstance(spec, str) else None
+    return None
+
+
+def _go_version(path: Path, name: str) -> Optional[str]:
+    if name == "go.mod":
+        return _first_match(path, (_GO_TOOLCHAIN,)) or _first_match(path, (_GO_DIRECTIVE,))
+    if name == ".tool-versions":
+        return _tool_versions(path, "go", 2)
+    return None
+
+
+def _java_major(version: Optional[str]) -> Optional[str]:
+    if not version:
+        return None
+    version = version.replace("_", ".")
+    # Java 8 e anteriores usam o formato 1.x
+    if version.startswith("1."):
+        version = version[2:]
+    return _format(version, 1)
+
+
+def _java_version(path: Path, name: str) -> Optional[str]:
+    if name == ".java-version":
+        return _java_major(_first_line(path))
+    if name == ".tool-versions":
+        for line in iter_lines(path):
+            fields = line.split()
+            if len(fields) >= 2 and fields[0] == "java":
+                # ex.: temurin-17.0.2+8
+                return _java_major(fields[1].rsplit("-", 1)[-1])
+        return None
+    if name == "pom.xml":
+        return _java_major(_first_match(path, (_MAVEN_JAVA,)))
+    if name.startswith("build.gradle"):
+        return _java_major(_first_match(path, _GRADLE_JAVA))
+    return None
+
+
+def _ruby_version(path: Path, name: str) -> Optional[str]:
+    if name == ".ruby-version":
+        return _format(_first_line(path), 2)
+    if name == ".tool-versions":
+        return _tool_versions(path, "ruby", 2)
+    if name == "Gemfile":
+        spec = _first_match(path, (_GEMFILE_RUBY,))
+        return _lower_bound(spec, 2) if spec else None
+    return None
+
+
+_RESOLVERS: Dict[str, Callable[[Path, str], Optional[str]]] = {
+    "python": _python_version,
+    "node": _node_version,
+    "go": _go_version,
+    "java": _java_version,
+    "ruby": _ruby_version,
+}
+
+
+@lru_cache(maxsize=1024)
+def _resolve(stack: str, directory: str, signature: Tuple) -> Optional[str]:
+    resolver = _RESOLVERS[stack]
+    for name, _size, _mtime_ns in signature:
+        version = resolver(Path(directory) / name, name)
+        if version:
+            return version
+    return None
+
+
+def resolve_version(stack: str, index: DirectoryIndex) -> Optional[str]:
+    """
+    Resolve a versão da runtime declarada pelo projeto (ex.: requires-python,
+    .nvmrc, diretiva `go` do go.mod, toolchain Maven/Gradle, .ruby-version).
+    O resultado é memoizado por diretório e invalidado quando os arquivos mudam.
+    Retorna a versão padrão da stack se nada for declarado.
+    """
+    signature = []
+    for name in VERSION_SOURCES.get(stack, ()):
+        entry = index.files.get(name)
+        if entry is not None:
+            st = entry.stat()
+        else:
+            continue
+        signature.append((name, st.st_size, st.st_mtime_ns))
+
+    version = None
+    if signature:
+        version = _resolve(stack, str(index.path), tuple(signature))
+    return version or DEFAULT_VERSIONS.get(stack)
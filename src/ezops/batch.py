@@ -0,0 +1,104 @@
+"""
+Geração em lote: analisa e gera Dockerfile/docker-compose (e opcionalmente
+Terraform) para muitos projetos em paralelo, usando um pool de processos.
+"""
+import glob
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+def expand_paths(patterns: Iterable[str], paths_file: Optional[str] = None) -> List[str]:
+    """Expande caminhos/globs (e um arquivo com um caminho por linha) em diretórios únicos."""
+    patterns = list(patterns)
+    if paths_file:
+        lines = Path(paths_file).read_text().splitlines()
+        patterns.extend(line.strip() for line in lines if line.strip() and not line.startswith("#"))
+
+    found = []
+    seen = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+        for match in sorted(matches):
+            key = os.path.abspath(match)
+            if os.path.isdir(match) and key not in seen:
+                seen.add(key)
+                found.append(match)
+    return found
+
+
+def process_project(path: str, iac: bool = False, provider: str = "aws", use_cache: bool = True) -> Dict:
+    """
+    Executa análise + geração para um projeto. Roda dentro de um processo do
+    pool, por isso nunca levanta exceção: falhas viram `status: error`.
+    """
+    start = time.perf_counter()
+    result = {"path": path, "status": "ok", "stack": None, "files": [], "error": None}
+    try:
+        from ezops.analyzer.cache import AnalysisCache, default_cache_dir
+        from ezops.analyzer.engine import analyze_directory
+        from ezops.generator import engine as generator_engine
+
+        # Os workers não escrevem no terminal; o progresso é exibido pelo processo pai
+        generator_engine.console.quiet = True
+
+        cache = AnalysisCache(default_cache_dir(path)) if use_cache else None
+        stack = analyze_directory(path, cache=cache)
+        if cache is not None:
+            cache.save()
+
+        if stack is None:
+            result["status"] = "skipped"
+            result["error"] = "Não foi possível detectar a stack do projeto"
+        else:
+            result["stack"] = stack.to_dict()
+            result["files"] = [str(p) for p in generator_engine.generate_files(path, stack)]
+            if iac:
+                from ezops.generator import iac_generator
+                result["files"] += [str(p) for p in iac_generator.generate_terraform(path, stack, provider)]
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+
+    result["duration_s"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def run_batch(
+    paths: List[str],
+    iac: bool = False,
+    provider: str = "aws",
+    use_cache: bool = True,
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+) -> Dict:
+    """
+    Processa todos os projetos em um ProcessPoolExecutor e retorna o resumo
+    (serializável em JSON). `on_result` é chamado a cada projeto concluído.
+    """
+    start = time.perf_counter()
+    results = []
+    workers = min(max_workers or os.cpu_count() or 1, max(len(paths), 1))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(process_project, path, iac, provider, use_cache) for path in paths]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    results.sort(key=lambda r: r["path"])
+    return {
+        "total": len(results),
+        "succeeded": sum(1 for r in results if r["status"] == "ok"),
+        "skipped": sum(1 for r in results if r["status"] == "skipped"),
+        "failed": sum(1 for r in results if r["status"] == "error"),
+        "workers": workers,
+        "duration_s": round(time.perf_counter() - start, 4),
+        "results": results,
+    }
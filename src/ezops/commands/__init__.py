@@ -0,0 +1,5 @@
+"""
+Implementação dos comandos da CLI. Cada módulo é importado apenas quando o
+comando correspondente é executado, mantendo `ezops --help` e o shell
+completion rápidos.
+"""
@@ -0,0 +1,135 @@
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.table import Table
+
+from ezops.timings import phase, timed_import
+from .common import analyze_services, console
+
+# Rótulos das mudanças típicas usadas na estimativa de camadas
+CHANGE_LABELS = {
+    "base_image": "imagem base",
+    "dependencies": "dependências",
+    "source": "código",
+}
+
+def _dockerfile_source(path: Path, stack_info):
+    """Dockerfile do projeto ou, se não existir, a prévia do que o `ezops init` geraria."""
+    dockerfile = path / "Dockerfile"
+    if dockerfile.is_file():
+        return "Dockerfile", dockerfile.read_text(errors="ignore")
+    engine = timed_import("ezops.generator.engine")
+    context = engine.build_context(stack_info)
+    if not context.get("template"):
+        return None, ""
+    rendering = timed_import("ezops.generator.rendering")
+    return "prévia (ezops init)", rendering.render(context["template"], **context)
+
+def cost_report(path: str, stack_info, top: int = 10, workers: Optional[int] = None) -> dict:
+    """Custo do build: contexto enviado ao daemon e invalidação de camadas por tipo de mudança."""
+    context = timed_import("ezops.analyzer.context")
+    layers_module = timed_import("ezops.analyzer.layers")
+    root = Path(path)
+
+    with phase("contexto"):
+        rules = context.load_dockerignore(root)
+        report = context.walk_context(root, rules, top=top, max_workers=workers)
+
+    source, dockerfile = _dockerfile_source(root, stack_info)
+    layers = layers_module.estimate_layers(dockerfile, root, report, rules) if dockerfile else []
+    return {
+        "dockerignore": bool(rules),
+        "context": report.to_dict(top),
+        "dockerfile": source,
+        "layers": layers,
+        "rebuilds": layers_module.rebuild_summary(layers),
+    }
+
+def _print_cost(cost: dict):
+    format_size = timed_import("ezops.analyzer.context").format_size
+    context = cost["context"]
+
+    if not cost["dockerignore"]:
+        console.print("[yellow]⚠️ Sem .dockerignore: todo o diretório é enviado ao daemon (rode `ezops init`)[/yellow]")
+    console.print(
+        f"[bold blue]📦 Contexto de build:[/bold blue] {format_size(context['sent_bytes'])} "
+        f"({context['sent_files']} arquivos) de {format_size(context['total_bytes'])} "
+        f"({context['total_files']} arquivos) no diretório"
+    )
+
+    for title, key in (("Maiores diretórios", "largest_dirs"), ("Maiores arquivos", "largest_files")):
+        if not context[key]:
+            continue
+        table = Table(title=title, title_justify="left")
+        table.add_column("Caminho")
+        table.add_column("Tamanho", justify="right")
+        for item in context[key]:
+            table.add_row(item["path"], format_size(item["bytes"]))
+        console.print(table)
+
+    if not cost["layers"]:
+        return
+    table = Table(title=f"Camadas — {cost['dockerfile']}", title_justify="left")
+    table.add_column("Linha", justify="right")
+    table.add_column("Instrução")
+    table.add_column("Contexto", justify="right")
+    table.add_column("Invalidada por")
+    for layer in cost["layers"]:
+        table.add_row(
+            str(layer["line"]),
+            layer["instruction"],
+            format_size(layer["bytes"]) if layer["bytes"] is not None else "",
+            ", ".join(CHANGE_LABELS[kind] for kind in layer["invalidated_by"]),
+        )
+    console.print(table)
+
+    total = len(cost["layers"])
+    for kind, count in cost["rebuilds"].items():
+        console.print(f"[dim]🔁 Mudança em {CHANGE_LABELS[kind]}: {count} de {total} instruções reexecutadas[/dim]")
+
+def run(
+    path: str,
+    cost: bool,
+    json_output: bool,
+    max_context_mb: Optional[float],
+    top: int,
+    workers: Optional[int],
+    no_cache: bool,
+):
+    # No modo JSON só o documento final vai para o stdout
+    quiet = console.quiet
+    console.quiet = quiet or json_output
+    try:
+        services = analyze_services(path, recursive=False, use_cache=not no_cache)
+        stack_info = services.get(path)
+        result = {"path": path, "stack": stack_info.to_dict() if stack_info else None}
+
+        if stack_info is None:
+            console.print("[bold red]❌ Não foi possível detectar a stack do projeto.[/bold red]")
+        else:
+            console.print(f"[bold green]✅ Stack detectada:[/bold green] {stack_info.name} (v{stack_info.version})")
+            for component in stack_info.components:
+                console.print(f"[bold green]🧩 Componente:[/bold green] {component.name} ({component.confidence:.0%})")
+
+        failed = stack_info is None
+        if stack_info is not None and (cost or max_context_mb is not None):
+            result["cost"] = cost_report(path, stack_info, top=top, workers=workers)
+            _print_cost(result["cost"])
+
+            # Gate para CI: falha se o contexto enviado passar do limite
+            if max_context_mb is not None:
+                limit = int(max_context_mb * 1024 * 1024)
+                passed = result["cost"]["context"]["sent_bytes"] <= limit
+                result["gate"] = {"max_context_bytes": limit, "passed": passed}
+                if not passed:
+                    failed = True
+                    console.print(f"[bold red]❌ Contexto de build acima do limite de {max_context_mb:g} MB[/bold red]")
+    finally:
+        console.quiet = quiet
+
+    if json_output:
+        typer.echo(json.dumps(result, indent=2, ensure_ascii=False))
+    if failed:
+        raise typer.Exit(code=1)
@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
+from ezops.batch import expand_paths, run_batch
+from ezops.timings import phase
+from .common import console
+
+def run(
+    patterns: List[str],
+    paths_file: Optional[str],
+    iac: bool,
+    provider: str,
+    workers: Optional[int],
+    summary: str,
+    no_cache: bool,
+):
+    paths = expand_paths(patterns, paths_file)
+    if not paths:
+        console.print("[bold red]❌ Nenhum diretório encontrado para processar.[/bold red]")
+        raise typer.Exit(code=1)
+        
+    console.print(f"[bold blue]🚀 EzOps batch:[/bold blue] {len(paths)} projeto(s)")
+    
+    progress = Progress(
+        TextColumn("[bold blue]Gerando"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    )
+    
+    with progress, phase("batch"):
+        task = progress.add_task("batch", total=len(paths))
+        
+        def on_result(result: dict):
+            if result["status"] == "ok":
+                stack = result["stack"]
+                progress.console.print(f"[green]✅ {result['path']}[/green] {stack['name']} ({result['duration_s']:.2f}s)")
+            elif result["status"] == "skipped":
+                progress.console.print(f"[yellow]⚠️ {result['path']}[/yellow] {result['error']}")
+            else:
+                progress.console.print(f"[red]❌ {result['path']}[/red] {result['error']}")
+            progress.advance(task)
+            
+        report = run_batch(
+            paths,
+            iac=iac,
+            provider=provider.lower(),
+            use_cache=not no_cache,
+            max_workers=workers,
+            on_result=on_result,
+        )
+        
+    Path(summary).write_text(json.dumps(report, indent=2))
+    console.print(
+        f"[bold green]✨ {report['succeeded']} ok[/bold green], "
+        f"[yellow]{report['skipped']} ignorado(s)[/yellow], "
+        f"[red]{report['failed']} falha(s)[/red] em {report['duration_s']:.2f}s "
+        f"— resumo em [bold]{summary}[/bold]"
+    )
+    
+    if report["failed"]:
+        raise typer.Exit(code=1)
@@ -0,0 +1,22 @@
+from rich.console import Console
+
+from ezops.timings import phase, timed_import
+
+console = Console()
+
+def analyze_services(path: str, recursive: bool, use_cache: bool = True) -> dict:
+    """Retorna {diretório: StackInfo} para o projeto (ou todos os serviços do monorepo)."""
+    cache_module = timed_import("ezops.analyzer.cache")
+    cache = cache_module.AnalysisCache(cache_module.default_cache_dir(path)) if use_cache else None
+    
+    with phase("análise"):
+        if recursive:
+            services = timed_import("ezops.analyzer.monorepo").analyze_monorepo(path, cache=cache)
+        else:
+            stack_info = timed_import("ezops.analyzer.engine").analyze_directory(path, cache=cache)
+            services = {path: stack_info} if stack_info else {}
+        
+    if cache is not None:
+        cache.save()
+        console.print(f"[dim]💾 Cache de análise: {cache.hits} hit(s), {cache.misses} miss(es)[/dim]")
+    return services
@@ -0,0 +1,65 @@
+import typer
+
+from ezops.timings import phase, timed_import
+from .common import analyze_services, console
+
+def run(
+    path: str,
+    provider: str,
+    recursive: bool,
+    no_cache: bool,
+    force: bool = False,
+    diff: bool = False,
+    workload: str = "general",
+    scale: bool = False,
+    bake: bool = False,
+    target: str = "vm",
+):
+    console.print(f"[bold blue]🚀 Iniciando EzOps IaC Generator no diretório:[/bold blue] {path}")
+    console.print(f"[bold blue]☁️  Provedor selecionado:[/bold blue] {provider.upper()}")
+
+    sizing = timed_import("ezops.generator.sizing")
+    workload = workload.lower()
+    if workload not in sizing.WORKLOADS:
+        console.print(f"[bold red]❌ Workload inválido:[/bold red] {workload}. Escolha {', '.join(sizing.WORKLOADS)}.")
+        raise typer.Exit(code=1)
+    
+    services = analyze_services(path, recursive, use_cache=not no_cache)
+    
+    if not services:
+        console.print("[bold red]❌ Não foi possível detectar a stack do projeto para IaC.[/bold red]")
+        raise typer.Exit(code=1)
+        
+    iac_generator = timed_import("ezops.generator.iac_generator")
+    for service_path, stack_info in services.items():
+        if recursive:
+            console.print(f"[bold blue]📦 Serviço:[/bold blue] {service_path}")
+        console.print(f"[bold green]✅ Stack detectada para IaC:[/bold green] {stack_info.name} (v{stack_info.version})")
+        
+        try:
+            if provider.lower() in iac_generator.SUPPORTED_PROVIDERS and target.lower() == "container":
+                container = sizing.container_size(provider.lower(), stack_info, workload)
+                console.print(f"[bold blue]📐 Container dimensionado:[/bold blue] {container.description}")
+            elif provider.lower() in iac_generator.SUPPORTED_PROVIDERS:
+                size = sizing.instance_size(provider.lower(), stack_info, workload)
+                console.print(f"[bold blue]📐 Instância dimensionada:[/bold blue] {size.instance_type} ({size.description})")
+            if scale:
+                policy = sizing.scaling_policy(workload)
+                console.print(
+                    f"[bold blue]📈 Autoscaling:[/bold blue] {policy['min_size']} a {policy['max_size']} instâncias, "
+                    f"CPU alvo de {policy['cpu_target']}%"
+                )
+            with phase("geração"):
+                iac_generator.generate_terraform(
+                    service_path, stack_info, provider.lower(),
+                    workload=workload, scale=scale, bake=bake, target=target.lower(), force=force, diff=diff,
+                )
+        except ValueError as e:
+            console.print(f"[bold red]❌ Erro:[/bold red] {e}")
+            raise typer.Exit(code=1)
+    
+    if target.lower() == "container":
+        console.print("Publique a imagem do Dockerfile gerado num registry e informe-a na variável [bold]image[/bold]")
+    if bake:
+        console.print("Primeiro gere a imagem: [bold yellow]packer init packer && packer build packer[/bold yellow]")
+    console.print("Recomendado: rode [bold yellow]terraform init && terraform apply[/bold yellow]")
@@ -0,0 +1,40 @@
+import typer
+
+from ezops.timings import phase, timed_import
+from .common import analyze_services, console
+
+def run(
+    path: str,
+    recursive: bool,
+    no_cache: bool,
+    force: bool = False,
+    diff: bool = False,
+    buildkit: bool = False,
+    profile: str = "throughput",
+):
+    console.print(f"[bold blue]🚀 Iniciando EzOps no diretório:[/bold blue] {path}")
+    
+    generator_engine = timed_import("ezops.generator.engine")
+    profile = profile.lower()
+    if profile not in generator_engine.RUNTIME_PROFILES:
+        console.print(f"[bold red]❌ Perfil inválido:[/bold red] {profile}. Escolha {', '.join(generator_engine.RUNTIME_PROFILES)}.")
+        raise typer.Exit(code=1)
+    
+    # 1. Analisa os arquivos do projeto para descobrir a stack
+    services = analyze_services(path, recursive, use_cache=not no_cache)
+    
+    if not services:
+        console.print("[bold red]❌ Não foi possível detectar a stack do projeto.[/bold red]")
+        raise typer.Exit(code=1)
+        
+    for service_path, stack_info in services.items():
+        if recursive:
+            console.print(f"[bold blue]📦 Serviço:[/bold blue] {service_path}")
+        console.print(f"[bold green]✅ Stack detectada:[/bold green] {stack_info.name} (v{stack_info.version})")
+        if stack_info.components:
+            components = ", ".join(f"{c.name} ({c.confidence:.0%})" for c in stack_info.components)
+            console.print(f"[bold green]🧩 Componentes secundários:[/bold green] {components}")
+        
+        # 2. Gera os arquivos baseados na stack detectada
+        with phase("geração"):
+            generator_engine.generate_files(service_path, stack_info, force=force, diff=diff, buildkit=buildkit, profile=profile)
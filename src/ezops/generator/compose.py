@@ -0,0 +1,143 @@
+"""
+Configuração declarativa do docker-compose.yml: serviço da aplicação com
+healthcheck e limites de recursos, bancos/Redis detectados pelo analyzer e
+um profile `dev` com bind mounts para stacks interpretadas.
+"""
+from typing import Any, Dict, List, Optional
+
+from ezops.analyzer.models import StackInfo
+
+# Healthcheck da aplicação: verifica se a porta aceita conexões, usando só o
+# que já existe na imagem de runtime gerada (sem curl/wget nas imagens slim)
+APP_HEALTHCHECKS: Dict[str, List[str]] = {
+    "python": ["CMD", "python", "-c", "import socket; socket.create_connection(('localhost', {port}), 2)"],
+    "node": ["CMD", "node", "-e", "require('net').connect({port}, 'localhost').on('connect', () => process.exit(0)).on('error', () => process.exit(1))"],
+    "go": ["CMD", "nc", "-z", "localhost", "{port}"],
+    "java": ["CMD", "nc", "-z", "localhost", "{port}"],
+    "ruby": ["CMD", "ruby", "-rsocket", "-e", "TCPSocket.new('localhost', {port})"],
+}
+
+# Limites de CPU/memória do container da aplicação por stack
+APP_RESOURCES: Dict[str, Dict[str, str]] = {
+    "python": {"cpus": "1.0", "memory": "512M"},
+    "node": {"cpus": "1.0", "memory": "512M"},
+    "go": {"cpus": "0.5", "memory": "256M"},
+    "java": {"cpus": "2.0", "memory": "1G"},
+    "ruby": {"cpus": "1.0", "memory": "512M"},
+}
+
+# Variáveis de ambiente de produção por stack
+APP_ENVIRONMENT: Dict[str, Dict[str, str]] = {
+    "python": {"PYTHONUNBUFFERED": "1", "PYTHONDONTWRITEBYTECODE": "1"},
+    "node": {"NODE_ENV": "production"},
+    "go": {},
+    "java": {},
+    "ruby": {"RACK_ENV": "production", "RAILS_ENV": "production", "RAILS_LOG_TO_STDOUT": "1"},
+}
+
+# Profile `dev`: só stacks interpretadas se beneficiam do código montado.
+# Go e Java rodam um binário/jar compilado na imagem, então não têm profile dev.
+DEV_OVERRIDES: Dict[str, Dict[str, Any]] = {
+    "python": {"environment": {}, "volumes": [".:/app"]},
+    "node": {"environment": {"NODE_ENV": "development"}, "volumes": [".:/app", "/app/node_modules"]},
+    "ruby": {"environment": {"RACK_ENV": "development", "RAILS_ENV": "development"}, "volumes": [".:/app"]},
+}
+
+# Serviços de apoio, escolhidos a partir de `db_engine`/`has_redis` do StackInfo
+BACKING_SERVICES: Dict[str, Dict[str, Any]] = {
+    "postgres": {
+        "name": "db",
+        "image": "postgres:16-alpine",
+        "environment": {"POSTGRES_USER": "app", "POSTGRES_PASSWORD": "app", "POSTGRES_DB": "app"},
+        "healthcheck": ["CMD-SHELL", "pg_isready -U app -d app"],
+        "volume": "pgdata:/var/lib/postgresql/data",
+        "resources": {"cpus": "1.0", "memory": "1G"},
+        "app_environment": {"DATABASE_URL": "postgres://app:app@db:5432/app"},
+        "java_environment": {
+            "SPRING_DATASOURCE_URL": "jdbc:postgresql://db:5432/app",
+            "SPRING_DATASOURCE_USERNAME": "app",
+            "SPRING_DATASOURCE_PASSWORD": "app",
+        },
+    },
+    "mysql": {
+        "name": "db",
+        "image": "mysql:8.4",
+        "environment": {
+            "MYSQL_DATABASE": "app", "MYSQL_USER": "app", "MYSQL_PASSWORD": "app", "MYSQL_ROOT_PASSWORD": "root",
+        },
+        "healthcheck": ["CMD", "mysqladmin", "ping", "-h", "localhost", "-uapp", "-papp"],
+        "volume": "mysqldata:/var/lib/mysql",
+        "resources": {"cpus": "1.0", "memory": "1G"},
+        "app_environment": {"DATABASE_URL": "mysql://app:app@db:3306/app"},
+        "java_environment": {
+            "SPRING_DATASOURCE_URL": "jdbc:mysql://db:3306/app",
+            "SPRING_DATASOURCE_USERNAME": "app",
+            "SPRING_DATASOURCE_PASSWORD": "app",
+        },
+    },
+    "mongodb": {
+        "name": "db",
+        "image": "mongo:7",
+        "environment": {"MONGO_INITDB_DATABASE": "app"},
+        "healthcheck": ["CMD", "mongosh", "--quiet", "--eval", "db.adminCommand('ping')"],
+        "volume": "mongodata:/data/db",
+        "resources": {"cpus": "1.0", "memory": "1G"},
+        "app_environment": {"DATABASE_URL": "mongodb://db:27017/app"},
+        "java_environment": {"SPRING_DATA_MONGODB_URI": "mongodb://db:27017/app"},
+    },
+    "redis": {
+        "name": "redis",
+        "image": "redis:7-alpine",
+        "environment": {},
+        "healthcheck": ["CMD", "redis-cli", "ping"],
+        "volume": None,
+        "resources": {"cpus": "0.5", "memory": "256M"},
+        "app_environment": {"REDIS_URL": "redis://redis:6379/0"},
+        "java_environment": {"SPRING_DATA_REDIS_HOST": "redis", "SPRING_DATA_REDIS_PORT": "6379"},
+    },
+}
+
+# Engine assumida quando o detector marca has_db sem informar qual
+DEFAULT_DB_ENGINE = "postgres"
+
+
+def _backing_services(stack: StackInfo) -> List[str]:
+    """Serviços de apoio da stack e de seus componentes (ex.: Redis usado só pelo front)."""
+    db_engine, has_redis = None, False
+    for item in [stack] + list(stack.components):
+        if item.has_db and db_engine is None:
+            db_engine = item.details.get("db_engine") or DEFAULT_DB_ENGINE
+        has_redis = has_redis or item.has_redis
+    keys = []
+    if db_engine in BACKING_SERVICES:
+        keys.append(db_engine)
+    if has_redis:
+        keys.append("redis")
+    return keys
+
+
+def compose_context(stack: StackInfo, port: int) -> Dict[str, Any]:
+    """Contexto de renderização do docker-compose.yml."""
+    services = [BACKING_SERVICES[key] for key in _backing_services(stack)]
+
+    environment = dict(APP_ENVIRONMENT.get(stack.name, {}))
+    for service in services:
+        if stack.name == "java":
+            environment.update(service["java_environment"])
+        else:
+            environment.update(service["app_environment"])
+
+    healthcheck = APP_HEALTHCHECKS.get(stack.name)
+    dev: Optional[Dict[str, Any]] = DEV_OVERRIDES.get(stack.name)
+    return {
+        "port": port,
+        "app": {
+            "environment": environment,
+            "healthcheck": [part.replace("{port}", str(port)) for part in healthcheck] if healthcheck else None,
+            "resources": APP_RESOURCES.get(stack.name, {"cpus": "1.0", "memory": "512M"}),
+            "depends_on": [service["name"] for service in services],
+        },
+        "dev": dev,
+        "services": services,
+        "volumes": [service["volume"].split(":", 1)[0] for service in services if service["volume"]],
+    }
@@ -1,201 +1,284 @@
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+from ezops.analyzer.context import dockerignore_sections, estimate_context, format_size, parse_dockerignore
 from ezops.analyzer.models import StackInfo
+from ezops.analyzer.scanner import scan_directory
 from rich.console import Console
+from .compose import compose_context
+from .manifest import (
+    CONFLICT,
+    CREATED,
+    DIFF,
+    SKIPPED,
+    UNCHANGED,
+    UPDATED,
+    GenerationManifest,
+    WriteResult,
+    inputs_hash,
+)
+from .rendering import render, template_version
 
 console = Console()
 
-# Templates Base (Otimizados e Seguros)
-DOCKERFILE_PYTHON_BASE = """# Base image
-FROM python:{version}-slim AS builder
-
-WORKDIR /app
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-# Copiar projeto
-COPY . .
-
-# Non-root user
-RUN useradd -m appuser && chown -R appuser /app
-USER appuser
-
-# Expondo a porta default (Ajuste se necessário)
-EXPOSE 8000
-
-# Comando padrão
-CMD ["python", "main.py"]
-"""
-
-DOCKERFILE_NODE_BASE = """# Multi-stage build para Node.js
-FROM node:{version}-alpine AS builder
-WORKDIR /app
-COPY package*.json ./
-RUN npm ci
-
-COPY . .
-RUN npm run build 
-
-FROM node:{version}-alpine AS runner
-WORKDIR /app
-COPY --from=builder /app/package*.json ./
-COPY --from=builder /app/node_modules ./node_modules
-COPY --from=builder /app/dist ./dist 
-
-# Otimização Node.js
-ENV NODE_ENV=production
-
-# Non-root user
-USER node
-
-EXPOSE 3000
-CMD ["npm", "start"]
-"""
-
-DOCKER_COMPOSE_BASE = """version: '3.8'
-
-services:
-  app:
-    build: 
-      context: .
-      dockerfile: Dockerfile
-    ports:
-      - "{port}:{port}"
-    environment:
-      - NODE_ENV=development
-    volumes:
-      - .:/app
-      - /app/node_modules
-"""
-
-DOCKERFILE_GO_BASE = """# Multi-stage build para Go
-FROM golang:{version}-alpine AS builder
-WORKDIR /app
-COPY go.mod go.sum* ./
-RUN go mod download
-
-COPY . .
-RUN CGO_ENABLED=0 GOOS=linux go build -a -installsuffix cgo -o main .
-
-FROM alpine:latest
-RUN apk --no-cache add ca-certificates
-
-WORKDIR /root/
-COPY --from=builder /app/main .
-
-EXPOSE 8080
-CMD ["./main"]
-"""
-
-DOCKERFILE_JAVA_MAVEN_BASE = """# Multi-stage build para Java (Maven)
-FROM maven:3.9-eclipse-temurin-{version}-alpine AS builder
-WORKDIR /app
-COPY pom.xml .
-RUN mvn dependency:go-offline
-
-COPY src ./src
-RUN mvn package -DskipTests
-
-FROM eclipse-temurin:{version}-jre-alpine
-WORKDIR /app
-COPY --from=builder /app/target/*.jar app.jar
-
-RUN addgroup -S appgroup && adduser -S appuser -G appgroup
-USER appuser
-
-EXPOSE 8080
-CMD ["java", "-jar", "app.jar"]
-"""
-
-DOCKERFILE_JAVA_GRADLE_BASE = """# Multi-stage build para Java (Gradle)
-FROM gradle:jdk{version}-alpine AS builder
-WORKDIR /app
-COPY build.gradle settings.gradle ./
-COPY src src
-
-RUN gradle build --no-daemon -x test
-
-FROM eclipse-temurin:{version}-jre-alpine
-WORKDIR /app
-COPY --from=builder /app/build/libs/*.jar app.jar
-
-RUN addgroup -S appgroup && adduser -S appuser -G appgroup
-USER appuser
-
-EXPOSE 8080
-CMD ["java", "-jar", "app.jar"]
-"""
-
-DOCKERFILE_RUBY_BASE = """# Base image para Ruby
-FROM ruby:{version}-slim AS base
-
-WORKDIR /app
-COPY Gemfile Gemfile.lock ./
-RUN bundle install
-
-COPY . .
-
-RUN useradd -m appuser && chown -R appuser /app
-USER appuser
-
-EXPOSE 4567
-CMD ["ruby", "app.rb"]
-"""
-
-def generate_dockerfile(path: Path, stack: StackInfo):
-    file_path = path / "Dockerfile"
-    if file_path.exists():
-        console.print("[yellow]⚠️ Dockerfile já existe! Pulando criação...[/yellow]")
-        return
-        
-    content = ""
-    if stack.name == "python":
-        content = DOCKERFILE_PYTHON_BASE.format(version=stack.version or "3.9")
-        # Se for FastAPI
-        if stack.framework == "fastapi":
-            content = content.replace('CMD ["python", "main.py"]', 'CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]')
-    elif stack.name == "node":
-        content = DOCKERFILE_NODE_BASE.format(version=stack.version or "18")
-        if stack.framework == "nextjs":
-            content = content.replace('COPY --from=builder /app/dist ./dist', 'COPY --from=builder /app/.next ./.next')
-    elif stack.name == "go":
-        content = DOCKERFILE_GO_BASE.format(version=stack.version or "1.20")
-    elif stack.name == "java":
+# Configuração base de cada stack (Templates Otimizados e Seguros em generator/templates)
+STACKS: Dict[str, Dict[str, Any]] = {
+    "python": {
+        "template": "dockerfile/python.j2",
+        "version": "3.9",
+        "port": 8000,
+        "cmd": ["python", "main.py"],
+    },
+    "node": {
+        "template": "dockerfile/node.j2",
+        "version": "18",
+        "port": 3000,
+        "cmd": ["npm", "start"],
+        "build_output": "dist",
+    },
+    "go": {
+        "template": "dockerfile/go.j2",
+        "version": "1.20",
+        "port": 8080,
+        "cmd": ["./main"],
+    },
+    "java": {
+        "template": "dockerfile/java_maven.j2",
+        "version": "17",
+        "port": 8080,
+        "cmd": ["java", "-jar", "app.jar"],
+    },
+    "ruby": {
+        "template": "dockerfile/ruby.j2",
+        "version": "3.2",
+        "port": 4567,
+        "cmd": ["ruby", "app.rb"],
+    },
+}
+
+# Ajustes declarativos por framework, aplicados sobre a configuração do stack
+FRAMEWORK_VARIANTS: Dict[tuple, Dict[str, Any]] = {
+    ("python", "fastapi"): {
+        # Número de workers vem de $WEB_CONCURRENCY (definido pelo ezops-runtime.sh)
+        "cmd": ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"],
+        "server": "uvicorn",
+    },
+    ("python", "django"): {
+        "cmd": ["gunicorn", "{wsgi_module}:application", "--bind", "0.0.0.0:8000"],
+        "server": "gunicorn",
+        "packages": ["gunicorn"],
+    },
+    ("python", "flask"): {
+        "cmd": ["gunicorn", "{app_module}:app", "--bind", "0.0.0.0:8000"],
+        "server": "gunicorn",
+        "packages": ["gunicorn"],
+    },
+    ("node", "nextjs"): {
+        "build_output": ".next",
+    },
+    ("ruby", "rails"): {
+        "port": 3000,
+        "cmd": ["rails", "server", "-b", "0.0.0.0"],
+    },
+}
+
+# Perfis de runtime aceitos por `ezops init --profile`
+RUNTIME_PROFILES = ("throughput", "latency", "memory")
+DEFAULT_RUNTIME_PROFILE = "throughput"
+
+# Template do Dockerfile Java por build tool
+JAVA_BUILD_TOOL_TEMPLATES = {
+    "maven": "dockerfile/java_maven.j2",
+    "gradle": "dockerfile/java_gradle.j2",
+}
+
+def _asset_component(stack: StackInfo):
+    """Componente Node usado só como pipeline de assets (ex.: Django + webpack)."""
+    if stack.name not in ("python", "ruby"):
+        return None
+    for component in stack.components:
+        if component.name == "node" and component.framework is None:
+            return component
+    return None
+
+def _java_runtime(version: str) -> Dict[str, Any]:
+    """Opções da JVM que dependem da versão: GC de baixa latência e AppCDS automático."""
+    try:
+        major = int(str(version).split(".")[0])
+    except ValueError:
+        major = int(STACKS["java"]["version"])
+    if major >= 23:
+        latency_gc = "-XX:+UseZGC"
+    elif major >= 21:
+        latency_gc = "-XX:+UseZGC -XX:+ZGenerational"
+    else:
+        latency_gc = "-XX:+UseG1GC -XX:MaxGCPauseMillis=100"
+    return {"latency_gc": latency_gc, "cds": major >= 19}
+
+def build_context(
+    stack: StackInfo,
+    buildkit: bool = False,
+    profile: str = DEFAULT_RUNTIME_PROFILE,
+) -> Dict[str, Any]:
+    """
+    Monta o contexto de renderização: base do stack + variante do framework.
+    Com `buildkit`, os templates usam cache mounts (`RUN --mount=type=cache`).
+    `profile` é o perfil padrão do ezops-runtime.sh (throughput, latency ou memory).
+    """
+    if profile not in RUNTIME_PROFILES:
+        raise ValueError(f"Perfil de runtime inválido: {profile}. Escolha {', '.join(RUNTIME_PROFILES)}.")
+
+    context = dict(STACKS.get(stack.name, {}))
+    context.update(FRAMEWORK_VARIANTS.get((stack.name, stack.framework), {}))
+    if stack.name == "java":
         build_tool = stack.details.get("build_tool", "maven")
-        if build_tool == "maven":
-            content = DOCKERFILE_JAVA_MAVEN_BASE.format(version=stack.version or "17")
-        else:
-            content = DOCKERFILE_JAVA_GRADLE_BASE.format(version=stack.version or "17")
-    elif stack.name == "ruby":
-        content = DOCKERFILE_RUBY_BASE.format(version=stack.version or "3.2")
-        if stack.framework == "rails":
-            content = content.replace('CMD ["ruby", "app.rb"]', 'CMD ["rails", "server", "-b", "0.0.0.0"]')
-            content = content.replace('EXPOSE 4567', 'EXPOSE 3000')
-            
-    file_path.write_text(content)
-    console.print(f"[green]🐳 Dockerfile ({stack.name}) gerado com sucesso![/green]")
-
-def generate_docker_compose(path: Path, stack: StackInfo):
-    file_path = path / "docker-compose.yml"
-    if file_path.exists():
-        console.print("[yellow]⚠️ docker-compose.yml já existe! Pulando criação...[/yellow]")
-        return
+        context["template"] = JAVA_BUILD_TOOL_TEMPLATES.get(build_tool, context["template"])
+        context["gradle_dir"] = bool(stack.details.get("gradle_dir"))
         
-    ports_map = {
-        "python": "8000",
-        "node": "3000",
-        "go": "8080",
-        "java": "8080",
-        "ruby": "4567" if stack.framework != "rails" else "3000"
-    }
+    context["version"] = stack.version or context.get("version")
+    if stack.name == "java":
+        context.update(_java_runtime(context["version"]))
+    if stack.framework == "django":
+        wsgi_module = stack.details.get("wsgi_module", "wsgi")
+        context["cmd"] = [part.format(wsgi_module=wsgi_module) for part in context["cmd"]]
+    elif stack.framework == "flask":
+        app_module = stack.details.get("app_module", "app")
+        context["cmd"] = [part.format(app_module=app_module) for part in context["cmd"]]
+    context.setdefault("server", None)
+    context.setdefault("packages", [])
+    context["stack"] = stack
+    context["buildkit"] = buildkit
+    context["profile"] = profile
     
-    port = ports_map.get(stack.name, "8080")
-    content = DOCKER_COMPOSE_BASE.format(port=port)
+    # Projeto polyglot: um único Dockerfile multi-stage com o build dos assets
+    assets = _asset_component(stack)
+    if assets is not None:
+        assets = {"version": assets.version or STACKS["node"]["version"]}
+    context["assets"] = assets
+    return context
+
+# Mensagens exibidas para cada resultado de escrita
+_MESSAGES = {
+    CREATED: "[green]{icon} {name} gerado com sucesso![/green]",
+    UPDATED: "[green]🔄 {name} regenerado (entradas ou template mudaram)[/green]",
+    UNCHANGED: "[dim]✔️  {name} já está atualizado[/dim]",
+    SKIPPED: "[yellow]⚠️ {name} já existe! Pulando criação... (use --force para sobrescrever)[/yellow]",
+    CONFLICT: "[yellow]⚠️ {name} foi editado desde a última geração; mantendo sua versão (use --diff ou --force)[/yellow]",
+    DIFF: "[cyan]📝 {name} seria alterado:[/cyan]",
+}
+
+def report_result(result: WriteResult, icon: str = "📄", label: str = None):
+    """Imprime o resultado da escrita de um arquivo gerado."""
+    name = label or result.path.name
+    console.print(_MESSAGES[result.action].format(icon=icon, name=name))
+    if result.action == DIFF and result.diff:
+        console.print(result.diff, markup=False, highlight=False)
+
+def _stack_inputs(stack: StackInfo, **options) -> str:
+    return inputs_hash({"stack": stack.to_dict(), **options})
+
+def generate_dockerfile(
+    path: Path,
+    stack: StackInfo,
+    manifest: Optional[GenerationManifest] = None,
+    buildkit: bool = False,
+    profile: str = DEFAULT_RUNTIME_PROFILE,
+) -> WriteResult:
+    manifest = manifest or GenerationManifest(path)
+    context = build_context(stack, buildkit, profile)
+    template = context.get("template")
     
-    file_path.write_text(content)
-    console.print("[green]🐙 docker-compose.yml gerado com sucesso![/green]")
-
-def generate_files(path_str: str, stack: StackInfo):
-    """Orquestra a geração de todos os arquivos necessários."""
+    result = manifest.write(
+        "Dockerfile",
+        lambda: render(template, **context) if template else "",
+        inputs=_stack_inputs(stack, buildkit=buildkit, profile=profile),
+        template=template_version(template) if template else "",
+    )
+    report_result(result, "🐳", f"Dockerfile ({stack.name})")
+    return result
+
+def generate_runtime_script(
+    path: Path,
+    stack: StackInfo,
+    manifest: Optional[GenerationManifest] = None,
+    profile: str = DEFAULT_RUNTIME_PROFILE,
+) -> WriteResult:
+    """
+    Gera o ezops-runtime.sh, entrypoint que calcula workers/heap/GC a partir
+    dos limites de CPU e memória do container.
+    """
+    manifest = manifest or GenerationManifest(path)
+    context = build_context(stack, profile=profile)
+    template = "runtime/ezops-runtime.sh.j2"
+
+    result = manifest.write(
+        "ezops-runtime.sh",
+        lambda: render(template, **context),
+        inputs=_stack_inputs(stack, profile=profile),
+        template=template_version(template),
+    )
+    report_result(result, "⚙️ ", f"ezops-runtime.sh (perfil {profile})")
+    return result
+
+def generate_docker_compose(path: Path, stack: StackInfo, manifest: Optional[GenerationManifest] = None) -> WriteResult:
+    manifest = manifest or GenerationManifest(path)
+    template = "compose/docker-compose.yml.j2"
+    port = build_context(stack).get("port", 8080)
+    
+    result = manifest.write(
+        "docker-compose.yml",
+        lambda: render(template, **compose_context(stack, port)),
+        inputs=_stack_inputs(stack),
+        template=template_version(template),
+    )
+    report_result(result, "🐙")
+    return result
+
+def generate_dockerignore(path: Path, stack: StackInfo, manifest: Optional[GenerationManifest] = None) -> WriteResult:
+    """
+    Gera um .dockerignore para a stack, com os artefatos que o scan encontrou
+    no projeto, e informa a economia estimada no contexto de build.
+    """
+    manifest = manifest or GenerationManifest(path)
+    template = "dockerignore.j2"
+    sections = dockerignore_sections(stack, scan_directory(path))
+
+    result = manifest.write(
+        ".dockerignore",
+        lambda: render(template, stack=stack, sections=sections),
+        inputs=_stack_inputs(stack, sections=sections),
+        template=template_version(template),
+    )
+    report_result(result, "🙈")
+    if result.written:
+        rules = parse_dockerignore(result.path.read_text().splitlines())
+        estimate = estimate_context(path, rules)
+        console.print(
+            f"[green]📦 Contexto de build estimado:[/green] {format_size(estimate.total_bytes)} "
+            f"({estimate.total_files} arquivos) → {format_size(estimate.sent_bytes)} "
+            f"({estimate.sent_files} arquivos), -{estimate.saved_ratio:.0%}"
+        )
+    return result
+
+def generate_files(
+    path_str: str,
+    stack: StackInfo,
+    force: bool = False,
+    diff: bool = False,
+    buildkit: bool = False,
+    profile: str = DEFAULT_RUNTIME_PROFILE,
+) -> List[Path]:
+    """
+    Orquestra a geração de todos os arquivos necessários e retorna os arquivos escritos.
+    Arquivos editados pelo usuário só são sobrescritos com `force`; com `diff`
+    nada é escrito e as diferenças são exibidas.
+    """
     path = Path(path_str)
-    generate_dockerfile(path, stack)
-    generate_docker_compose(path, stack)
+    manifest = GenerationManifest(path, force=force, diff=diff)
+    results = [
+        generate_dockerfile(path, stack, manifest, buildkit, profile),
+        generate_runtime_script(path, stack, manifest, profile),
+        generate_dockerignore(path, stack, manifest),
+        generate_docker_compose(path, stack, manifest),
+    ]
+    manifest.save()
+    return [result.path for result in results if result.written]
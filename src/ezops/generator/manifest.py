@@ -0,0 +1,124 @@
+"""
+Manifesto dos arquivos gerados pelo EzOps (`.ezops/manifest.json`).
+
+Para cada arquivo gerado guardamos o hash das entradas (stack + opções),
+a versão do template e o hash do conteúdo escrito. Assim uma nova execução:
+- não faz nada quando entradas, template e arquivo não mudaram;
+- regenera só os arquivos cujas entradas mudaram;
+- se recusa a sobrescrever arquivos editados pelo usuário (exceto com force).
+"""
+import difflib
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = Path(".ezops") / "manifest.json"
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+SKIPPED = "skipped"  # Arquivo existe, mas não foi gerado pelo EzOps
+CONFLICT = "conflict"  # Arquivo gerado pelo EzOps e editado depois
+DIFF = "diff"  # Modo diff: mostra o que mudaria, sem escrever
+
+
+@dataclass
+class WriteResult:
+    path: Path
+    action: str
+    diff: Optional[str] = None
+
+    @property
+    def written(self) -> bool:
+        return self.action in (CREATED, UPDATED)
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def inputs_hash(inputs: Dict[str, Any]) -> str:
+    """Hash estável das entradas da geração (stack serializada + opções)."""
+    return content_hash(json.dumps(inputs, sort_keys=True, default=str))
+
+
+def _unified_diff(path: Path, old: str, new: str) -> str:
+    return "".join(difflib.unified_diff(
+        old.splitlines(keepends=True),
+        new.splitlines(keepends=True),
+        fromfile=f"{path.name} (atual)",
+        tofile=f"{path.name} (gerado)",
+    ))
+
+
+class GenerationManifest:
+    def __init__(self, root, force: bool = False, diff: bool = False):
+        self.root = Path(root)
+        self.force = force
+        self.diff = diff
+        self._files: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.file_path.read_text())
+            if data.get("version") == MANIFEST_VERSION:
+                self._files = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def file_path(self) -> Path:
+        return self.root / MANIFEST_PATH
+
+    def entry(self, name: str) -> Optional[Dict[str, str]]:
+        return self._files.get(name)
+
+    def write(self, name: str, render: Callable[[], str], inputs: str, template: str) -> WriteResult:
+        """
+        Escreve `root/name` com o conteúdo de `render()` respeitando o manifesto.
+        `render` só é chamado quando o arquivo realmente precisa ser (re)gerado.
+        """
+        file_path = self.root / name
+        entry = self._files.get(name)
+        current = file_path.read_text() if file_path.exists() else None
+        current_hash = content_hash(current) if current is not None else None
+
+        # Nada mudou: nem entradas, nem template, nem o arquivo em disco
+        if (not self.diff and entry is not None and current_hash == entry["output"]
+                and entry["inputs"] == inputs and entry["template"] == template):
+            return WriteResult(file_path, UNCHANGED)
+
+        content = render()
+        if self.diff:
+            changed = current != content
+            return WriteResult(file_path, DIFF if changed else UNCHANGED,
+                               _unified_diff(file_path, current or "", content) if changed else None)
+
+        if current is not None and not self.force:
+            if entry is None:
+                return WriteResult(file_path, SKIPPED)
+            if current_hash != entry["output"]:
+                return WriteResult(file_path, CONFLICT, _unified_diff(file_path, current, content))
+
+        if current == content:
+            action = UNCHANGED
+        else:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+            action = CREATED if current is None else UPDATED
+
+        self._files[name] = {"inputs": inputs, "template": template, "output": content_hash(content)}
+        self._dirty = True
+        return WriteResult(file_path, action)
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.file_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"version": MANIFEST_VERSION, "files": self._files}, indent=2))
+        os.replace(tmp_path, self.file_path)
+        self._dirty = False
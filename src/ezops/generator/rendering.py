@@ -0,0 +1,70 @@
+"""
+Camada de templates dos geradores (Jinja2). Os templates ficam em
+`generator/templates/`, são compilados uma única vez por processo e, se
+EZOPS_TEMPLATE_CACHE_DIR estiver definido, o bytecode compilado também é
+reaproveitado entre processos (ex.: workers do `ezops batch`).
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined, meta
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+def _exec_form(args) -> str:
+    """Formata uma lista de argumentos no exec form do Dockerfile: ["a", "b"]."""
+    return json.dumps(list(args))
+
+
+@lru_cache(maxsize=None)
+def get_environment() -> Environment:
+    cache_dir = os.environ.get("EZOPS_TEMPLATE_CACHE_DIR")
+    bytecode_cache = None
+    if cache_dir:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=bytecode_cache,
+        undefined=StrictUndefined,
+        keep_trailing_newline=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Templates empacotados não mudam em tempo de execução: sem checagem de mtime
+        auto_reload=False,
+    )
+    env.filters["exec_form"] = _exec_form
+    # Modo clássico por padrão; `buildkit=True` no contexto ativa os cache mounts
+    env.globals["buildkit"] = False
+    # Perfil padrão do ezops-runtime.sh (sobrescrito por `profile` no contexto)
+    env.globals["profile"] = "throughput"
+    return env
+
+
+def render(template_name: str, **context) -> str:
+    """Renderiza um template (compilado e mantido em cache pelo Environment)."""
+    return get_environment().get_template(template_name).render(**context)
+
+
+
+@lru_cache(maxsize=None)
+def template_version(template_name: str) -> str:
+    """Hash do código-fonte do template e de todos os templates que ele herda/inclui."""
+    env = get_environment()
+    digest = hashlib.sha256()
+    pending, seen = [template_name], set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        source, _, _ = env.loader.get_source(env, name)
+        digest.update(name.encode())
+        digest.update(source.encode())
+        pending.extend(ref for ref in meta.find_referenced_templates(env.parse(source)) if ref)
+    return digest.hexdigest()[:16]
@@ -0,0 +1,160 @@
+"""
+Dimensionamento de instâncias para o Terraform: requisitos de CPU/memória
+por stack, ajustados pelo tipo de carga (`--workload`), e o menor tipo de
+instância de cada provedor que os atende.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from ezops.analyzer.models import StackInfo
+
+WORKLOADS = ("general", "cpu", "memory")
+DEFAULT_WORKLOAD = "general"
+
+# (vCPUs, memória em GB) mínimos por stack; a JVM nunca roda em instâncias micro
+STACK_REQUIREMENTS: Dict[str, Tuple[int, float]] = {
+    "python": (1, 1),
+    "node": (1, 1),
+    "go": (1, 0.5),
+    "java": (2, 4),
+    "ruby": (1, 2),
+}
+DEFAULT_REQUIREMENTS = (1, 1)
+
+# Catálogo por provedor e família: (tipo, vCPUs, memória em GB), do menor para o maior
+INSTANCE_TYPES: Dict[str, Dict[str, List[Tuple[str, int, float]]]] = {
+    "aws": {
+        "general": [
+            ("t3.micro", 2, 1), ("t3.small", 2, 2), ("t3.medium", 2, 4),
+            ("t3.large", 2, 8), ("t3.xlarge", 4, 16), ("t3.2xlarge", 8, 32),
+        ],
+        "cpu": [("c6i.large", 2, 4), ("c6i.xlarge", 4, 8), ("c6i.2xlarge", 8, 16)],
+        "memory": [("r6i.large", 2, 16), ("r6i.xlarge", 4, 32), ("r6i.2xlarge", 8, 64)],
+    },
+    "gcp": {
+        "general": [
+            ("e2-micro", 2, 1), ("e2-small", 2, 2), ("e2-medium", 2, 4),
+            ("e2-standard-2", 2, 8), ("e2-standard-4", 4, 16), ("e2-standard-8", 8, 32),
+        ],
+        "cpu": [("c2d-highcpu-2", 2, 4), ("c2d-highcpu-4", 4, 8), ("c2d-highcpu-8", 8, 16)],
+        "memory": [("e2-highmem-2", 2, 16), ("e2-highmem-4", 4, 32), ("e2-highmem-8", 8, 64)],
+    },
+    "azure": {
+        "general": [
+            ("Standard_B1s", 1, 1), ("Standard_B1ms", 1, 2), ("Standard_B2s", 2, 4),
+            ("Standard_B2ms", 2, 8), ("Standard_D4s_v5", 4, 16), ("Standard_D8s_v5", 8, 32),
+        ],
+        "cpu": [("Standard_F2s_v2", 2, 4), ("Standard_F4s_v2", 4, 8), ("Standard_F8s_v2", 8, 16)],
+        "memory": [("Standard_E2s_v5", 2, 16), ("Standard_E4s_v5", 4, 32), ("Standard_E8s_v5", 8, 64)],
+    },
+}
+
+
+# Targets de container (--target container): vCPUs por instância (memória é
+# 2 GB por vCPU, a proporção aceita pelo Fargate e pelo Container Apps),
+# requisições simultâneas por instância e mínimo de instâncias. A JVM fica
+# com uma instância quente por causa do cold start.
+CONTAINER_REQUIREMENTS: Dict[str, Tuple[float, int, int]] = {
+    "python": (1, 40, 0),
+    "node": (1, 80, 0),
+    "go": (0.5, 250, 0),
+    "java": (2, 100, 1),
+    "ruby": (1, 20, 0),
+}
+DEFAULT_CONTAINER_REQUIREMENTS = (1, 80, 0)
+CONTAINER_MAX_INSTANCES = 10
+FARGATE_CPU_STEPS = (0.25, 0.5, 1, 2, 4)
+
+# Limites do grupo de autoscaling (`--scale`) e a CPU média alvo da política;
+# cargas CPU-bound escalam mais cedo
+SCALING_DEFAULTS: Dict[str, int] = {"min_size": 1, "max_size": 3, "cpu_target": 60}
+CPU_BOUND_TARGET = 50
+
+
+@dataclass
+class InstanceSize:
+    instance_type: str
+    vcpus: int
+    memory_gb: float
+    workload: str
+
+    @property
+    def description(self) -> str:
+        memory = f"{self.memory_gb:g}"
+        return f"{self.vcpus} vCPU / {memory} GB, workload {self.workload}"
+
+
+@dataclass
+class ContainerSize:
+    cpu: float
+    memory_gb: float
+    concurrency: int
+    min_instances: int
+    max_instances: int
+    workload: str
+
+    @property
+    def description(self) -> str:
+        return (
+            f"{self.cpu:g} vCPU / {self.memory_gb:g} GB, concurrency {self.concurrency}, "
+            f"{self.min_instances}-{self.max_instances} instances, workload {self.workload}"
+        )
+
+
+def requirements(stack: StackInfo, workload: str = DEFAULT_WORKLOAD) -> Tuple[int, float]:
+    """vCPUs e memória mínimos da stack para o tipo de carga."""
+    vcpus, memory_gb = STACK_REQUIREMENTS.get(stack.name, DEFAULT_REQUIREMENTS)
+    if workload == "cpu":
+        vcpus = max(2, vcpus * 2)
+    elif workload == "memory":
+        memory_gb = memory_gb * 2
+    return vcpus, memory_gb
+
+
+def instance_size(provider: str, stack: StackInfo, workload: str = DEFAULT_WORKLOAD) -> InstanceSize:
+    """Menor tipo de instância do provedor que atende à stack e ao workload."""
+    if workload not in WORKLOADS:
+        raise ValueError(f"Workload inválido: {workload}. Escolha {', '.join(WORKLOADS)}.")
+    vcpus, memory_gb = requirements(stack, workload)
+    catalog = INSTANCE_TYPES[provider][workload]
+    for instance_type, type_vcpus, type_memory in catalog:
+        if type_vcpus >= vcpus and type_memory >= memory_gb:
+            return InstanceSize(instance_type, type_vcpus, type_memory, workload)
+    instance_type, type_vcpus, type_memory = catalog[-1]
+    return InstanceSize(instance_type, type_vcpus, type_memory, workload)
+
+
+def scaling_policy(workload: str = DEFAULT_WORKLOAD) -> Dict[str, int]:
+    """Tamanho mínimo/máximo do grupo e CPU alvo da política de autoscaling."""
+    policy = dict(SCALING_DEFAULTS)
+    if workload == "cpu":
+        policy["cpu_target"] = CPU_BOUND_TARGET
+    return policy
+
+
+def container_size(provider: str, stack: StackInfo, workload: str = DEFAULT_WORKLOAD) -> ContainerSize:
+    """CPU, memória, concorrência e limites de instâncias do container no provedor."""
+    if workload not in WORKLOADS:
+        raise ValueError(f"Workload inválido: {workload}. Escolha {', '.join(WORKLOADS)}.")
+    cpu, concurrency, min_instances = CONTAINER_REQUIREMENTS.get(stack.name, DEFAULT_CONTAINER_REQUIREMENTS)
+    memory_gb = cpu * 2
+    if workload == "cpu":
+        # Mais CPU por instância e menos requisições simultâneas disputando-a
+        cpu, memory_gb, concurrency = cpu * 2, memory_gb * 2, max(1, concurrency // 2)
+    elif workload == "memory":
+        memory_gb = memory_gb * 2
+
+    if provider == "aws":
+        # Fargate aceita só alguns valores de CPU; memória de 2x a 8x a CPU
+        cpu = next((step for step in FARGATE_CPU_STEPS if step >= cpu), FARGATE_CPU_STEPS[-1])
+        memory_gb = min(max(memory_gb, cpu * 2), cpu * 8)
+        # Atrás do ALB o serviço não acorda sozinho, então mantém uma task
+        min_instances = max(1, min_instances)
+    elif provider == "gcp":
+        # Cloud Run exige 1 vCPU ou mais para atender requisições concorrentes
+        cpu = max(1, cpu)
+    elif provider == "azure":
+        # Container Apps (consumption) fixa 2 GB por vCPU, até 4 vCPUs
+        cpu = min(4, max(cpu, memory_gb / 2))
+        memory_gb = cpu * 2
+    return ContainerSize(cpu, memory_gb, concurrency, min_instances, CONTAINER_MAX_INSTANCES, workload)
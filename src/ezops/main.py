@@ -1,39 +1,58 @@
+import time
+from typing import List, Optional
+
+_start = time.perf_counter()
 import typer
-from rich.console import Console
-from ezops.analyzer import engine as analyzer_engine
-from ezops.generator import engine as generator_engine
+from ezops import timings
+
+# Apenas o typer é carregado aqui; analyzer, generator e rich são importados
+# pelos módulos em ezops.commands somente quando o comando roda.
+timings.record("import", "typer", time.perf_counter() - _start)
 
 app = typer.Typer(help="EzOps CLI - Smart Containerizer and DevOps toolbox", no_args_is_help=True)
-console = Console()
 
 @app.callback()
-def callback():
+def callback(
+    ctx: typer.Context,
+    show_timings: bool = typer.Option(
+        False, "--timings", help="Mostra os tempos de import e de cada fase ao final (ou EZOPS_IMPORT_PROFILE=1)"
+    )
+):
     """EzOps CLI"""
-    pass
+    if show_timings:
+        timings.enable()
+    if timings.is_enabled():
+        ctx.call_on_close(timings.report)
 
 @app.command()
 def init(
     path: str = typer.Argument(
         ".", help="O diretório do projeto para analisar e containerizar"
+    ),
+    recursive: bool = typer.Option(
+        False, "--recursive", "-r", help="Modo monorepo: detecta e containeriza todos os serviços dentro do diretório"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignora o cache de análise em .ezops/cache"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Sobrescreve arquivos já existentes ou editados manualmente"
+    ),
+    diff: bool = typer.Option(
+        False, "--diff", help="Mostra o que mudaria nos arquivos gerados, sem escrever nada"
+    ),
+    buildkit: bool = typer.Option(
+        False, "--buildkit", help="Gera um Dockerfile otimizado para BuildKit (cache mounts de pip/npm/maven/gradle/go/bundler)"
+    ),
+    profile: str = typer.Option(
+        "throughput", "--profile", help="Perfil de runtime da imagem: throughput, latency ou memory"
     )
 ):
     """
     Analisa o diretório informado e gera automaticamente 
     um Dockerfile e um docker-compose.yml baseados na stack do projeto.
     """
-    console.print(f"[bold blue]🚀 Iniciando EzOps no diretório:[/bold blue] {path}")
-    
-    # 1. Analisa os arquivos do projeto para descobrir a stack
-    stack_info = analyzer_engine.analyze_directory(path)
-    
-    if not stack_info:
-        console.print("[bold red]❌ Não foi possível detectar a stack do projeto.[/bold red]")
-        raise typer.Exit(code=1)
-        
-    console.print(f"[bold green]✅ Stack detectada:[/bold green] {stack_info.name} (v{stack_info.version})")
-    
-    # 2. Gera os arquivos baseados na stack detectada
-    generator_engine.generate_files(path, stack_info)
+    timings.timed_import("ezops.commands.init").run(path, recursive, no_cache, force, diff, buildkit, profile)
     
 @app.command()
 def iac(
@@ -42,32 +61,102 @@ def iac(
     ),
     provider: str = typer.Option(
         "aws", help="Provedor de nuvem destino para a infraestrutura (aws, gcp, azure)"
+    ),
+    recursive: bool = typer.Option(
+        False, "--recursive", "-r", help="Modo monorepo: gera a infraestrutura para todos os serviços dentro do diretório"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignora o cache de análise em .ezops/cache"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Sobrescreve arquivos já existentes ou editados manualmente"
+    ),
+    diff: bool = typer.Option(
+        False, "--diff", help="Mostra o que mudaria nos arquivos gerados, sem escrever nada"
+    ),
+    workload: str = typer.Option(
+        "general", "--workload", help="Perfil de carga para dimensionar a instância: general, cpu ou memory"
+    ),
+    scale: bool = typer.Option(
+        False, "--scale", help="Gera um grupo com autoscaling por CPU atrás de um load balancer (ASG/MIG/VMSS); requer --bake"
+    ),
+    bake: bool = typer.Option(
+        False, "--bake", help="Gera um template do Packer que pré-instala Docker e a imagem da aplicação na imagem de máquina"
+    ),
+    target: str = typer.Option(
+        "vm", "--target", help="Onde a aplicação roda: vm (Docker em VMs) ou container (ECS Fargate, Cloud Run, Container Apps)"
     )
 ):
     """
-    Analisa o diretório e gera arquivos Terraform (main.tf) para provisionar 
-    a infraestrutura necessária na Nuvem (Ex: AWS EC2).
+    Analisa o diretório e gera arquivos Terraform (main.tf, variables.tf,
+    outputs.tf e um módulo reutilizável) para provisionar a infraestrutura
+    necessária na Nuvem (Ex: AWS EC2).
     """
-    console.print(f"[bold blue]🚀 Iniciando EzOps IaC Generator no diretório:[/bold blue] {path}")
-    console.print(f"[bold blue]☁️  Provedor selecionado:[/bold blue] {provider.upper()}")
-    
-    stack_info = analyzer_engine.analyze_directory(path)
-    
-    if not stack_info:
-        console.print("[bold red]❌ Não foi possível detectar a stack do projeto para IaC.[/bold red]")
-        raise typer.Exit(code=1)
-        
-    console.print(f"[bold green]✅ Stack detectada para IaC:[/bold green] {stack_info.name} (v{stack_info.version})")
-    
-    from ezops.generator import iac_generator
-    try:
-        iac_generator.generate_terraform(path, stack_info, provider.lower())
-    except ValueError as e:
-        console.print(f"[bold red]❌ Erro:[/bold red] {e}")
-        raise typer.Exit(code=1)
-    
-    console.print("[bold green]✨ Arquivo main.tf gerado com sucesso![/bold green]")
-    console.print("Recomendado: rode [bold yellow]terraform init && terraform apply[/bold yellow]")
+    timings.timed_import("ezops.commands.iac").run(path, provider, recursive, no_cache, force, diff, workload, scale, bake, target)
+
+@app.command()
+def analyze(
+    path: str = typer.Argument(
+        ".", help="O diretório do projeto para analisar"
+    ),
+    cost: bool = typer.Option(
+        False, "--cost", help="Estima o custo do build: contexto enviado ao daemon e camadas invalidadas"
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Imprime o relatório em JSON (para CI)"
+    ),
+    max_context_mb: Optional[float] = typer.Option(
+        None, "--max-context-mb", help="Falha (exit 1) se o contexto de build passar deste tamanho em MB"
+    ),
+    top: int = typer.Option(
+        10, "--top", help="Quantidade de maiores diretórios/arquivos listados"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Threads usadas no walk do contexto"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignora o cache de análise em .ezops/cache"
+    )
+):
+    """
+    Analisa o diretório e mostra a stack detectada. Com --cost, estima o
+    tamanho do contexto de build e quais camadas cada mudança invalida.
+    """
+    timings.timed_import("ezops.commands.analyze").run(
+        path, cost, json_output, max_context_mb, top, workers, no_cache
+    )
+
+@app.command()
+def batch(
+    paths: List[str] = typer.Argument(
+        None, help="Diretórios ou globs dos projetos (ex.: 'repos/*')"
+    ),
+    paths_file: Optional[str] = typer.Option(
+        None, "--from-file", help="Arquivo com um caminho (ou glob) por linha"
+    ),
+    iac: bool = typer.Option(
+        False, "--iac", help="Gera também o Terraform (main.tf) de cada projeto"
+    ),
+    provider: str = typer.Option(
+        "aws", help="Provedor de nuvem para o Terraform (aws, gcp, azure)"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Número de processos (padrão: número de CPUs)"
+    ),
+    summary: str = typer.Option(
+        "ezops-batch.json", "--summary", help="Arquivo JSON com o resumo da execução"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignora o cache de análise em .ezops/cache"
+    )
+):
+    """
+    Analisa e gera Dockerfile, docker-compose.yml (e Terraform, com --iac)
+    para vários projetos em paralelo, salvando um resumo em JSON.
+    """
+    timings.timed_import("ezops.commands.batch").run(
+        paths or [], paths_file, iac, provider, workers, summary, no_cache
+    )
 
 if __name__ == "__main__":
     app()
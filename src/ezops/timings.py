@@ -0,0 +1,69 @@
+"""
+Medição de tempos de import e das fases dos comandos da CLI.
+Ativado por `ezops --timings` ou pela variável EZOPS_IMPORT_PROFILE.
+Este módulo só usa a biblioteca padrão para não pesar na inicialização.
+"""
+import importlib
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+# Valores da variável que mantêm o profiling desligado
+_FALSE_VALUES = ("", "0", "false", "no")
+
+
+def _env_enabled() -> bool:
+    return os.environ.get("EZOPS_IMPORT_PROFILE", "").strip().lower() not in _FALSE_VALUES
+
+
+_enabled = _env_enabled()
+_records: List[Tuple[str, str, float]] = []  # (tipo, nome, segundos)
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def record(kind: str, name: str, seconds: float):
+    _records.append((kind, name, seconds))
+
+
+@contextmanager
+def phase(name: str):
+    """Mede a duração de uma fase do comando (ex.: análise, geração)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record("phase", name, time.perf_counter() - start)
+
+
+def timed_import(module_name: str):
+    """Importa um módulo sob demanda, registrando o tempo gasto se for o primeiro import."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    record("import", module_name, time.perf_counter() - start)
+    return module
+
+
+def report():
+    """Imprime a tabela de tempos no stderr."""
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="⏱️  EzOps timings")
+    table.add_column("Tipo")
+    table.add_column("Nome")
+    table.add_column("ms", justify="right")
+    for kind, name, seconds in _records:
+        table.add_row(kind, name, f"{seconds * 1000:.1f}")
+    Console(stderr=True).print(table)
@@ -0,0 +1,28 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.region
+}
+
+module "app" {
+  source = "./terraform/modules/aws-vm"
+
+  name            = var.name
+  instance_type   = var.instance_type
+  app_port        = var.app_port
+  ssh_cidr_blocks = var.ssh_cidr_blocks
+  tags            = var.tags
+
+  # Image baked by packer/app.pkr.hcl: Docker and the app are already installed
+  ami_owners      = ["self"]
+  ami_name_filter = "${var.name}-*"
+}
@@ -0,0 +1,96 @@
+packer {
+  required_plugins {
+    amazon = {
+      source  = "github.com/hashicorp/amazon"
+      version = "~> 1.3"
+    }
+  }
+}
+
+variable "name" {
+  description = "AMI name prefix (the Terraform boots the latest <name>-* AMI)"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "region" {
+  type    = string
+  default = "us-east-1"
+}
+
+variable "instance_type" {
+  type    = string
+  default = "t3.micro"
+}
+
+source "amazon-ebs" "app" {
+  ami_name      = "${var.name}-${local.timestamp}"
+  instance_type = var.instance_type
+  region        = var.region
+  ssh_username  = "ubuntu"
+
+  source_ami_filter {
+    filters = {
+      name                = "ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*"
+      root-device-type    = "ebs"
+      virtualization-type = "hvm"
+    }
+    most_recent = true
+    owners      = ["099720109477"] # Canonical
+  }
+
+  tags = {
+    Name      = var.name
+    ManagedBy = "EzOps"
+    Stack     = "python"
+  }
+}
+
+locals {
+  timestamp     = regex_replace(timestamp(), "[- TZ:]", "")
+  context       = "${path.root}/.."
+  image_archive = "${path.root}/app-image.tar.gz"
+}
+
+build {
+  sources = ["source.amazon-ebs.app"]
+
+  # Builds the app image locally (honoring .dockerignore and the local build
+  # cache) and ships it to the builder VM as a tarball
+  provisioner "shell-local" {
+    inline = [
+      "docker build --platform linux/amd64 -t ezops-app:latest ${local.context}",
+      "docker save ezops-app:latest | gzip > ${local.image_archive}",
+    ]
+  }
+
+  provisioner "file" {
+    source      = local.image_archive
+    destination = "/tmp/app-image.tar.gz"
+  }
+
+  provisioner "file" {
+    source      = "${path.root}/ezops-app.service"
+    destination = "/tmp/ezops-app.service"
+  }
+
+  # Same Docker install script the non-baked Terraform runs at boot
+  provisioner "shell" {
+    script = "${path.root}/../setup.sh"
+  }
+
+  provisioner "shell" {
+    inline = [
+      "gunzip -c /tmp/app-image.tar.gz | sudo docker load",
+      "rm -f /tmp/app-image.tar.gz",
+      "sudo mkdir -p /etc/ezops && sudo touch /etc/ezops/app.env",
+      "sudo mv /tmp/ezops-app.service /etc/systemd/system/ezops-app.service",
+      "sudo systemctl daemon-reload",
+      "sudo systemctl enable ezops-app.service",
+    ]
+  }
+
+  provisioner "shell-local" {
+    inline = ["rm -f ${local.image_archive}"]
+  }
+}
@@ -0,0 +1,14 @@
+output "public_ip" {
+  value       = aws_instance.app.public_ip
+  description = "Public IP of the EC2 instance"
+}
+
+output "instance_id" {
+  value       = aws_instance.app.id
+  description = "ID of the EC2 instance"
+}
+
+output "security_group_id" {
+  value       = aws_security_group.app.id
+  description = "ID of the app security group"
+}
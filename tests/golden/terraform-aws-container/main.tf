@@ -0,0 +1,29 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.region
+}
+
+module "app" {
+  source = "./terraform/modules/aws-ecs"
+
+  name          = var.name
+  image         = var.image
+  app_port      = var.app_port
+  cpu           = var.cpu
+  memory        = var.memory
+  min_instances = var.min_instances
+  max_instances = var.max_instances
+  cpu_target    = var.cpu_target
+  environment   = var.environment
+  tags          = var.tags
+}
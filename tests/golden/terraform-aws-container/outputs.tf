@@ -0,0 +1,9 @@
+output "url" {
+  value       = "http://${module.app.load_balancer_dns}"
+  description = "URL of the service"
+}
+
+output "cluster_name" {
+  value       = module.app.cluster_name
+  description = "ECS cluster running the service"
+}
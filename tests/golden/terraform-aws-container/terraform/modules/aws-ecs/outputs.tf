@@ -0,0 +1,14 @@
+output "load_balancer_dns" {
+  value       = aws_lb.app.dns_name
+  description = "DNS name of the Application Load Balancer"
+}
+
+output "cluster_name" {
+  value       = aws_ecs_cluster.app.name
+  description = "Name of the ECS cluster"
+}
+
+output "service_name" {
+  value       = aws_ecs_service.app.name
+  description = "Name of the ECS service"
+}
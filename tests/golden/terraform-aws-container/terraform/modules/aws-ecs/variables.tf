@@ -0,0 +1,72 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+}
+
+variable "image" {
+  description = "Container image of the app"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port the container listens on"
+  type        = number
+}
+
+variable "cpu" {
+  description = "Task CPU units (1024 = 1 vCPU)"
+  type        = number
+}
+
+variable "memory" {
+  description = "Task memory in MiB"
+  type        = number
+}
+
+variable "min_instances" {
+  description = "Minimum number of running tasks"
+  type        = number
+  default     = 1
+}
+
+variable "max_instances" {
+  description = "Maximum number of running tasks"
+  type        = number
+  default     = 10
+}
+
+variable "cpu_target" {
+  description = "Average service CPU utilization (%) tracked by the scaling policy"
+  type        = number
+  default     = 60
+}
+
+variable "health_check_path" {
+  description = "HTTP path probed by the target group"
+  type        = string
+  default     = "/"
+}
+
+variable "health_check_matcher" {
+  description = "HTTP codes that mark a task healthy (any response means the app is up)"
+  type        = string
+  default     = "200-499"
+}
+
+variable "log_retention_days" {
+  description = "Retention of the container logs in CloudWatch"
+  type        = number
+  default     = 14
+}
+
+variable "environment" {
+  description = "Environment variables of the container"
+  type        = map(string)
+  default     = {}
+}
+
+variable "tags" {
+  description = "Tags applied to the resources"
+  type        = map(string)
+  default     = {}
+}
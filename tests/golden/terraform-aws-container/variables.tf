@@ -0,0 +1,67 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "region" {
+  description = "AWS region"
+  type        = string
+  default     = "us-east-1"
+}
+
+variable "image" {
+  description = "Image built from the generated Dockerfile and pushed to a registry (e.g. ECR)"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port the python container listens on"
+  type        = number
+  default     = 8000
+}
+
+variable "cpu" {
+  description = "Task CPU units (sized by EzOps: 1 vCPU / 2 GB, concurrency 40, 1-10 instances, workload general)"
+  type        = number
+  default     = 1024
+}
+
+variable "memory" {
+  description = "Task memory in MiB"
+  type        = number
+  default     = 2048
+}
+
+variable "min_instances" {
+  description = "Minimum number of running tasks"
+  type        = number
+  default     = 1
+}
+
+variable "max_instances" {
+  description = "Maximum number of running tasks"
+  type        = number
+  default     = 10
+}
+
+variable "cpu_target" {
+  description = "Average service CPU utilization (%) tracked by the scaling policy"
+  type        = number
+  default     = 60
+}
+
+variable "environment" {
+  description = "Environment variables of the container"
+  type        = map(string)
+  default     = {}
+}
+
+variable "tags" {
+  description = "Tags applied to all resources"
+  type        = map(string)
+  default = {
+    ManagedBy = "EzOps"
+    Stack     = "python"
+  }
+}
@@ -0,0 +1,33 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.region
+}
+
+module "app" {
+  source = "./terraform/modules/aws-asg"
+
+  name            = var.name
+  instance_type   = var.instance_type
+  app_port        = var.app_port
+  ssh_cidr_blocks = var.ssh_cidr_blocks
+  tags            = var.tags
+
+  # Image baked by packer/app.pkr.hcl: Docker and the app are already installed
+  ami_owners      = ["self"]
+  ami_name_filter = "${var.name}-*"
+
+  min_size          = var.min_size
+  max_size          = var.max_size
+  cpu_target        = var.cpu_target
+  health_check_path = var.health_check_path
+}
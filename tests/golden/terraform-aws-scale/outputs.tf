@@ -0,0 +1,14 @@
+output "load_balancer_dns" {
+  value       = module.app.load_balancer_dns
+  description = "DNS name of the Application Load Balancer"
+}
+
+output "autoscaling_group" {
+  value       = module.app.autoscaling_group_name
+  description = "Name of the Auto Scaling Group"
+}
+
+output "instance_type" {
+  value       = var.instance_type
+  description = "Provisioned instance type"
+}
@@ -0,0 +1,19 @@
+output "load_balancer_dns" {
+  value       = aws_lb.app.dns_name
+  description = "DNS name of the Application Load Balancer"
+}
+
+output "autoscaling_group_name" {
+  value       = aws_autoscaling_group.app.name
+  description = "Name of the Auto Scaling Group"
+}
+
+output "target_group_arn" {
+  value       = aws_lb_target_group.app.arn
+  description = "ARN of the app target group"
+}
+
+output "security_group_id" {
+  value       = aws_security_group.app.id
+  description = "ID of the app security group"
+}
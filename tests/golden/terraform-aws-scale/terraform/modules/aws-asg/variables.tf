@@ -0,0 +1,80 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+}
+
+variable "instance_type" {
+  description = "EC2 instance type"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port exposed by the app"
+  type        = number
+}
+
+variable "min_size" {
+  description = "Minimum number of instances"
+  type        = number
+  default     = 1
+}
+
+variable "max_size" {
+  description = "Maximum number of instances"
+  type        = number
+  default     = 3
+}
+
+variable "cpu_target" {
+  description = "Average CPU utilization (%) tracked by the scaling policy"
+  type        = number
+  default     = 60
+}
+
+variable "health_check_path" {
+  description = "HTTP path probed by the target group"
+  type        = string
+  default     = "/"
+}
+
+variable "health_check_matcher" {
+  description = "HTTP codes that mark an instance healthy (any response means the app is up)"
+  type        = string
+  default     = "200-499"
+}
+
+variable "health_check_grace_period" {
+  description = "Seconds to wait after launch (Docker install + app start) before health checks count"
+  type        = number
+  default     = 300
+}
+
+variable "ssh_cidr_blocks" {
+  description = "CIDR blocks allowed to SSH"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "user_data" {
+  description = "Instance startup script"
+  type        = string
+  default     = ""
+}
+
+variable "ami_owners" {
+  description = "AMI owners (Canonical by default, self for a baked image)"
+  type        = list(string)
+  default     = ["099720109477"]
+}
+
+variable "ami_name_filter" {
+  description = "Ubuntu AMI name filter (resolved in the provider region)"
+  type        = string
+  default     = "ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*"
+}
+
+variable "tags" {
+  description = "Tags applied to the resources"
+  type        = map(string)
+  default     = {}
+}
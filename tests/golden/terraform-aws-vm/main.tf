@@ -0,0 +1,25 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.region
+}
+
+module "app" {
+  source = "./terraform/modules/aws-vm"
+
+  name            = var.name
+  instance_type   = var.instance_type
+  app_port        = var.app_port
+  ssh_cidr_blocks = var.ssh_cidr_blocks
+  user_data       = file("${path.module}/setup.sh")
+  tags            = var.tags
+}
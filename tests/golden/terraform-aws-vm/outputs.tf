@@ -0,0 +1,9 @@
+output "public_ip" {
+  value       = module.app.public_ip
+  description = "Public IP of the EC2 instance"
+}
+
+output "instance_type" {
+  value       = var.instance_type
+  description = "Provisioned instance type"
+}
@@ -0,0 +1,44 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+}
+
+variable "instance_type" {
+  description = "EC2 instance type"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port exposed by the app"
+  type        = number
+}
+
+variable "ssh_cidr_blocks" {
+  description = "CIDR blocks allowed to SSH"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "user_data" {
+  description = "Instance startup script"
+  type        = string
+  default     = ""
+}
+
+variable "ami_owners" {
+  description = "AMI owners (Canonical by default, self for a baked image)"
+  type        = list(string)
+  default     = ["099720109477"]
+}
+
+variable "ami_name_filter" {
+  description = "Ubuntu AMI name filter (resolved in the provider region)"
+  type        = string
+  default     = "ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*"
+}
+
+variable "tags" {
+  description = "Tags applied to the resources"
+  type        = map(string)
+  default     = {}
+}
@@ -0,0 +1,38 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "region" {
+  description = "AWS region"
+  type        = string
+  default     = "us-east-1"
+}
+
+variable "instance_type" {
+  description = "EC2 instance type (sized by EzOps: 2 vCPU / 1 GB, workload general)"
+  type        = string
+  default     = "t3.micro"
+}
+
+variable "app_port" {
+  description = "Port of the python app"
+  type        = number
+  default     = 8000
+}
+
+variable "ssh_cidr_blocks" {
+  description = "CIDR blocks allowed to SSH (restrict to your IP/VPN)"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "tags" {
+  description = "Tags applied to all resources"
+  type        = map(string)
+  default = {
+    ManagedBy = "EzOps"
+    Stack     = "python"
+  }
+}
@@ -0,0 +1,14 @@
+output "public_ip" {
+  value       = azurerm_public_ip.app.ip_address
+  description = "Public IP of the VM"
+}
+
+output "vm_id" {
+  value       = azurerm_linux_virtual_machine.app.id
+  description = "ID of the VM"
+}
+
+output "resource_group_name" {
+  value       = azurerm_resource_group.app.name
+  description = "Resource group holding the resources"
+}
@@ -0,0 +1,66 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+}
+
+variable "location" {
+  description = "Azure region"
+  type        = string
+}
+
+variable "vm_size" {
+  description = "Azure VM size"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port exposed by the app"
+  type        = number
+}
+
+variable "admin_username" {
+  description = "Admin user of the VM"
+  type        = string
+  default     = "ubuntu"
+}
+
+variable "public_key" {
+  description = "SSH public key of the admin user"
+  type        = string
+}
+
+variable "ssh_source_prefixes" {
+  description = "CIDR blocks allowed to SSH"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "address_space" {
+  description = "Address space of the virtual network"
+  type        = list(string)
+  default     = ["10.0.0.0/16"]
+}
+
+variable "subnet_prefixes" {
+  description = "Address prefixes of the subnet"
+  type        = list(string)
+  default     = ["10.0.2.0/24"]
+}
+
+variable "source_image_id" {
+  description = "Custom image ID (null boots the stock Ubuntu image)"
+  type        = string
+  default     = null
+}
+
+variable "custom_data" {
+  description = "Base64-encoded startup script"
+  type        = string
+  default     = null
+}
+
+variable "tags" {
+  description = "Tags applied to the resources"
+  type        = map(string)
+  default     = {}
+}
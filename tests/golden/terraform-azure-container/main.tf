@@ -0,0 +1,30 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    azurerm = {
+      source  = "hashicorp/azurerm"
+      version = "~> 3.0"
+    }
+  }
+}
+
+provider "azurerm" {
+  features {}
+}
+
+module "app" {
+  source = "./terraform/modules/azure-containerapp"
+
+  name          = var.name
+  location      = var.location
+  image         = var.image
+  app_port      = var.app_port
+  cpu           = var.cpu
+  memory        = var.memory
+  concurrency   = var.concurrency
+  min_instances = var.min_instances
+  max_instances = var.max_instances
+  environment   = var.environment
+  tags          = var.tags
+}
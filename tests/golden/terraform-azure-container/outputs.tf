@@ -0,0 +1,4 @@
+output "url" {
+  value       = module.app.url
+  description = "URL of the Container App"
+}
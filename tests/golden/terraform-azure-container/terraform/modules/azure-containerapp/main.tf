@@ -0,0 +1,72 @@
+# EzOps module: Azure Container App for a python app
+
+resource "azurerm_resource_group" "app" {
+  name     = "${var.name}-resources"
+  location = var.location
+  tags     = var.tags
+}
+
+resource "azurerm_log_analytics_workspace" "app" {
+  name                = "${var.name}-logs"
+  location            = azurerm_resource_group.app.location
+  resource_group_name = azurerm_resource_group.app.name
+  sku                 = "PerGB2018"
+  retention_in_days   = var.log_retention_days
+  tags                = var.tags
+}
+
+resource "azurerm_container_app_environment" "app" {
+  name                       = "${var.name}-env"
+  location                   = azurerm_resource_group.app.location
+  resource_group_name        = azurerm_resource_group.app.name
+  log_analytics_workspace_id = azurerm_log_analytics_workspace.app.id
+  tags                       = var.tags
+}
+
+resource "azurerm_container_app" "app" {
+  name                         = var.name
+  container_app_environment_id = azurerm_container_app_environment.app.id
+  resource_group_name          = azurerm_resource_group.app.name
+  revision_mode                = "Single"
+  tags                         = var.tags
+
+  template {
+    min_replicas = var.min_instances
+    max_replicas = var.max_instances
+
+    container {
+      name   = "app"
+      image  = var.image
+      cpu    = var.cpu
+      memory = var.memory
+
+      dynamic "env" {
+        for_each = var.environment
+        content {
+          name  = env.key
+          value = env.value
+        }
+      }
+
+      startup_probe {
+        transport = "TCP"
+        port      = var.app_port
+      }
+    }
+
+    http_scale_rule {
+      name                = "http-concurrency"
+      concurrent_requests = tostring(var.concurrency)
+    }
+  }
+
+  ingress {
+    external_enabled = true
+    target_port      = var.app_port
+
+    traffic_weight {
+      latest_revision = true
+      percentage      = 100
+    }
+  }
+}
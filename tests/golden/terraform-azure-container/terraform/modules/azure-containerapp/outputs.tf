@@ -0,0 +1,9 @@
+output "url" {
+  value       = "https://${azurerm_container_app.app.ingress[0].fqdn}"
+  description = "URL of the Container App"
+}
+
+output "resource_group_name" {
+  value       = azurerm_resource_group.app.name
+  description = "Resource group holding the resources"
+}
@@ -0,0 +1,67 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+}
+
+variable "location" {
+  description = "Azure region"
+  type        = string
+}
+
+variable "image" {
+  description = "Container image of the app"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port the container listens on"
+  type        = number
+}
+
+variable "cpu" {
+  description = "vCPUs per replica"
+  type        = number
+  default     = 0.5
+}
+
+variable "memory" {
+  description = "Memory per replica"
+  type        = string
+  default     = "1Gi"
+}
+
+variable "concurrency" {
+  description = "Concurrent requests per replica before scaling out"
+  type        = number
+  default     = 80
+}
+
+variable "min_instances" {
+  description = "Minimum number of replicas (0 scales to zero)"
+  type        = number
+  default     = 0
+}
+
+variable "max_instances" {
+  description = "Maximum number of replicas"
+  type        = number
+  default     = 10
+}
+
+variable "log_retention_days" {
+  description = "Retention of the container logs in Log Analytics"
+  type        = number
+  default     = 30
+}
+
+variable "environment" {
+  description = "Environment variables of the container"
+  type        = map(string)
+  default     = {}
+}
+
+variable "tags" {
+  description = "Tags applied to the resources"
+  type        = map(string)
+  default     = {}
+}
@@ -0,0 +1,67 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "location" {
+  description = "Azure region"
+  type        = string
+  default     = "East US"
+}
+
+variable "image" {
+  description = "Image built from the generated Dockerfile and pushed to a public registry"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port the python container listens on"
+  type        = number
+  default     = 8000
+}
+
+variable "cpu" {
+  description = "vCPUs per replica (sized by EzOps: 1 vCPU / 2 GB, concurrency 40, 0-10 instances, workload general)"
+  type        = number
+  default     = 1
+}
+
+variable "memory" {
+  description = "Memory per replica (2Gi per vCPU on the consumption plan)"
+  type        = string
+  default     = "2Gi"
+}
+
+variable "concurrency" {
+  description = "Concurrent requests per replica before scaling out"
+  type        = number
+  default     = 40
+}
+
+variable "min_instances" {
+  description = "Minimum number of replicas (0 scales to zero)"
+  type        = number
+  default     = 0
+}
+
+variable "max_instances" {
+  description = "Maximum number of replicas"
+  type        = number
+  default     = 10
+}
+
+variable "environment" {
+  description = "Environment variables of the container"
+  type        = map(string)
+  default     = {}
+}
+
+variable "tags" {
+  description = "Tags applied to all resources"
+  type        = map(string)
+  default = {
+    ManagedBy = "EzOps"
+    Stack     = "python"
+  }
+}
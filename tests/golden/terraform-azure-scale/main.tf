@@ -0,0 +1,39 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    azurerm = {
+      source  = "hashicorp/azurerm"
+      version = "~> 3.0"
+    }
+  }
+}
+
+provider "azurerm" {
+  features {}
+}
+
+# Latest image baked by packer/app.pkr.hcl: Docker and the app are already installed
+data "azurerm_image" "app" {
+  name_regex          = "^${var.name}-"
+  sort_descending     = true
+  resource_group_name = var.image_resource_group
+}
+
+module "app" {
+  source = "./terraform/modules/azure-vmss"
+
+  name                = var.name
+  location            = var.location
+  vm_size             = var.vm_size
+  app_port            = var.app_port
+  admin_username      = var.admin_username
+  public_key          = file(var.ssh_public_key_path)
+  ssh_source_prefixes = var.ssh_source_prefixes
+  source_image_id     = data.azurerm_image.app.id
+  tags                = var.tags
+
+  min_size   = var.min_size
+  max_size   = var.max_size
+  cpu_target = var.cpu_target
+}
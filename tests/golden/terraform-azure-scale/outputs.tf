@@ -0,0 +1,14 @@
+output "load_balancer_ip" {
+  value       = module.app.load_balancer_ip
+  description = "Public IP of the load balancer"
+}
+
+output "scale_set_id" {
+  value       = module.app.scale_set_id
+  description = "ID of the VM Scale Set"
+}
+
+output "vm_size" {
+  value       = var.vm_size
+  description = "Provisioned VM size"
+}
@@ -0,0 +1,97 @@
+packer {
+  required_plugins {
+    azure = {
+      source  = "github.com/hashicorp/azure"
+      version = "~> 2.0"
+    }
+  }
+}
+
+variable "name" {
+  description = "Managed image name prefix (the Terraform boots the latest <name>-* image)"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "image_resource_group" {
+  description = "Existing resource group that stores the baked images"
+  type        = string
+  default     = "ezops-images"
+}
+
+variable "location" {
+  type    = string
+  default = "East US"
+}
+
+variable "vm_size" {
+  type    = string
+  default = "Standard_B1s"
+}
+
+source "azure-arm" "app" {
+  use_azure_cli_auth                = true
+  managed_image_name                = "${var.name}-${local.timestamp}"
+  managed_image_resource_group_name = var.image_resource_group
+  location                          = var.location
+  vm_size                           = var.vm_size
+  os_type                           = "Linux"
+  image_publisher                   = "Canonical"
+  image_offer                       = "0001-com-ubuntu-server-jammy"
+  image_sku                         = "22_04-lts-gen2"
+
+  azure_tags = {
+    ManagedBy = "EzOps"
+    Stack     = "python"
+  }
+}
+
+locals {
+  timestamp     = regex_replace(timestamp(), "[- TZ:]", "")
+  context       = "${path.root}/.."
+  image_archive = "${path.root}/app-image.tar.gz"
+}
+
+build {
+  sources = ["source.azure-arm.app"]
+
+  # Builds the app image locally (honoring .dockerignore and the local build
+  # cache) and ships it to the builder VM as a tarball
+  provisioner "shell-local" {
+    inline = [
+      "docker build --platform linux/amd64 -t ezops-app:latest ${local.context}",
+      "docker save ezops-app:latest | gzip > ${local.image_archive}",
+    ]
+  }
+
+  provisioner "file" {
+    source      = local.image_archive
+    destination = "/tmp/app-image.tar.gz"
+  }
+
+  provisioner "file" {
+    source      = "${path.root}/ezops-app.service"
+    destination = "/tmp/ezops-app.service"
+  }
+
+  # Same Docker install script the non-baked Terraform runs at boot
+  provisioner "shell" {
+    script = "${path.root}/../setup.sh"
+  }
+
+  provisioner "shell" {
+    inline = [
+      "gunzip -c /tmp/app-image.tar.gz | sudo docker load",
+      "rm -f /tmp/app-image.tar.gz",
+      "sudo mkdir -p /etc/ezops && sudo touch /etc/ezops/app.env",
+      "sudo mv /tmp/ezops-app.service /etc/systemd/system/ezops-app.service",
+      "sudo systemctl daemon-reload",
+      "sudo systemctl enable ezops-app.service",
+      "sudo /usr/sbin/waagent -force -deprovision+user && export HISTSIZE=0 && sync",
+    ]
+  }
+
+  provisioner "shell-local" {
+    inline = ["rm -f ${local.image_archive}"]
+  }
+}
@@ -0,0 +1,221 @@
+# EzOps module: VM Scale Set behind a Standard load balancer for a python app
+
+resource "azurerm_resource_group" "app" {
+  name     = "${var.name}-resources"
+  location = var.location
+  tags     = var.tags
+}
+
+resource "azurerm_virtual_network" "app" {
+  name                = "${var.name}-vnet"
+  address_space       = var.address_space
+  location            = azurerm_resource_group.app.location
+  resource_group_name = azurerm_resource_group.app.name
+  tags                = var.tags
+}
+
+resource "azurerm_subnet" "app" {
+  name                 = "internal"
+  resource_group_name  = azurerm_resource_group.app.name
+  virtual_network_name = azurerm_virtual_network.app.name
+  address_prefixes     = var.subnet_prefixes
+}
+
+resource "azurerm_network_security_group" "app" {
+  name                = "${var.name}-nsg"
+  location            = azurerm_resource_group.app.location
+  resource_group_name = azurerm_resource_group.app.name
+  tags                = var.tags
+
+  security_rule {
+    name                       = "Allow-SSH"
+    priority                   = 100
+    direction                  = "Inbound"
+    access                     = "Allow"
+    protocol                   = "Tcp"
+    source_port_range          = "*"
+    destination_port_range     = "22"
+    source_address_prefixes    = var.ssh_source_prefixes
+    destination_address_prefix = "*"
+  }
+
+  security_rule {
+    name                       = "Allow-App"
+    priority                   = 110
+    direction                  = "Inbound"
+    access                     = "Allow"
+    protocol                   = "Tcp"
+    source_port_range          = "*"
+    destination_port_range     = tostring(var.app_port)
+    source_address_prefix      = "*"
+    destination_address_prefix = "*"
+  }
+}
+
+resource "azurerm_subnet_network_security_group_association" "app" {
+  subnet_id                 = azurerm_subnet.app.id
+  network_security_group_id = azurerm_network_security_group.app.id
+}
+
+resource "azurerm_public_ip" "lb" {
+  name                = "${var.name}-lb-ip"
+  resource_group_name = azurerm_resource_group.app.name
+  location            = azurerm_resource_group.app.location
+  allocation_method   = "Static"
+  sku                 = "Standard"
+  tags                = var.tags
+}
+
+resource "azurerm_lb" "app" {
+  name                = "${var.name}-lb"
+  location            = azurerm_resource_group.app.location
+  resource_group_name = azurerm_resource_group.app.name
+  sku                 = "Standard"
+  tags                = var.tags
+
+  frontend_ip_configuration {
+    name                 = "public"
+    public_ip_address_id = azurerm_public_ip.lb.id
+  }
+}
+
+resource "azurerm_lb_backend_address_pool" "app" {
+  name            = "${var.name}-pool"
+  loadbalancer_id = azurerm_lb.app.id
+}
+
+resource "azurerm_lb_probe" "app" {
+  name                = "${var.name}-probe"
+  loadbalancer_id     = azurerm_lb.app.id
+  protocol            = "Tcp"
+  port                = var.app_port
+  interval_in_seconds = 15
+  number_of_probes    = 3
+}
+
+resource "azurerm_lb_rule" "http" {
+  name                           = "http"
+  loadbalancer_id                = azurerm_lb.app.id
+  protocol                       = "Tcp"
+  frontend_port                  = 80
+  backend_port                   = var.app_port
+  frontend_ip_configuration_name = "public"
+  backend_address_pool_ids       = [azurerm_lb_backend_address_pool.app.id]
+  probe_id                       = azurerm_lb_probe.app.id
+}
+
+resource "azurerm_linux_virtual_machine_scale_set" "app" {
+  name                = "${var.name}-vmss"
+  resource_group_name = azurerm_resource_group.app.name
+  location            = azurerm_resource_group.app.location
+  sku                 = var.vm_size
+  instances           = var.min_size
+  admin_username      = var.admin_username
+  health_probe_id     = azurerm_lb_probe.app.id
+  custom_data         = var.custom_data
+  tags                = var.tags
+
+  admin_ssh_key {
+    username   = var.admin_username
+    public_key = var.public_key
+  }
+
+  os_disk {
+    caching              = "ReadWrite"
+    storage_account_type = "Standard_LRS"
+  }
+
+  source_image_id = var.source_image_id
+
+  dynamic "source_image_reference" {
+    for_each = var.source_image_id == null ? [1] : []
+    content {
+      publisher = "Canonical"
+      offer     = "0001-com-ubuntu-server-jammy"
+      sku       = "22_04-lts-gen2"
+      version   = "latest"
+    }
+  }
+
+  network_interface {
+    name    = "${var.name}-nic"
+    primary = true
+
+    ip_configuration {
+      name                                   = "internal"
+      primary                                = true
+      subnet_id                              = azurerm_subnet.app.id
+      load_balancer_backend_address_pool_ids = [azurerm_lb_backend_address_pool.app.id]
+    }
+  }
+
+  automatic_instance_repair {
+    enabled      = true
+    grace_period = var.health_check_grace_period
+  }
+
+  # Instance count is owned by the autoscale setting after creation
+  lifecycle {
+    ignore_changes = [instances]
+  }
+
+  depends_on = [azurerm_lb_rule.http]
+}
+
+resource "azurerm_monitor_autoscale_setting" "app" {
+  name                = "${var.name}-autoscale"
+  resource_group_name = azurerm_resource_group.app.name
+  location            = azurerm_resource_group.app.location
+  target_resource_id  = azurerm_linux_virtual_machine_scale_set.app.id
+  tags                = var.tags
+
+  profile {
+    name = "cpu"
+
+    capacity {
+      default = var.min_size
+      minimum = var.min_size
+      maximum = var.max_size
+    }
+
+    rule {
+      metric_trigger {
+        metric_name        = "Percentage CPU"
+        metric_resource_id = azurerm_linux_virtual_machine_scale_set.app.id
+        time_grain         = "PT1M"
+        statistic          = "Average"
+        time_window        = "PT5M"
+        time_aggregation   = "Average"
+        operator           = "GreaterThan"
+        threshold          = var.cpu_target
+      }
+
+      scale_action {
+        direction = "Increase"
+        type      = "ChangeCount"
+        value     = "1"
+        cooldown  = "PT5M"
+      }
+    }
+
+    rule {
+      metric_trigger {
+        metric_name        = "Percentage CPU"
+        metric_resource_id = azurerm_linux_virtual_machine_scale_set.app.id
+        time_grain         = "PT1M"
+        statistic          = "Average"
+        time_window        = "PT10M"
+        time_aggregation   = "Average"
+        operator           = "LessThan"
+        threshold          = var.cpu_target / 2
+      }
+
+      scale_action {
+        direction = "Decrease"
+        type      = "ChangeCount"
+        value     = "1"
+        cooldown  = "PT10M"
+      }
+    }
+  }
+}
@@ -0,0 +1,14 @@
+output "load_balancer_ip" {
+  value       = azurerm_public_ip.lb.ip_address
+  description = "Public IP of the load balancer"
+}
+
+output "scale_set_id" {
+  value       = azurerm_linux_virtual_machine_scale_set.app.id
+  description = "ID of the VM Scale Set"
+}
+
+output "resource_group_name" {
+  value       = azurerm_resource_group.app.name
+  description = "Resource group holding the resources"
+}
@@ -0,0 +1,79 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "location" {
+  description = "Azure region"
+  type        = string
+  default     = "East US"
+}
+
+variable "vm_size" {
+  description = "Azure VM size (sized by EzOps: 1 vCPU / 1 GB, workload general)"
+  type        = string
+  default     = "Standard_B1s"
+}
+
+variable "app_port" {
+  description = "Port of the python app"
+  type        = number
+  default     = 8000
+}
+
+variable "admin_username" {
+  description = "Admin user of the VM"
+  type        = string
+  default     = "ubuntu"
+}
+
+variable "ssh_public_key_path" {
+  description = "Local SSH public key installed for the admin user"
+  type        = string
+  default     = "~/.ssh/id_rsa.pub"
+}
+
+variable "ssh_source_prefixes" {
+  description = "CIDR blocks allowed to SSH (restrict to your IP/VPN)"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "tags" {
+  description = "Tags applied to all resources"
+  type        = map(string)
+  default = {
+    ManagedBy = "EzOps"
+    Stack     = "python"
+  }
+}
+
+variable "min_size" {
+  description = "Minimum number of instances"
+  type        = number
+  default     = 1
+}
+
+variable "max_size" {
+  description = "Maximum number of instances"
+  type        = number
+  default     = 3
+}
+
+variable "cpu_target" {
+  description = "Average CPU utilization (%) the autoscaler keeps the group at"
+  type        = number
+  default     = 60
+
+  validation {
+    condition     = var.cpu_target > 0 && var.cpu_target <= 100
+    error_message = "cpu_target must be a percentage between 1 and 100."
+  }
+}
+
+variable "image_resource_group" {
+  description = "Resource group with the images baked by Packer"
+  type        = string
+  default     = "ezops-images"
+}
@@ -0,0 +1,28 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    azurerm = {
+      source  = "hashicorp/azurerm"
+      version = "~> 3.0"
+    }
+  }
+}
+
+provider "azurerm" {
+  features {}
+}
+
+module "app" {
+  source = "./terraform/modules/azure-vm"
+
+  name                = var.name
+  location            = var.location
+  vm_size             = var.vm_size
+  app_port            = var.app_port
+  admin_username      = var.admin_username
+  public_key          = file(var.ssh_public_key_path)
+  ssh_source_prefixes = var.ssh_source_prefixes
+  custom_data         = base64encode(file("${path.module}/setup.sh"))
+  tags                = var.tags
+}
@@ -0,0 +1,9 @@
+output "public_ip" {
+  value       = module.app.public_ip
+  description = "Public IP of the VM"
+}
+
+output "vm_size" {
+  value       = var.vm_size
+  description = "Provisioned VM size"
+}
@@ -0,0 +1,117 @@
+# EzOps module: Linux VM running Docker for a python app
+
+resource "azurerm_resource_group" "app" {
+  name     = "${var.name}-resources"
+  location = var.location
+  tags     = var.tags
+}
+
+resource "azurerm_public_ip" "app" {
+  name                = "${var.name}-public-ip"
+  resource_group_name = azurerm_resource_group.app.name
+  location            = azurerm_resource_group.app.location
+  allocation_method   = "Static"
+  sku                 = "Standard"
+  tags                = var.tags
+}
+
+resource "azurerm_virtual_network" "app" {
+  name                = "${var.name}-vnet"
+  address_space       = var.address_space
+  location            = azurerm_resource_group.app.location
+  resource_group_name = azurerm_resource_group.app.name
+  tags                = var.tags
+}
+
+resource "azurerm_subnet" "app" {
+  name                 = "internal"
+  resource_group_name  = azurerm_resource_group.app.name
+  virtual_network_name = azurerm_virtual_network.app.name
+  address_prefixes     = var.subnet_prefixes
+}
+
+resource "azurerm_network_interface" "app" {
+  name                = "${var.name}-nic"
+  location            = azurerm_resource_group.app.location
+  resource_group_name = azurerm_resource_group.app.name
+  tags                = var.tags
+
+  ip_configuration {
+    name                          = "internal"
+    subnet_id                     = azurerm_subnet.app.id
+    private_ip_address_allocation = "Dynamic"
+    public_ip_address_id          = azurerm_public_ip.app.id
+  }
+}
+
+resource "azurerm_network_security_group" "app" {
+  name                = "${var.name}-nsg"
+  location            = azurerm_resource_group.app.location
+  resource_group_name = azurerm_resource_group.app.name
+  tags                = var.tags
+
+  security_rule {
+    name                       = "Allow-SSH"
+    priority                   = 100
+    direction                  = "Inbound"
+    access                     = "Allow"
+    protocol                   = "Tcp"
+    source_port_range          = "*"
+    destination_port_range     = "22"
+    source_address_prefixes    = var.ssh_source_prefixes
+    destination_address_prefix = "*"
+  }
+
+  security_rule {
+    name                       = "Allow-App"
+    priority                   = 110
+    direction                  = "Inbound"
+    access                     = "Allow"
+    protocol                   = "Tcp"
+    source_port_range          = "*"
+    destination_port_ranges    = ["80", tostring(var.app_port)]
+    source_address_prefix      = "*"
+    destination_address_prefix = "*"
+  }
+}
+
+resource "azurerm_network_interface_security_group_association" "app" {
+  network_interface_id      = azurerm_network_interface.app.id
+  network_security_group_id = azurerm_network_security_group.app.id
+}
+
+resource "azurerm_linux_virtual_machine" "app" {
+  name                = "${var.name}-vm"
+  resource_group_name = azurerm_resource_group.app.name
+  location            = azurerm_resource_group.app.location
+  size                = var.vm_size
+  admin_username      = var.admin_username
+  network_interface_ids = [
+    azurerm_network_interface.app.id,
+  ]
+
+  admin_ssh_key {
+    username   = var.admin_username
+    public_key = var.public_key
+  }
+
+  os_disk {
+    caching              = "ReadWrite"
+    storage_account_type = "Standard_LRS"
+  }
+
+  source_image_id = var.source_image_id
+
+  dynamic "source_image_reference" {
+    for_each = var.source_image_id == null ? [1] : []
+    content {
+      publisher = "Canonical"
+      offer     = "0001-com-ubuntu-server-jammy"
+      sku       = "22_04-lts-gen2"
+      version   = "latest"
+    }
+  }
+
+  custom_data = var.custom_data
+  tags        = var.tags
+}
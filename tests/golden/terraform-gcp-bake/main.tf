@@ -0,0 +1,28 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    google = {
+      source  = "hashicorp/google"
+      version = "~> 5.0"
+    }
+  }
+}
+
+provider "google" {
+  project = var.project_id
+  region  = var.region
+  zone    = var.zone
+}
+
+module "app" {
+  source = "./terraform/modules/gcp-vm"
+
+  name              = var.name
+  machine_type      = var.machine_type
+  zone              = var.zone
+  app_port          = var.app_port
+  ssh_source_ranges = var.ssh_source_ranges
+  image             = "${var.project_id}/${var.name}" # Image family baked by packer/app.pkr.hcl
+  labels            = var.labels
+}
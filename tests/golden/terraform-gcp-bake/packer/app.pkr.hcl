@@ -0,0 +1,92 @@
+packer {
+  required_plugins {
+    googlecompute = {
+      source  = "github.com/hashicorp/googlecompute"
+      version = "~> 1.1"
+    }
+  }
+}
+
+variable "project_id" {
+  type = string
+}
+
+variable "name" {
+  description = "Image family (the Terraform boots the latest image of this family)"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "zone" {
+  type    = string
+  default = "us-central1-a"
+}
+
+variable "machine_type" {
+  type    = string
+  default = "e2-micro"
+}
+
+source "googlecompute" "app" {
+  project_id          = var.project_id
+  zone                = var.zone
+  machine_type        = var.machine_type
+  source_image_family = "ubuntu-2204-lts"
+  image_name          = "${var.name}-${local.timestamp}"
+  image_family        = var.name
+  ssh_username        = "ubuntu"
+
+  image_labels = {
+    managed_by = "ezops"
+    stack      = "python"
+  }
+}
+
+locals {
+  timestamp     = regex_replace(timestamp(), "[- TZ:]", "")
+  context       = "${path.root}/.."
+  image_archive = "${path.root}/app-image.tar.gz"
+}
+
+build {
+  sources = ["source.googlecompute.app"]
+
+  # Builds the app image locally (honoring .dockerignore and the local build
+  # cache) and ships it to the builder VM as a tarball
+  provisioner "shell-local" {
+    inline = [
+      "docker build --platform linux/amd64 -t ezops-app:latest ${local.context}",
+      "docker save ezops-app:latest | gzip > ${local.image_archive}",
+    ]
+  }
+
+  provisioner "file" {
+    source      = local.image_archive
+    destination = "/tmp/app-image.tar.gz"
+  }
+
+  provisioner "file" {
+    source      = "${path.root}/ezops-app.service"
+    destination = "/tmp/ezops-app.service"
+  }
+
+  # Same Docker install script the non-baked Terraform runs at boot
+  provisioner "shell" {
+    script = "${path.root}/../setup.sh"
+  }
+
+  provisioner "shell" {
+    inline = [
+      "gunzip -c /tmp/app-image.tar.gz | sudo docker load",
+      "rm -f /tmp/app-image.tar.gz",
+      "sudo mkdir -p /etc/ezops && sudo touch /etc/ezops/app.env",
+      "sudo mv /tmp/ezops-app.service /etc/systemd/system/ezops-app.service",
+      "sudo systemctl daemon-reload",
+      "sudo systemctl enable ezops-app.service",
+    ]
+  }
+
+  provisioner "shell-local" {
+    inline = ["rm -f ${local.image_archive}"]
+  }
+}
@@ -0,0 +1,51 @@
+# EzOps module: Compute Engine instance running Docker for a python app
+
+resource "google_compute_firewall" "app" {
+  name    = "${var.name}-firewall"
+  network = var.network
+
+  allow {
+    protocol = "tcp"
+    ports    = ["80", tostring(var.app_port)]
+  }
+
+  source_ranges = ["0.0.0.0/0"]
+  target_tags   = [var.name]
+}
+
+resource "google_compute_firewall" "ssh" {
+  name    = "${var.name}-ssh"
+  network = var.network
+
+  allow {
+    protocol = "tcp"
+    ports    = ["22"]
+  }
+
+  source_ranges = var.ssh_source_ranges
+  target_tags   = [var.name]
+}
+
+resource "google_compute_instance" "app" {
+  name         = "${var.name}-server"
+  machine_type = var.machine_type
+  zone         = var.zone
+
+  boot_disk {
+    initialize_params {
+      image = var.image
+    }
+  }
+
+  network_interface {
+    network = var.network
+    access_config {
+      # Ephemeral public IP
+    }
+  }
+
+  metadata_startup_script = var.startup_script
+
+  tags   = [var.name]
+  labels = var.labels
+}
@@ -0,0 +1,9 @@
+output "public_ip" {
+  value       = google_compute_instance.app.network_interface[0].access_config[0].nat_ip
+  description = "Public IP of the Compute Engine instance"
+}
+
+output "instance_id" {
+  value       = google_compute_instance.app.instance_id
+  description = "ID of the Compute Engine instance"
+}
@@ -0,0 +1,49 @@
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+}
+
+variable "machine_type" {
+  description = "Compute Engine machine type"
+  type        = string
+}
+
+variable "zone" {
+  description = "GCP zone"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port exposed by the app"
+  type        = number
+}
+
+variable "network" {
+  description = "VPC network"
+  type        = string
+  default     = "default"
+}
+
+variable "image" {
+  description = "Boot disk image"
+  type        = string
+  default     = "ubuntu-os-cloud/ubuntu-2204-lts"
+}
+
+variable "ssh_source_ranges" {
+  description = "CIDR blocks allowed to SSH"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "startup_script" {
+  description = "Instance startup script"
+  type        = string
+  default     = ""
+}
+
+variable "labels" {
+  description = "Labels applied to the resources"
+  type        = map(string)
+  default     = {}
+}
@@ -0,0 +1,32 @@
+terraform {
+  required_version = ">= 1.3"
+
+  required_providers {
+    google = {
+      source  = "hashicorp/google"
+      version = "~> 5.0"
+    }
+  }
+}
+
+provider "google" {
+  project = var.project_id
+  region  = var.region
+}
+
+module "app" {
+  source = "./terraform/modules/gcp-cloudrun"
+
+  name          = var.name
+  region        = var.region
+  image         = var.image
+  app_port      = var.app_port
+  cpu           = var.cpu
+  memory        = var.memory
+  concurrency   = var.concurrency
+  min_instances = var.min_instances
+  max_instances = var.max_instances
+  public        = var.public
+  environment   = var.environment
+  labels        = var.labels
+}
@@ -0,0 +1,59 @@
+# EzOps module: Cloud Run service for a python app
+
+resource "google_cloud_run_v2_service" "app" {
+  name     = var.name
+  location = var.region
+  ingress  = "INGRESS_TRAFFIC_ALL"
+  labels   = var.labels
+
+  template {
+    max_instance_request_concurrency = var.concurrency
+
+    scaling {
+      min_instance_count = var.min_instances
+      max_instance_count = var.max_instances
+    }
+
+    containers {
+      image = var.image
+
+      ports {
+        container_port = var.app_port
+      }
+
+      resources {
+        limits = {
+          cpu    = var.cpu
+          memory = var.memory
+        }
+        cpu_idle          = true # CPU only billed while serving requests
+        startup_cpu_boost = true
+      }
+
+      dynamic "env" {
+        for_each = var.environment
+        content {
+          name  = env.key
+          value = env.value
+        }
+      }
+
+      startup_probe {
+        tcp_socket {
+          port = var.app_port
+        }
+        period_seconds    = 2
+        failure_threshold = 30
+      }
+    }
+  }
+}
+
+resource "google_cloud_run_v2_service_iam_member" "public" {
+  count = var.public ? 1 : 0
+
+  name     = google_cloud_run_v2_service.app.name
+  location = google_cloud_run_v2_service.app.location
+  role     = "roles/run.invoker"
+  member   = "allUsers"
+}
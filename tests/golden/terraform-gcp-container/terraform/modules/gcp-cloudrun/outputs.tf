@@ -0,0 +1,9 @@
+output "url" {
+  value       = google_cloud_run_v2_service.app.uri
+  description = "URL of the Cloud Run service"
+}
+
+output "service_name" {
+  value       = google_cloud_run_v2_service.app.name
+  description = "Name of the Cloud Run service"
+}
@@ -0,0 +1,67 @@
+variable "name" {
+  description = "Name of the Cloud Run service"
+  type        = string
+}
+
+variable "region" {
+  description = "GCP region"
+  type        = string
+}
+
+variable "image" {
+  description = "Container image of the app"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port the container listens on"
+  type        = number
+}
+
+variable "cpu" {
+  description = "vCPUs per instance"
+  type        = string
+  default     = "1"
+}
+
+variable "memory" {
+  description = "Memory per instance"
+  type        = string
+  default     = "512Mi"
+}
+
+variable "concurrency" {
+  description = "Maximum concurrent requests per instance"
+  type        = number
+  default     = 80
+}
+
+variable "min_instances" {
+  description = "Minimum number of instances (0 scales to zero)"
+  type        = number
+  default     = 0
+}
+
+variable "max_instances" {
+  description = "Maximum number of instances"
+  type        = number
+  default     = 10
+}
+
+variable "public" {
+  description = "Allow unauthenticated invocations"
+  type        = bool
+  default     = true
+}
+
+variable "environment" {
+  description = "Environment variables of the container"
+  type        = map(string)
+  default     = {}
+}
+
+variable "labels" {
+  description = "Labels applied to the resources"
+  type        = map(string)
+  default     = {}
+}
@@ -0,0 +1,78 @@
+variable "project_id" {
+  description = "GCP project ID"
+  type        = string
+}
+
+variable "name" {
+  description = "Name of the Cloud Run service"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "region" {
+  description = "GCP region"
+  type        = string
+  default     = "us-central1"
+}
+
+variable "image" {
+  description = "Image built from the generated Dockerfile and pushed to a registry (e.g. Artifact Registry)"
+  type        = string
+}
+
+variable "app_port" {
+  description = "Port the python container listens on"
+  type        = number
+  default     = 8000
+}
+
+variable "cpu" {
+  description = "vCPUs per instance (sized by EzOps: 1 vCPU / 2 GB, concurrency 40, 0-10 instances, workload general)"
+  type        = string
+  default     = "1"
+}
+
+variable "memory" {
+  description = "Memory per instance"
+  type        = string
+  default     = "2Gi"
+}
+
+variable "concurrency" {
+  description = "Maximum concurrent requests per instance"
+  type        = number
+  default     = 40
+}
+
+variable "min_instances" {
+  description = "Minimum number of instances (0 scales to zero)"
+  type        = number
+  default     = 0
+}
+
+variable "max_instances" {
+  description = "Maximum number of instances"
+  type        = number
+  default     = 10
+}
+
+variable "public" {
+  description = "Allow unauthenticated invocations"
+  type        = bool
+  default     = true
+}
+
+variable "environment" {
+  description = "Environment variables of the container"
+  type        = map(string)
+  default     = {}
+}
+
+variable "labels" {
+  description = "Labels applied to all resources"
+  type        = map(string)
+  default = {
+    managed_by = "ezops"
+    stack      = "python"
+  }
+}
@@ -0,0 +1,14 @@
+output "load_balancer_ip" {
+  value       = module.app.load_balancer_ip
+  description = "Public IP of the HTTP load balancer"
+}
+
+output "instance_group" {
+  value       = module.app.instance_group
+  description = "Managed instance group"
+}
+
+output "machine_type" {
+  value       = var.machine_type
+  description = "Provisioned machine type"
+}
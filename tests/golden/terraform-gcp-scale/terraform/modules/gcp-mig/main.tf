@@ -0,0 +1,139 @@
+# EzOps module: Managed Instance Group behind an HTTP load balancer for a python app
+
+resource "google_compute_instance_template" "app" {
+  name_prefix  = "${var.name}-"
+  machine_type = var.machine_type
+
+  disk {
+    source_image = var.image
+    boot         = true
+    auto_delete  = true
+  }
+
+  network_interface {
+    network = var.network
+    access_config {
+      # Ephemeral public IP (Docker install and SSH)
+    }
+  }
+
+  metadata_startup_script = var.startup_script
+
+  tags   = [var.name]
+  labels = var.labels
+
+  lifecycle {
+    create_before_destroy = true
+  }
+}
+
+resource "google_compute_health_check" "app" {
+  name                = "${var.name}-health"
+  check_interval_sec  = 15
+  timeout_sec         = 5
+  healthy_threshold   = 2
+  unhealthy_threshold = 3
+
+  tcp_health_check {
+    port = var.app_port
+  }
+}
+
+resource "google_compute_instance_group_manager" "app" {
+  name               = "${var.name}-mig"
+  zone               = var.zone
+  base_instance_name = var.name
+
+  version {
+    instance_template = google_compute_instance_template.app.id
+  }
+
+  named_port {
+    name = "http"
+    port = var.app_port
+  }
+
+  auto_healing_policies {
+    health_check      = google_compute_health_check.app.id
+    initial_delay_sec = var.health_check_grace_period
+  }
+}
+
+resource "google_compute_autoscaler" "app" {
+  name   = "${var.name}-autoscaler"
+  zone   = var.zone
+  target = google_compute_instance_group_manager.app.id
+
+  autoscaling_policy {
+    min_replicas    = var.min_size
+    max_replicas    = var.max_size
+    cooldown_period = 60
+
+    cpu_utilization {
+      target = var.cpu_target / 100
+    }
+  }
+}
+
+resource "google_compute_backend_service" "app" {
+  name                  = "${var.name}-backend"
+  protocol              = "HTTP"
+  port_name             = "http"
+  load_balancing_scheme = "EXTERNAL"
+  health_checks         = [google_compute_health_check.app.id]
+
+  backend {
+    group           = google_compute_instance_group_manager.app.instance_group
+    balancing_mode  = "UTILIZATION"
+    capacity_scaler = 1.0
+  }
+}
+
+resource "google_compute_url_map" "app" {
+  name            = "${var.name}-url-map"
+  default_service = google_compute_backend_service.app.id
+}
+
+resource "google_compute_target_http_proxy" "app" {
+  name    = "${var.name}-http-proxy"
+  url_map = google_compute_url_map.app.id
+}
+
+resource "google_compute_global_address" "app" {
+  name = "${var.name}-lb-ip"
+}
+
+resource "google_compute_global_forwarding_rule" "http" {
+  name                  = "${var.name}-http"
+  target                = google_compute_target_http_proxy.app.id
+  ip_address            = google_compute_global_address.app.address
+  port_range            = "80"
+  load_balancing_scheme = "EXTERNAL"
+}
+
+# Load balancer proxies and health checks reach the app port from Google's ranges
+resource "google_compute_firewall" "lb" {
+  name    = "${var.name}-lb"
+  network = var.network
+
+  allow {
+    protocol = "tcp"
+    ports    = [tostring(var.app_port)]
+  }
+
+  source_ranges = ["130.211.0.0/22", "35.191.0.0/16"]
+  target_tags   = [var.name]
+}
+
+resource "google_compute_firewall" "ssh" {
+  name    = "${var.name}-ssh"
+  network = var.network
+
+  allow {
+    protocol = "tcp"
+    ports    = ["22"]
+  }
+
+  source_ranges = var.ssh_source_ranges
+  target_tags   = [var.name]
+}
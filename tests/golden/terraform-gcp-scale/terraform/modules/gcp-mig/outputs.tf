@@ -0,0 +1,9 @@
+output "load_balancer_ip" {
+  value       = google_compute_global_address.app.address
+  description = "Public IP of the HTTP load balancer"
+}
+
+output "instance_group" {
+  value       = google_compute_instance_group_manager.app.instance_group
+  description = "Managed instance group"
+}
@@ -0,0 +1,72 @@
+variable "project_id" {
+  description = "GCP project ID"
+  type        = string
+}
+
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "region" {
+  description = "GCP region"
+  type        = string
+  default     = "us-central1"
+}
+
+variable "zone" {
+  description = "GCP zone"
+  type        = string
+  default     = "us-central1-a"
+}
+
+variable "machine_type" {
+  description = "Compute Engine machine type (sized by EzOps: 2 vCPU / 1 GB, workload general)"
+  type        = string
+  default     = "e2-micro"
+}
+
+variable "app_port" {
+  description = "Port of the python app"
+  type        = number
+  default     = 8000
+}
+
+variable "ssh_source_ranges" {
+  description = "CIDR blocks allowed to SSH (restrict to your IP/VPN)"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "labels" {
+  description = "Labels applied to all resources"
+  type        = map(string)
+  default = {
+    managed_by = "ezops"
+    stack      = "python"
+  }
+}
+
+variable "min_size" {
+  description = "Minimum number of instances"
+  type        = number
+  default     = 1
+}
+
+variable "max_size" {
+  description = "Maximum number of instances"
+  type        = number
+  default     = 3
+}
+
+variable "cpu_target" {
+  description = "Average CPU utilization (%) the autoscaler keeps the group at"
+  type        = number
+  default     = 60
+
+  validation {
+    condition     = var.cpu_target > 0 && var.cpu_target <= 100
+    error_message = "cpu_target must be a percentage between 1 and 100."
+  }
+}
@@ -0,0 +1,9 @@
+output "public_ip" {
+  value       = module.app.public_ip
+  description = "Public IP of the Compute Engine instance"
+}
+
+output "machine_type" {
+  value       = var.machine_type
+  description = "Provisioned machine type"
+}
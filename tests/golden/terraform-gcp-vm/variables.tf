@@ -0,0 +1,49 @@
+variable "project_id" {
+  description = "GCP project ID"
+  type        = string
+}
+
+variable "name" {
+  description = "Name prefix for all resources"
+  type        = string
+  default     = "ezops-python"
+}
+
+variable "region" {
+  description = "GCP region"
+  type        = string
+  default     = "us-central1"
+}
+
+variable "zone" {
+  description = "GCP zone"
+  type        = string
+  default     = "us-central1-a"
+}
+
+variable "machine_type" {
+  description = "Compute Engine machine type (sized by EzOps: 2 vCPU / 1 GB, workload general)"
+  type        = string
+  default     = "e2-micro"
+}
+
+variable "app_port" {
+  description = "Port of the python app"
+  type        = number
+  default     = 8000
+}
+
+variable "ssh_source_ranges" {
+  description = "CIDR blocks allowed to SSH (restrict to your IP/VPN)"
+  type        = list(string)
+  default     = ["0.0.0.0/0"]
+}
+
+variable "labels" {
+  description = "Labels applied to all resources"
+  type        = map(string)
+  default = {
+    managed_by = "ezops"
+    stack      = "python"
+  }
+}
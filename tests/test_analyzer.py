@@ -1,7 +1,10 @@
 import pytest
 from pathlib import Path
-from ezops.analyzer.engine import analyze_directory
+from ezops.analyzer.engine import analyze_components, analyze_directory
 from ezops.analyzer.models import StackInfo
+from ezops.analyzer.scanner import scan_directory
+from ezops.analyzer.manifests import MAX_MANIFEST_BYTES, max_manifest_bytes, pyproject_names, requirements_txt_names
+from ezops.analyzer.monorepo import analyze_monorepo, discover_services
 
 def test_analyze_python_fastapi(tmp_path: Path):
     req_file = tmp_path / "requirements.txt"
@@ -42,3 +45,210 @@ def test_analyze_ruby(tmp_path: Path):
     stack = analyze_directory(str(tmp_path))
     assert stack.name == "ruby"
     assert stack.framework == "rails"
+
+def test_scan_directory_indexes_files_and_extensions(tmp_path: Path):
+    (tmp_path / "main.py").write_text("print('hi')")
+    (tmp_path / "utils.py").write_text("")
+    (tmp_path / "static").mkdir()
+
+    index = scan_directory(str(tmp_path))
+    assert index.has("main.py")
+    assert index.count(".py") == 2
+    assert "static" in index.dirs
+
+def test_scan_directory_missing_path(tmp_path: Path):
+    assert scan_directory(str(tmp_path / "nope")) is None
+    assert analyze_directory(str(tmp_path / "nope")) is None
+
+def test_discover_services_skips_ignored_dirs(tmp_path: Path):
+    (tmp_path / "services" / "api").mkdir(parents=True)
+    (tmp_path / "services" / "api" / "requirements.txt").write_text("flask\n")
+    (tmp_path / "services" / "web").mkdir(parents=True)
+    (tmp_path / "services" / "web" / "package.json").write_text('{"dependencies": {"next": "13"}}')
+    (tmp_path / "services" / "web" / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "services" / "web" / "node_modules" / "lib" / "package.json").write_text("{}")
+    (tmp_path / "docs").mkdir()
+
+    services = discover_services(str(tmp_path))
+    assert services == [tmp_path / "services" / "api", tmp_path / "services" / "web"]
+
+def test_discover_services_ignores_symlink_loops(tmp_path: Path):
+    api = tmp_path / "services" / "api"
+    api.mkdir(parents=True)
+    (api / "requirements.txt").write_text("flask\n")
+    (api / "up").symlink_to("..", target_is_directory=True)
+    (api / "root").symlink_to(tmp_path, target_is_directory=True)
+
+    assert discover_services(str(tmp_path)) == [api]
+
+def test_analyze_monorepo_returns_stack_per_service(tmp_path: Path):
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "requirements.txt").write_text("fastapi\n")
+    (tmp_path / "worker").mkdir()
+    (tmp_path / "worker" / "go.mod").write_text("module worker\ngo 1.21")
+
+    stacks = analyze_monorepo(str(tmp_path), max_workers=2)
+    assert stacks[str(tmp_path / "api")].framework == "fastapi"
+    assert stacks[str(tmp_path / "worker")].name == "go"
+    assert len(stacks) == 2
+
+def test_analyze_python_matches_dependency_names_not_substrings(tmp_path: Path):
+    (tmp_path / "requirements.txt").write_text("fastapi-utils==0.2.1\nFlask>=2.0  # web\n")
+    stack = analyze_directory(str(tmp_path))
+    assert stack.framework == "flask"
+    assert "app_module" not in stack.details
+
+def test_analyze_flask_app_module_from_entrypoint(tmp_path: Path):
+    (tmp_path / "requirements.txt").write_text("flask\n")
+    (tmp_path / "main.py").write_text("app = Flask(__name__)\n")
+    assert analyze_directory(str(tmp_path)).details["app_module"] == "main"
+    (tmp_path / "app.py").write_text("app = Flask(__name__)\n")
+    assert analyze_directory(str(tmp_path)).details["app_module"] == "app"
+
+def test_analyze_python_pyproject_dependencies(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "svc"\ndependencies = [\n    "Django>=4.2",\n    "psycopg[binary]",\n]\n'
+    )
+    assert analyze_directory(str(tmp_path)).framework == "django"
+
+def test_manifest_limit_env_is_read_lazily(tmp_path: Path, monkeypatch):
+    req = tmp_path / "requirements.txt"
+    req.write_text("requests\n" * 10 + "fastapi\n")
+    monkeypatch.setenv("EZOPS_MAX_MANIFEST_BYTES", "90")
+    assert "fastapi" not in requirements_txt_names(req)
+    # Valor inválido: usa o padrão em vez de quebrar o comando
+    monkeypatch.setenv("EZOPS_MAX_MANIFEST_BYTES", "8MB")
+    assert max_manifest_bytes() == MAX_MANIFEST_BYTES
+    assert "fastapi" in requirements_txt_names(req)
+
+def test_pyproject_extras_do_not_close_the_array(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "svc"\ndependencies = [\n    "uvicorn[standard]>=0.23",\n'
+        '    "fastapi",\n    "psycopg2-binary",\n]\n'
+    )
+    assert list(pyproject_names(tmp_path / "pyproject.toml")) == ["uvicorn", "fastapi", "psycopg2-binary"]
+    stack = analyze_directory(str(tmp_path))
+    assert stack.framework == "fastapi"
+    assert stack.has_db
+
+def test_pyproject_multiline_optional_dependencies(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "svc"\ndependencies = ["fastapi"]\n\n'
+        '[project.optional-dependencies]\ndb = [\n    "psycopg2-binary>=2.9",\n    "redis==5.0",\n]\n'
+    )
+    assert list(pyproject_names(tmp_path / "pyproject.toml")) == ["fastapi", "psycopg2-binary", "redis"]
+    stack = analyze_directory(str(tmp_path))
+    assert stack.has_db and stack.has_redis
+
+def test_analyze_java_gradle_spring_plugin(tmp_path: Path):
+    (tmp_path / "build.gradle").write_text("plugins {\n  id 'org.springframework.boot' version '3.1.0'\n}\n")
+    stack = analyze_directory(str(tmp_path))
+    assert stack.framework == "spring"
+    assert stack.details["build_tool"] == "gradle"
+    assert "gradle_dir" not in stack.details
+
+    # Version catalog em gradle/libs.versions.toml
+    (tmp_path / "gradle").mkdir()
+    assert analyze_directory(str(tmp_path)).details["gradle_dir"] is True
+
+def test_manifest_max_bytes_guard(tmp_path: Path):
+    req = tmp_path / "requirements.txt"
+    req.write_text("requests\n" * 1000 + "fastapi\n")
+    assert list(requirements_txt_names(req, max_bytes=90)) == ["requests"] * 10
+    assert "fastapi" in requirements_txt_names(req)
+
+def test_resolve_python_version_from_pyproject(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "svc"\nrequires-python = ">=3.11,<4"\n')
+    assert analyze_directory(str(tmp_path)).version == "3.11"
+
+    (tmp_path / ".python-version").write_text("3.12.1\n")
+    assert analyze_directory(str(tmp_path)).version == "3.12"
+
+def test_resolve_node_version_from_nvmrc_and_engines(tmp_path: Path):
+    (tmp_path / "package.json").write_text('{"engines": {"node": ">=20.5"}}')
+    assert analyze_directory(str(tmp_path)).version == "20"
+
+    (tmp_path / ".nvmrc").write_text("lts/iron\n")
+    assert analyze_directory(str(tmp_path)).version == "20"
+    (tmp_path / ".nvmrc").write_text("v22.3.0\n")
+    assert analyze_directory(str(tmp_path)).version == "22"
+
+def test_resolve_go_and_java_versions(tmp_path: Path):
+    (tmp_path / "go.mod").write_text("module example/app\n\ngo 1.22.3\n")
+    assert analyze_directory(str(tmp_path)).version == "1.22"
+
+    java = tmp_path / "java"
+    java.mkdir()
+    (java / "pom.xml").write_text("<project><properties>\n<java.version>1.8</java.version>\n</properties></project>")
+    assert analyze_directory(str(java)).version == "8"
+
+def test_resolve_ruby_version_defaults(tmp_path: Path):
+    (tmp_path / "Gemfile").write_text("source 'https://rubygems.org'\ngem 'sinatra'")
+    assert analyze_directory(str(tmp_path)).version == "3.2"
+    (tmp_path / ".ruby-version").write_text("ruby-3.3.0\n")
+    assert analyze_directory(str(tmp_path)).version == "3.3"
+
+def test_analyze_polyglot_django_with_asset_pipeline(tmp_path: Path):
+    (tmp_path / "requirements.txt").write_text("Django==4.2\npsycopg2-binary\ndjango-redis\n")
+    (tmp_path / "manage.py").write_text("")
+    (tmp_path / "package.json").write_text('{"devDependencies": {"webpack": "^5.0.0"}}')
+
+    stack = analyze_directory(str(tmp_path))
+    assert stack.name == "python"
+    assert stack.framework == "django"
+    assert stack.has_db and stack.has_redis
+    assert stack.details["db_engine"] == "postgres"
+    assert [c.name for c in stack.components] == ["node"]
+    assert stack.confidence > stack.components[0].confidence
+
+    ranked = analyze_components(str(tmp_path))
+    assert [c.name for c in ranked] == ["python", "node"]
+
+def test_analyze_backing_services_from_dependencies(tmp_path: Path):
+    (tmp_path / "go.mod").write_text(
+        "module svc\n\ngo 1.21\n\nrequire (\n\tgithub.com/jackc/pgx/v5 v5.4.0\n"
+        "\tgithub.com/redis/go-redis/v9 v9.0.5 // indirect\n)\n"
+    )
+    stack = analyze_directory(str(tmp_path))
+    assert stack.has_db and stack.has_redis
+
+    node = tmp_path / "node"
+    node.mkdir()
+    (node / "package.json").write_text('{"dependencies": {"express": "4", "mongoose": "7"}}')
+    stack = analyze_directory(str(node))
+    assert stack.details["db_engine"] == "mongodb"
+    assert not stack.has_redis
+
+def test_analyze_single_stack_has_full_confidence(tmp_path: Path):
+    (tmp_path / "Gemfile").write_text("gem 'sinatra'\n")
+    stack = analyze_directory(str(tmp_path))
+    assert stack.confidence == 1.0
+    assert stack.components == []
+
+def test_dockerignore_rules_and_context_estimate(tmp_path):
+    from ezops.analyzer.context import estimate_context, is_ignored, parse_dockerignore
+
+    rules = parse_dockerignore(["# comentário", "node_modules", "**/*.pyc", "docs/*", "!docs/README.md", "/build"])
+    assert is_ignored("node_modules/a/b.js", rules)
+    assert is_ignored("pkg/mod/x.pyc", rules)
+    assert is_ignored("docs/guide.md", rules)
+    assert not is_ignored("docs/README.md", rules)
+    assert is_ignored("build", rules)
+    assert not is_ignored("src/node_modules.py", rules)
+
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "big.js").write_text("x" * 1000)
+    (tmp_path / "app.py").write_text("y" * 10)
+    estimate = estimate_context(tmp_path, parse_dockerignore(["node_modules"]))
+    assert (estimate.total_bytes, estimate.total_files) == (1010, 2)
+    assert (estimate.sent_bytes, estimate.sent_files) == (10, 1)
+
+def test_django_wsgi_module_from_manage_py(tmp_path):
+    (tmp_path / "requirements.txt").write_text("Django>=4.2\n")
+    (tmp_path / "manage.py").write_text(
+        "import os\n"
+        "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')\n"
+    )
+    stack = analyze_directory(str(tmp_path))
+    assert stack.framework == "django"
+    assert stack.details["wsgi_module"] == "mysite.wsgi"
@@ -0,0 +1,45 @@
+import json
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+from ezops.batch import expand_paths, run_batch
+from ezops.main import app
+
+@pytest.fixture
+def repos(tmp_path: Path) -> Path:
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "requirements.txt").write_text("fastapi\n")
+    (tmp_path / "worker").mkdir()
+    (tmp_path / "worker" / "go.mod").write_text("module worker\n\ngo 1.21\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "README.md").write_text("")
+    return tmp_path
+
+def test_expand_paths_globs_and_file(repos: Path):
+    paths_file = repos / "paths.txt"
+    paths_file.write_text(f"# projetos\n{repos / 'api'}\n")
+    paths = expand_paths([str(repos / "*")], str(paths_file))
+    assert [Path(p).name for p in paths] == ["api", "docs", "worker"]
+
+def test_run_batch_reports_results_and_failures(repos: Path):
+    paths = [str(repos / "api"), str(repos / "worker"), str(repos / "docs")]
+    seen = []
+    report = run_batch(paths, iac=True, provider="nope", max_workers=2, on_result=seen.append)
+
+    assert report["total"] == 3 and len(seen) == 3
+    by_name = {Path(r["path"]).name: r for r in report["results"]}
+    assert by_name["docs"]["status"] == "skipped"
+    # Provider inválido: a geração do Terraform falha, mas o lote continua
+    assert by_name["api"]["status"] == "error"
+    assert "ValueError" in by_name["api"]["error"]
+    assert (repos / "api" / "Dockerfile").exists()
+
+def test_batch_command_writes_summary(repos: Path):
+    summary = repos / "summary.json"
+    result = CliRunner().invoke(app, ["batch", str(repos / "api"), str(repos / "worker"), "--summary", str(summary)])
+    assert result.exit_code == 0
+
+    report = json.loads(summary.read_text())
+    assert report["succeeded"] == 2
+    assert {r["stack"]["name"] for r in report["results"]} == {"python", "go"}
+    assert all(r["duration_s"] >= 0 for r in report["results"])
@@ -0,0 +1,54 @@
+import os
+import pytest
+from pathlib import Path
+from ezops.analyzer.engine import analyze_directory
+from ezops.analyzer.cache import AnalysisCache
+
+def test_cache_hit_on_unchanged_project(tmp_path: Path):
+    (tmp_path / "requirements.txt").write_text("fastapi\n")
+    cache_dir = tmp_path / ".ezops" / "cache"
+
+    cache = AnalysisCache(cache_dir)
+    first = analyze_directory(str(tmp_path), cache=cache)
+    cache.save()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cache = AnalysisCache(cache_dir)
+    second = analyze_directory(str(tmp_path), cache=cache)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert second == first
+
+def test_cache_invalidated_when_manifest_changes(tmp_path: Path):
+    req = tmp_path / "requirements.txt"
+    req.write_text("flask\n")
+    cache = AnalysisCache(tmp_path / "cache")
+    assert analyze_directory(str(tmp_path), cache=cache).framework == "flask"
+
+    req.write_text("django\n")
+    assert analyze_directory(str(tmp_path), cache=cache).framework == "django"
+    assert cache.misses == 2
+
+def test_cache_validates_touched_file_by_content(tmp_path: Path):
+    req = tmp_path / "requirements.txt"
+    req.write_text("flask\n")
+    cache = AnalysisCache(tmp_path / "cache")
+    analyze_directory(str(tmp_path), cache=cache)
+
+    # Simula um checkout novo: mesmo conteúdo, mtime diferente
+    st = req.stat()
+    os.utime(req, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert analyze_directory(str(tmp_path), cache=cache).framework == "flask"
+    assert cache.hits == 1
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    cache = AnalysisCache(tmp_path / "cache", max_entries=2)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "go.mod").write_text("module x")
+        analyze_directory(str(tmp_path / name), cache=cache)
+    cache.save()
+
+    cache = AnalysisCache(tmp_path / "cache", max_entries=2)
+    analyze_directory(str(tmp_path / "a"), cache=cache)
+    analyze_directory(str(tmp_path / "c"), cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+from ezops import timings
+from ezops.main import app
+
+# Orçamento de cold start para `import ezops.main` (ms), ajustável no CI
+STARTUP_BUDGET_MS = float(os.environ.get("EZOPS_STARTUP_BUDGET_MS", "300"))
+
+runner = CliRunner()
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+def test_main_import_is_lazy():
+    result = _python(
+        "import sys, ezops.main; "
+        "print(','.join(m for m in ('rich.console', 'ezops.analyzer', 'ezops.generator', 'ezops.commands.init') "
+        "if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+def test_main_cold_start_within_budget():
+    result = _python("import ezops.main", "-X", "importtime")
+    last = [line for line in result.stderr.splitlines() if line.startswith("import time:")][-1]
+    cumulative_us = int(last.split("|")[1])
+    assert last.rstrip().endswith("ezops.main")
+    assert cumulative_us / 1000 < STARTUP_BUDGET_MS
+
+def test_init_command_with_timings(tmp_path: Path, monkeypatch):
+    # --timings liga o profiling globalmente; o monkeypatch restaura ao final
+    monkeypatch.setattr(timings, "_enabled", False)
+    (tmp_path / "requirements.txt").write_text("fastapi\n")
+    result = runner.invoke(app, ["--timings", "init", str(tmp_path), "--no-cache"])
+    assert result.exit_code == 0
+    assert "uvicorn" in (tmp_path / "Dockerfile").read_text()
+    assert "análise" in result.output
+
+def test_init_command_unknown_stack(tmp_path: Path):
+    result = runner.invoke(app, ["init", str(tmp_path)])
+    assert result.exit_code == 1
+
+def test_analyze_cost_json(tmp_path: Path):
+    (tmp_path / "requirements.txt").write_text("flask\n")
+    (tmp_path / "app.py").write_text("print('ok')\n")
+    (tmp_path / "venv" / "lib").mkdir(parents=True)
+    (tmp_path / "venv" / "lib" / "big.so").write_bytes(b"\0" * 50_000)
+    (tmp_path / ".dockerignore").write_text("venv\n")
+
+    result = runner.invoke(app, ["analyze", str(tmp_path), "--cost", "--json", "--no-cache"])
+    assert result.exit_code == 0
+    report = json.loads(result.output)
+    context = report["cost"]["context"]
+    assert report["stack"]["name"] == "python"
+    assert context["total_bytes"] > 50_000 > context["sent_bytes"]
+    assert report["cost"]["dockerfile"] == "prévia (ezops init)"
+
+    layers = {layer["instruction"]: layer for layer in report["cost"]["layers"]}
+    assert layers["RUN pip install --no-cache-dir -r requirements.txt gunicorn"]["invalidated_by"] == ["base_image", "dependencies"]
+    assert "source" in layers["COPY --chown=appuser . ."]["invalidated_by"]
+    assert layers["COPY --chown=appuser . ."]["bytes"] == context["sent_bytes"]
+
+def test_analyze_context_gate(tmp_path: Path):
+    (tmp_path / "go.mod").write_text("module example.com/app\n\ngo 1.22\n")
+    (tmp_path / "data.bin").write_bytes(b"\0" * 2 * 1024 * 1024)
+
+    result = runner.invoke(app, ["analyze", str(tmp_path), "--max-context-mb", "1", "--json", "--no-cache"])
+    assert result.exit_code == 1
+    assert json.loads(result.output)["gate"]["passed"] is False
+
+@pytest.mark.parametrize("value, expected", [
+    ("1", True), ("yes", True), ("", False), ("0", False), ("false", False), ("No", False), (" FALSE ", False),
+])
+def test_import_profile_env_values(monkeypatch, value, expected):
+    monkeypatch.setenv("EZOPS_IMPORT_PROFILE", value)
+    assert timings._env_enabled() is expected
@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
-from ezops.generator.engine import generate_files
+from ezops.generator.engine import build_context, generate_files
+from ezops.generator.rendering import get_environment, render
 from ezops.analyzer.models import StackInfo
 
 def test_generate_python_fastapi(tmp_path: Path):
@@ -34,7 +35,7 @@ def test_generate_go(tmp_path: Path):
     
     dockerfile = tmp_path / "Dockerfile"
     assert "FROM golang:1.20-alpine AS builder" in dockerfile.read_text()
-    assert "go build -a -installsuffix cgo" in dockerfile.read_text()
+    assert "CGO_ENABLED=0 GOOS=linux go build -o main ." in dockerfile.read_text()
 
 def test_generate_ruby_rails(tmp_path: Path):
     stack = StackInfo(name="ruby", version="3.2", framework="rails")
@@ -53,3 +54,192 @@ def test_generate_java_gradle(tmp_path: Path):
     dockerfile = tmp_path / "Dockerfile"
     assert "FROM gradle:jdk17-alpine AS builder" in dockerfile.read_text()
     assert "gradle build --no-daemon" in dockerfile.read_text()
+    assert "COPY build.gradle* settings.gradle* gradle.properties* ./" in dockerfile.read_text()
+    assert "COPY gradle gradle" not in dockerfile.read_text()
+
+def test_generate_java_gradle_copies_version_catalog(tmp_path: Path):
+    stack = StackInfo(name="java", version="17", details={"build_tool": "gradle", "gradle_dir": True})
+    generate_files(str(tmp_path), stack)
+    dockerfile = (tmp_path / "Dockerfile").read_text()
+    # gradle/ entra na camada de dependências, antes do `gradle dependencies`
+    assert dockerfile.index("COPY gradle gradle") < dockerfile.index("gradle dependencies")
+
+def test_generate_polyglot_multi_stage(tmp_path: Path):
+    assets = StackInfo(name="node", version="20", confidence=0.3)
+    stack = StackInfo(name="python", version="3.11", framework="django", confidence=0.7, components=[assets])
+    generate_files(str(tmp_path), stack)
+
+    content = (tmp_path / "Dockerfile").read_text()
+    assert content.index("FROM node:20-alpine AS assets") < content.index("FROM python:3.11-slim")
+    assert content.index("COPY --chown=appuser --from=assets /app/dist ./dist") > content.index("FROM python:3.11-slim")
+
+def test_templates_are_compiled_once():
+    env = get_environment()
+    assert env.get_template("dockerfile/python.j2") is env.get_template("dockerfile/python.j2")
+
+def test_template_bytecode_disk_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("EZOPS_TEMPLATE_CACHE_DIR", str(tmp_path / "tpl-cache"))
+    get_environment.cache_clear()
+    try:
+        content = render("dockerfile/go.j2", version="1.22", port=8080, cmd=["./main"], assets=None)
+        assert "FROM golang:1.22-alpine AS builder" in content
+        assert any((tmp_path / "tpl-cache").iterdir())
+    finally:
+        get_environment.cache_clear()
+
+def test_framework_variants_are_declarative():
+    context = build_context(StackInfo(name="ruby", version="3.3", framework="rails"))
+    assert context["port"] == 3000
+    assert context["cmd"] == ["rails", "server", "-b", "0.0.0.0"]
+    assert build_context(StackInfo(name="ruby", version="3.3"))["port"] == 4567
+
+def test_regeneration_is_idempotent(tmp_path: Path):
+    stack = StackInfo(name="python", version="3.11", framework="fastapi")
+    assert len(generate_files(str(tmp_path), stack)) == 4
+    assert (tmp_path / ".ezops" / "manifest.json").exists()
+
+    # Mesmas entradas: nada é reescrito
+    assert generate_files(str(tmp_path), stack) == []
+
+    # Só a mudança de stack regenera os arquivos
+    written = generate_files(str(tmp_path), StackInfo(name="python", version="3.12", framework="fastapi"))
+    assert tmp_path / "Dockerfile" in written
+    assert "FROM python:3.12-slim" in (tmp_path / "Dockerfile").read_text()
+
+def test_user_edits_are_not_overwritten(tmp_path: Path):
+    stack = StackInfo(name="go", version="1.22")
+    generate_files(str(tmp_path), stack)
+    dockerfile = tmp_path / "Dockerfile"
+    dockerfile.write_text("FROM scratch\n")
+
+    new_stack = StackInfo(name="go", version="1.23")
+    assert dockerfile not in generate_files(str(tmp_path), new_stack)
+    assert generate_files(str(tmp_path), new_stack, diff=True) == []
+    assert dockerfile.read_text() == "FROM scratch\n"
+
+    assert dockerfile in generate_files(str(tmp_path), new_stack, force=True)
+    assert "FROM golang:1.23-alpine" in dockerfile.read_text()
+
+def test_existing_files_not_generated_by_ezops_are_skipped(tmp_path: Path):
+    (tmp_path / "Dockerfile").write_text("FROM custom\n")
+    written = generate_files(str(tmp_path), StackInfo(name="node", version="18"))
+    assert tmp_path / "Dockerfile" not in written and tmp_path / "docker-compose.yml" in written
+    assert (tmp_path / "Dockerfile").read_text() == "FROM custom\n"
+
+@pytest.mark.parametrize("stack, install, caches", [
+    (StackInfo(name="python", version="3.11"), "pip install -r requirements.txt", ["/root/.cache/pip"]),
+    (StackInfo(name="node", version="20"), "npm ci", ["/root/.npm"]),
+    (StackInfo(name="go", version="1.22"), "go mod download", ["/go/pkg/mod", "/root/.cache/go-build"]),
+    (StackInfo(name="java", version="17"), "mvn dependency:go-offline", ["/root/.m2"]),
+    (StackInfo(name="java", version="17", details={"build_tool": "gradle"}), "gradle dependencies", ["/home/gradle/.gradle"]),
+    (StackInfo(name="ruby", version="3.3"), "bundle install", ["/usr/local/bundle/cache"]),
+])
+def test_buildkit_layer_structure(tmp_path: Path, stack, install, caches):
+    generate_files(str(tmp_path), stack, buildkit=True)
+    lines = (tmp_path / "Dockerfile").read_text().splitlines()
+
+    assert lines[0] == "# syntax=docker/dockerfile:1"
+    for target in caches:
+        assert any(f"--mount=type=cache,target={target}" in line for line in lines)
+
+    # A camada de dependências vem antes da cópia do código-fonte
+    install_at = next(i for i, line in enumerate(lines) if install in line)
+    source_at = next(i for i, line in enumerate(lines) if line in ("COPY . .", "COPY --chown=appuser . .", "COPY src src", "COPY src ./src"))
+    assert lines[install_at].startswith("RUN --mount=type=cache")
+    assert all(line.startswith("COPY") for line in lines[install_at - 1:install_at])
+    assert install_at < source_at
+
+def test_classic_mode_has_no_buildkit_syntax(tmp_path: Path):
+    generate_files(str(tmp_path), StackInfo(name="python", version="3.11"))
+    content = (tmp_path / "Dockerfile").read_text()
+    assert "--mount" not in content and "# syntax" not in content
+    assert "pip install --no-cache-dir -r requirements.txt" in content
+
+def test_dockerignore_follows_the_scan(tmp_path: Path):
+    (tmp_path / "node_modules" / "left-pad").mkdir(parents=True)
+    (tmp_path / "node_modules" / "left-pad" / "index.js").write_text("x" * 4096)
+    (tmp_path / "server.js").write_text("console.log('ok')")
+    stack = StackInfo(name="python", version="3.11", components=[StackInfo(name="node", version="20")])
+    generate_files(str(tmp_path), stack)
+
+    patterns = (tmp_path / ".dockerignore").read_text().splitlines()
+    assert ".git" in patterns and "**/__pycache__" in patterns
+    assert "node_modules" in patterns
+    # Só entram os artefatos que existem no projeto
+    assert "venv" not in patterns and ".next" not in patterns
+
+def test_compose_adds_backing_services_with_healthchecks(tmp_path: Path):
+    yaml = pytest.importorskip("yaml")
+    stack = StackInfo(name="python", version="3.11", has_db=True, has_redis=True, details={"db_engine": "postgres"})
+    generate_files(str(tmp_path), stack)
+    compose = yaml.safe_load((tmp_path / "docker-compose.yml").read_text())
+
+    assert "version" not in compose
+    services = compose["services"]
+    assert set(services) == {"app", "app-dev", "db", "redis"}
+    assert services["app"]["depends_on"] == {
+        "db": {"condition": "service_healthy"},
+        "redis": {"condition": "service_healthy"},
+    }
+    assert services["app"]["environment"]["DATABASE_URL"].startswith("postgres://")
+    assert services["db"]["healthcheck"]["test"][0] == "CMD-SHELL"
+    assert services["app"]["deploy"]["resources"]["limits"]["memory"] == "512M"
+    assert "pgdata" in compose["volumes"]
+
+    # Produção sem bind mounts e sem profile: sobe com um `docker compose up` simples
+    assert "volumes" not in services["app"] and "profiles" not in services["app"]
+    assert services["app-dev"]["profiles"] == ["dev"]
+    assert ".:/app" in services["app-dev"]["volumes"]
+
+def test_compose_compiled_stack_has_no_dev_profile(tmp_path: Path):
+    generate_files(str(tmp_path), StackInfo(name="go", version="1.22"))
+    content = (tmp_path / "docker-compose.yml").read_text()
+    assert '"8080:8080"' in content
+    assert "NODE_ENV" not in content and ".:/app" not in content and "profiles" not in content
+
+def test_runtime_profile_tunes_the_entrypoint(tmp_path: Path):
+    stack = StackInfo(name="java", version="21")
+    generate_files(str(tmp_path), stack, profile="latency")
+
+    dockerfile = (tmp_path / "Dockerfile").read_text()
+    assert 'ENTRYPOINT ["/bin/sh", "/usr/local/bin/ezops-runtime.sh"]' in dockerfile
+    assert "ENV EZOPS_PROFILE=latency" in dockerfile
+
+    script = (tmp_path / "ezops-runtime.sh").read_text()
+    assert "-XX:MaxRAMPercentage" in script and "-XX:+UseZGC" in script
+    assert "-XX:+AutoCreateSharedArchive" in script
+    assert "AutoCreateSharedArchive" not in build_context(StackInfo(name="java", version="17"))["latency_gc"]
+
+def test_django_runs_on_gunicorn(tmp_path: Path):
+    stack = StackInfo(name="python", version="3.12", framework="django", details={"wsgi_module": "mysite.wsgi"})
+    generate_files(str(tmp_path), stack)
+    dockerfile = (tmp_path / "Dockerfile").read_text()
+    assert "pip install --no-cache-dir -r requirements.txt gunicorn" in dockerfile
+    assert '"gunicorn", "mysite.wsgi:application"' in dockerfile
+    assert "GUNICORN_CMD_ARGS" in (tmp_path / "ezops-runtime.sh").read_text()
+
+@pytest.mark.parametrize("details, module", [({}, "app"), ({"app_module": "main"}, "main")])
+def test_flask_gunicorn_module_follows_the_entrypoint(tmp_path: Path, details, module):
+    stack = StackInfo(name="python", version="3.12", framework="flask", details=details)
+    generate_files(str(tmp_path), stack)
+    assert f'"gunicorn", "{module}:app"' in (tmp_path / "Dockerfile").read_text()
+
+@pytest.mark.parametrize("stack, variable", [
+    (StackInfo(name="python", version="3.12", framework="fastapi"), "WEB_CONCURRENCY"),
+    (StackInfo(name="node", version="20"), "NODE_OPTIONS"),
+    (StackInfo(name="go", version="1.22"), "GOMAXPROCS"),
+    (StackInfo(name="ruby", version="3.3", framework="rails"), "RAILS_MAX_THREADS"),
+])
+def test_runtime_script_exports_tuned_settings(tmp_path: Path, stack, variable):
+    import shutil
+    import subprocess
+
+    if shutil.which("sh") is None:
+        pytest.skip("sh indisponível")
+    generate_files(str(tmp_path), stack, profile="memory")
+    env = {"PATH": "/usr/bin:/bin", "EZOPS_PROFILE": "memory"}
+    result = subprocess.run(
+        ["sh", str(tmp_path / "ezops-runtime.sh"), "printenv", variable],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    assert result.stdout.strip()
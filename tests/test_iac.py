@@ -0,0 +1,163 @@
+import os
+import shutil
+import pytest
+from pathlib import Path
+from ezops.generator.iac_generator import generate_terraform
+from ezops.generator.sizing import container_size, instance_size
+from ezops.analyzer.models import StackInfo
+
+@pytest.mark.parametrize("provider", ["aws", "gcp", "azure"])
+def test_terraform_emits_reusable_module(tmp_path: Path, provider):
+    stack = StackInfo(name="python", version="3.12")
+    generate_terraform(str(tmp_path), stack, provider)
+
+    module = tmp_path / "terraform" / "modules" / f"{provider}-vm"
+    for name in ("main.tf", "variables.tf", "outputs.tf"):
+        assert (tmp_path / name).exists()
+        assert (module / name).exists()
+    assert (tmp_path / "setup.sh").exists()
+
+    main_tf = (tmp_path / "main.tf").read_text()
+    assert f'source = "./terraform/modules/{provider}-vm"' in main_tf
+    # Nada de valores fixos no módulo: tudo vem de variáveis
+    module_tf = (module / "main.tf").read_text()
+    assert "8000" not in module_tf
+    assert "var.app_port" in module_tf
+
+def test_aws_resolves_ami_and_region_from_variables(tmp_path: Path):
+    stack = StackInfo(name="node", version="20")
+    generate_terraform(str(tmp_path), stack, "aws")
+
+    main_tf = (tmp_path / "main.tf").read_text()
+    assert "region = var.region" in main_tf
+    assert "ami-" not in main_tf
+    assert 'data "aws_ami" "ubuntu"' in (tmp_path / "terraform/modules/aws-vm/main.tf").read_text()
+
+def test_gcp_project_is_a_required_variable(tmp_path: Path):
+    stack = StackInfo(name="go", version="1.22")
+    generate_terraform(str(tmp_path), stack, "gcp")
+
+    variables = (tmp_path / "variables.tf").read_text()
+    project = variables.split('variable "project_id"', 1)[1].split("}", 1)[0]
+    assert "default" not in project
+
+@pytest.mark.parametrize("provider,stack,workload,expected", [
+    ("aws", "python", "general", "t3.micro"),
+    ("aws", "java", "general", "t3.medium"),
+    ("aws", "java", "memory", "r6i.large"),
+    ("aws", "go", "cpu", "c6i.large"),
+    ("gcp", "java", "general", "e2-medium"),
+    ("azure", "python", "general", "Standard_B1s"),
+])
+def test_instance_size_follows_stack_and_workload(provider, stack, workload, expected):
+    assert instance_size(provider, StackInfo(name=stack, version="1"), workload).instance_type == expected
+
+def test_workload_sizes_the_generated_variables(tmp_path: Path):
+    stack = StackInfo(name="java", version="21")
+    generate_terraform(str(tmp_path), stack, "aws", workload="memory")
+
+    assert 'default     = "r6i.large"' in (tmp_path / "variables.tf").read_text()
+
+def test_invalid_workload(tmp_path: Path):
+    with pytest.raises(ValueError):
+        generate_terraform(str(tmp_path), StackInfo(name="python", version="3.12"), "aws", workload="gpu")
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+def _generated_files(root: Path):
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and ".ezops" not in path.parts
+    }
+
+GOLDEN_MODES = {"vm": {}, "scale": {"scale": True, "bake": True}, "bake": {"bake": True}, "container": {"target": "container"}}
+
+@pytest.mark.parametrize("provider", ["aws", "gcp", "azure"])
+@pytest.mark.parametrize("mode", list(GOLDEN_MODES))
+def test_terraform_matches_golden_files(tmp_path: Path, provider, mode):
+    """Compara com tests/golden/; rode com EZOPS_UPDATE_GOLDEN=1 para regravar."""
+    stack = StackInfo(name="python", version="3.12", framework="fastapi")
+    generate_terraform(str(tmp_path), stack, provider, **GOLDEN_MODES[mode])
+    generated = _generated_files(tmp_path)
+
+    golden = GOLDEN_DIR / f"terraform-{provider}-{mode}"
+    if os.environ.get("EZOPS_UPDATE_GOLDEN"):
+        shutil.rmtree(golden, ignore_errors=True)
+        for name, content in generated.items():
+            (golden / name).parent.mkdir(parents=True, exist_ok=True)
+            (golden / name).write_text(content)
+
+    assert generated == _generated_files(golden)
+
+@pytest.mark.parametrize("provider,module", [("aws", "aws-asg"), ("gcp", "gcp-mig"), ("azure", "azure-vmss")])
+def test_scale_health_checks_target_the_app_port(tmp_path: Path, provider, module):
+    stack = StackInfo(name="node", version="20")
+    generate_terraform(str(tmp_path), stack, provider, workload="cpu", scale=True, bake=True)
+
+    variables = (tmp_path / "variables.tf").read_text()
+    assert "default     = 3000" in variables
+    assert "default     = 50" in variables  # CPU-bound escala mais cedo
+    module_tf = (tmp_path / "terraform" / "modules" / module / "main.tf").read_text()
+    assert "var.app_port" in module_tf
+    assert "var.cpu_target" in module_tf
+    assert not (tmp_path / "terraform" / "modules" / f"{provider}-vm").exists()
+
+@pytest.mark.parametrize("bake", [False, True])
+def test_setup_script_is_plain_bash(tmp_path: Path, bake):
+    # setup.sh roda como script (boot ou Packer), fora de heredoc: nada de \$ escapado
+    generate_terraform(str(tmp_path), StackInfo(name="node", version="20"), "aws", bake=bake)
+    setup = (tmp_path / "setup.sh").read_text()
+    assert "\\$(" not in setup
+    assert "$(lsb_release -cs)" in setup
+
+@pytest.mark.parametrize("provider", ["aws", "gcp", "azure"])
+def test_scale_requires_bake(tmp_path: Path, provider):
+    # Sem a imagem do Packer nada escutaria na porta do health check
+    with pytest.raises(ValueError, match="--bake"):
+        generate_terraform(str(tmp_path), StackInfo(name="node", version="20"), provider, scale=True)
+    assert not (tmp_path / "main.tf").exists()
+
+@pytest.mark.parametrize("provider", ["aws", "gcp", "azure"])
+def test_bake_boots_from_the_packer_image(tmp_path: Path, provider):
+    stack = StackInfo(name="ruby", version="3.3")
+    generate_terraform(str(tmp_path), stack, provider, scale=True, bake=True)
+
+    packer = (tmp_path / "packer" / "app.pkr.hcl").read_text()
+    assert "docker save ezops-app:latest" in packer
+    assert 'script = "${path.root}/../setup.sh"' in packer
+    # A porta do host é a do Terraform; a do container, a do Dockerfile gerado
+    assert "-p 3000:4567 ezops-app:latest" in (tmp_path / "packer" / "ezops-app.service").read_text()
+    # Sem instalação do Docker no boot
+    assert "setup.sh" not in (tmp_path / "main.tf").read_text()
+
+@pytest.mark.parametrize("provider,module,resource", [
+    ("aws", "aws-ecs", 'resource "aws_ecs_service" "app"'),
+    ("gcp", "gcp-cloudrun", 'resource "google_cloud_run_v2_service" "app"'),
+    ("azure", "azure-containerapp", 'resource "azurerm_container_app" "app"'),
+])
+def test_container_target_runs_the_generated_image(tmp_path: Path, provider, module, resource):
+    stack = StackInfo(name="ruby", version="3.3")
+    generate_terraform(str(tmp_path), stack, provider, target="container")
+
+    assert resource in (tmp_path / "terraform" / "modules" / module / "main.tf").read_text()
+    variables = (tmp_path / "variables.tf").read_text()
+    # A porta é a do container (Dockerfile gerado), não a da VM
+    assert "default     = 4567" in variables
+    assert 'variable "image"' in variables
+    assert not (tmp_path / "setup.sh").exists()
+
+@pytest.mark.parametrize("provider,stack,workload,expected", [
+    ("aws", "go", "general", (0.5, 1, 250, 1)),
+    ("gcp", "go", "general", (1, 1, 250, 0)),
+    ("gcp", "java", "general", (2, 4, 100, 1)),
+    ("azure", "python", "memory", (2, 4, 40, 0)),
+    ("gcp", "node", "cpu", (2, 4, 40, 0)),
+])
+def test_container_size_follows_stack_and_provider(provider, stack, workload, expected):
+    size = container_size(provider, StackInfo(name=stack, version="1"), workload)
+    assert (size.cpu, size.memory_gb, size.concurrency, size.min_instances) == expected
+
+def test_container_target_rejects_vm_options(tmp_path: Path):
+    with pytest.raises(ValueError):
+        generate_terraform(str(tmp_path), StackInfo(name="python", version="3.12"), "aws", scale=True, target="container")
@@ -0,0 +1,53 @@
+import sys
+import pytest
+from pathlib import Path
+from ezops.analyzer.registry import BUILTIN_DETECTORS, Detector, DetectorRegistry
+from ezops.analyzer.scanner import scan_directory
+
+RUST_DETECTOR = '''
+from ezops.analyzer.models import StackInfo
+
+def detect(index):
+    return StackInfo(name="rust", version="1.75")
+'''
+
+@pytest.fixture
+def rust_registry(tmp_path: Path, monkeypatch):
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    (plugin_dir / "ezops_rust_detector.py").write_text(RUST_DETECTOR)
+    monkeypatch.syspath_prepend(str(plugin_dir))
+    monkeypatch.delitem(sys.modules, "ezops_rust_detector", raising=False)
+
+    registry = DetectorRegistry(BUILTIN_DETECTORS, load_entry_points=False)
+    registry.register(Detector(
+        name="rust",
+        target="ezops_rust_detector:detect",
+        manifests=frozenset({"Cargo.toml"}),
+        priority=5,
+    ))
+    return registry
+
+def test_plugin_detector_is_loaded_lazily(tmp_path: Path, rust_registry):
+    project = tmp_path / "py"
+    project.mkdir()
+    (project / "requirements.txt").write_text("flask\n")
+
+    stack = rust_registry.detect(scan_directory(str(project)))
+    assert stack.name == "python"
+    assert "ezops_rust_detector" not in sys.modules
+
+    crate = tmp_path / "crate"
+    crate.mkdir()
+    (crate / "Cargo.toml").write_text("[package]\nname = \"svc\"\n")
+    assert rust_registry.detect(scan_directory(str(crate))).name == "rust"
+    assert "ezops_rust_detector" in sys.modules
+
+def test_candidates_follow_priority(tmp_path: Path, rust_registry):
+    (tmp_path / "Cargo.toml").write_text("")
+    (tmp_path / "main.go").write_text("package main")
+    (tmp_path / "build.py").write_text("")
+
+    names = [d.name for d in rust_registry.candidates(scan_directory(str(tmp_path)))]
+    assert names == ["rust", "python", "go"]
+    assert "Cargo.toml" in rust_registry.manifests()